@@ -10,6 +10,7 @@ from dataclasses import asdict
 from datetime import datetime, timedelta
 from enum import IntFlag
 from functools import partial
+from http import HTTPStatus
 import logging
 import os
 from random import SystemRandom
@@ -73,6 +74,7 @@ from .const import (  # noqa: F401
     CONF_LOOKBACK,
     DATA_CAMERA_PREFS,
     DATA_COMPONENT,
+    DATA_SCALED_IMAGES,
     DOMAIN,
     PREF_ORIENTATION,
     PREF_PRELOAD_STREAM,
@@ -81,7 +83,7 @@ from .const import (  # noqa: F401
     StreamType,
 )
 from .helper import get_camera_from_entity_id
-from .img_util import scale_jpeg_camera_image
+from .img_util import ScaledImageCache
 from .prefs import CameraPreferences, DynamicStreamSettings  # noqa: F401
 from .webrtc import (
     DATA_ICE_SERVERS,
@@ -143,6 +145,9 @@ _RND: Final = SystemRandom()
 
 MIN_STREAM_INTERVAL: Final = 0.5  # seconds
 
+# Limits the ETag of an image to the positive hashes
+ETAG_HASH_MASK: Final = (1 << 64) - 1
+
 CAMERA_SERVICE_SNAPSHOT: VolDictType = {vol.Required(ATTR_FILENAME): cv.template}
 
 CAMERA_SERVICE_PLAY_STREAM: VolDictType = {
@@ -210,7 +215,10 @@ async def _async_get_image(
                     assert width is not None
                     assert height is not None
                     return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
+                        content_type,
+                        await camera.hass.data[DATA_SCALED_IMAGES].async_scale(
+                            camera.entity_id, image, width, height
+                        ),
                     )
 
                 return image
@@ -337,6 +345,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     prefs = CameraPreferences(hass)
     await prefs.async_load()
     hass.data[DATA_CAMERA_PREFS] = prefs
+    hass.data[DATA_SCALED_IMAGES] = ScaledImageCache(hass)
 
     hass.http.register_view(CameraImageView(component))
     hass.http.register_view(CameraMjpegStream(component))
@@ -807,7 +816,15 @@ class CameraImageView(CameraView):
         except (HomeAssistantError, ValueError) as ex:
             raise web.HTTPInternalServerError from ex
 
-        return web.Response(body=image.content, content_type=image.content_type)
+        # The hash of bytes is cached, so repeated requests for a cached
+        # scaled image do not hash it again
+        etag = f"{hash(image.content) & ETAG_HASH_MASK:x}"
+        headers = {hdrs.ETAG: f'"{etag}"'}
+        if any(tag.value == etag for tag in request.if_none_match or ()):
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+        return web.Response(
+            body=image.content, content_type=image.content_type, headers=headers
+        )
 
 
 class CameraMjpegStream(CameraView):
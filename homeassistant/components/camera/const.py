@@ -18,12 +18,14 @@ if TYPE_CHECKING:
     from homeassistant.helpers.entity_component import EntityComponent
 
     from . import Camera
+    from .img_util import ScaledImageCache
     from .prefs import CameraPreferences
 
 DOMAIN: Final = "camera"
 DATA_COMPONENT: HassKey[EntityComponent[Camera]] = HassKey(DOMAIN)
 
 DATA_CAMERA_PREFS: HassKey[CameraPreferences] = HassKey("camera_prefs")
+DATA_SCALED_IMAGES: HassKey[ScaledImageCache] = HassKey("camera_scaled_images")
 
 PREF_PRELOAD_STREAM: Final = "preload_stream"
 PREF_ORIENTATION: Final = "orientation"
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 from contextlib import suppress
 import logging
 from typing import TYPE_CHECKING, Literal, cast
 
+from lru import LRU
+
+from homeassistant.core import HomeAssistant
+
 with suppress(Exception):
     # TurboJPEG imports numpy which may or may not work so
     # we have to guard the import here. We still want
@@ -23,6 +28,9 @@ _LOGGER = logging.getLogger(__name__)
 
 JPEG_QUALITY = 75
 
+# Number of scaled images to keep, one per camera and size
+SCALED_IMAGE_CACHE_SIZE = 64
+
 
 def find_supported_scaling_factor(
     current_width: int, current_height: int, target_width: int, target_height: int
@@ -77,6 +85,43 @@ def scale_jpeg_camera_image(cam_image: Image, width: int, height: int) -> bytes:
     )
 
 
+class ScaledImageCache:
+    """Cache the scaled images of cameras.
+
+    A scaled image is kept per camera and size together with the image it was
+    scaled from, and reused as long as the camera returns the same image.
+    Images are scaled in the executor, requests for the same image and size
+    arriving while it is scaled wait for the same result.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._images: LRU[tuple[str, int, int], tuple[bytes, asyncio.Future[bytes]]] = (
+            LRU(SCALED_IMAGE_CACHE_SIZE)
+        )
+
+    async def async_scale(
+        self, entity_id: str, cam_image: Image, width: int, height: int
+    ) -> bytes:
+        """Return a camera image scaled to the given size."""
+        key = (entity_id, width, height)
+        if (cached := self._images.get(key)) is None or cached[0] != cam_image.content:
+            cached = self._images[key] = (
+                cam_image.content,
+                self._hass.async_add_executor_job(
+                    scale_jpeg_camera_image, cam_image, width, height
+                ),
+            )
+        try:
+            # Shielded since other requests may be waiting for the same image
+            return await asyncio.shield(cached[1])
+        except Exception:
+            if self._images.get(key) is cached:
+                del self._images[key]
+            raise
+
+
 class TurboJPEGSingleton:
     """Load TurboJPEG only once.
 
@@ -53,6 +53,7 @@ from .const import (
 )
 from .entity import ConversationEntity
 from .models import ConversationInput, ConversationResult
+from .slot_index import IndexedTextSlotList, sentence_match_text, slot_match_text
 from .trace import ConversationTraceEventType, async_conversation_trace_append
 
 _LOGGER = logging.getLogger(__name__)
@@ -438,6 +439,21 @@ class DefaultAgent(ConversationEntity):
         language: str,
     ) -> RecognizeResult | None:
         """Search intents for a match to user input."""
+        # Only keep the slot list values that can occur in the sentence
+        match_text = sentence_match_text(
+            user_input.text,
+            lang_intents.intents.skip_words,
+            lang_intents.intents.settings.ignore_whitespace,
+        )
+        slot_lists = {
+            list_name: (
+                slot_list.matching(match_text)
+                if isinstance(slot_list, IndexedTextSlotList)
+                else slot_list
+            )
+            for list_name, slot_list in slot_lists.items()
+        }
+
         strict_result = self._recognize_strict(
             user_input, lang_intents, slot_lists, intent_context, language
         )
@@ -469,13 +485,16 @@ class DefaultAgent(ConversationEntity):
                 if entity.aliases:
                     # Also add aliases
                     for alias in entity.aliases:
-                        if not alias.strip():
+                        if not alias.strip() or (
+                            slot_match_text(alias) not in match_text
+                        ):
                             continue
 
                         all_entity_names.append((alias, alias, context))
 
             # Default name
-            all_entity_names.append((state.name, state.name, context))
+            if slot_match_text(state.name) in match_text:
+                all_entity_names.append((state.name, state.name, context))
 
         slot_lists = {
             **slot_lists,
@@ -984,11 +1003,11 @@ class DefaultAgent(ConversationEntity):
                 floor_names.append((alias, floor.name))
 
         self._slot_lists = {
-            "area": TextSlotList.from_tuples(area_names, allow_template=False),
-            "name": TextSlotList.from_tuples(
+            "area": IndexedTextSlotList.from_tuples(area_names, allow_template=False),
+            "name": IndexedTextSlotList.from_tuples(
                 exposed_entity_names, allow_template=False
             ),
-            "floor": TextSlotList.from_tuples(floor_names, allow_template=False),
+            "floor": IndexedTextSlotList.from_tuples(floor_names, allow_template=False),
         }
 
         self._listen_clear_slot_list()
@@ -0,0 +1,119 @@
+"""Narrow down slot lists to the values that can occur in a sentence."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+import re
+from typing import Any
+
+from hassil.expression import TextChunk
+from hassil.intents import TextSlotList, TextSlotValue
+from hassil.recognize import PUNCTUATION_STR
+from hassil.util import normalize_text, normalize_whitespace
+
+# Characters hassil skips or breaks words on when matching a slot value
+_IGNORED_CHARS = re.compile(rf"[\s{re.escape(PUNCTUATION_STR)}\-_]+")
+
+
+def slot_match_text(text: str) -> str:
+    """Return the text a slot value is matched on.
+
+    A slot value can only match a sentence if its match text occurs in the
+    match text of the sentence.
+    """
+    return _IGNORED_CHARS.sub("", normalize_text(text))
+
+
+def sentence_match_text(
+    sentence: str, skip_words: Iterable[str], ignore_whitespace: bool
+) -> str:
+    """Return the match text of a sentence with its skip words removed.
+
+    The skip words are removed the same way hassil removes them before
+    recognizing the sentence.
+    """
+    text = normalize_text(sentence).strip()
+    for skip_word in sorted(skip_words, key=len, reverse=True):
+        skip_word = normalize_text(skip_word)
+        if ignore_whitespace:
+            text = text.replace(skip_word, "")
+        else:
+            text = re.sub(rf"\b{re.escape(skip_word)}\b", "", text)
+    if not ignore_whitespace:
+        text = normalize_whitespace(text)
+    return slot_match_text(text)
+
+
+class _SlotNode:
+    """A character of the slot values in the trie."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _SlotNode] = {}
+        # Indexes of the values ending at this character
+        self.values: list[int] = []
+
+
+@dataclass
+class IndexedTextSlotList(TextSlotList):
+    """Text slot list with a trie of the match texts of its values.
+
+    Finding the values occurring in a sentence walks the trie from each
+    character of the sentence, the time taken depends on the length of the
+    sentence and not on the number of values.
+    """
+
+    _root: _SlotNode = field(
+        default_factory=_SlotNode, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Build the trie of the values."""
+        for idx, value in enumerate(self.values):
+            node = self._root
+            # Templates are always kept
+            if isinstance(value.text_in, TextChunk):
+                for char in slot_match_text(value.text_in.text):
+                    if (child := node.children.get(char)) is None:
+                        child = node.children[char] = _SlotNode()
+                    node = child
+            node.values.append(idx)
+
+    @classmethod
+    def from_tuples(  # type: ignore[override]
+        cls,
+        tuples: Iterable[tuple[str, Any] | tuple[str, Any, dict[str, Any]]],
+        allow_template: bool = True,
+        name: str | None = None,
+    ) -> IndexedTextSlotList:
+        """Construct an indexed text slot list from text/value pairs."""
+        return cls(
+            name=name,
+            values=[
+                TextSlotValue.from_tuple(value_tuple, allow_template)
+                for value_tuple in tuples
+            ],
+        )
+
+    def matching(self, match_text: str) -> TextSlotList:
+        """Return a slot list of the values occurring in a sentence.
+
+        The values keep their order so hassil yields the matches in the same
+        order as with the full list.
+        """
+        indexes: set[int] = set(self._root.values)
+        root_children = self._root.children
+        for start in range(len(match_text)):
+            children = root_children
+            for char in match_text[start:]:
+                if (node := children.get(char)) is None:
+                    break
+                indexes.update(node.values)
+                children = node.children
+        values = self.values
+        return TextSlotList(
+            name=self.name, values=[values[idx] for idx in sorted(indexes)]
+        )
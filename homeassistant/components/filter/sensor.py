@@ -17,6 +17,9 @@ import voluptuous as vol
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
 from homeassistant.components.input_number import DOMAIN as INPUT_NUMBER_DOMAIN
 from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.history.prefetch import (
+    async_state_changes_during_window,
+)
 from homeassistant.components.sensor import (
     ATTR_STATE_CLASS,
     DOMAIN as SENSOR_DOMAIN,
@@ -49,7 +52,6 @@ from homeassistant.helpers.reload import async_setup_reload_service
 from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, StateType
 from homeassistant.util.decorator import Registry
-import homeassistant.util.dt as dt_util
 
 from . import DOMAIN, PLATFORMS
 
@@ -331,23 +333,17 @@ class SensorFilter(SensorEntity):
                 if self._entity in filter_history:
                     history_list.extend(filter_history[self._entity])
             if largest_window_time > timedelta(seconds=0):
-                start = dt_util.utcnow() - largest_window_time
-                filter_history = await get_instance(self.hass).async_add_executor_job(
-                    partial(
-                        history.state_changes_during_period,
-                        self.hass,
-                        start,
-                        entity_id=self._entity,
-                    )
+                # The filters of all sensors starting up together with the same
+                # window are loaded with one query
+                history_list.extend(
+                    [
+                        state
+                        for state in await async_state_changes_during_window(
+                            self.hass, self._entity, largest_window_time
+                        )
+                        if state not in history_list
+                    ]
                 )
-                if self._entity in filter_history:
-                    history_list.extend(
-                        [
-                            state
-                            for state in filter_history[self._entity]
-                            if state not in history_list
-                        ]
-                    )
 
             # Sort the window states
             history_list = sorted(history_list, key=lambda s: s.last_updated)
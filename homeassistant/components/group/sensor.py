@@ -6,7 +6,7 @@ from collections.abc import Callable
 from datetime import datetime
 import logging
 import statistics
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
 import voluptuous as vol
 
@@ -58,7 +58,8 @@ from homeassistant.helpers.issue_registry import (
     async_create_issue,
     async_delete_issue,
 )
-from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, StateType
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.util.aggregation import NumericAggregate
 
 from .const import CONF_IGNORE_NON_NUMERIC, DOMAIN as GROUP_DOMAIN
 from .entity import GroupEntity
@@ -181,65 +182,45 @@ def async_create_preview_sensor(
 
 
 def calc_min(
-    sensor_values: list[tuple[str, float, State]],
+    aggregate: NumericAggregate, states: dict[str, State]
 ) -> tuple[dict[str, str | None], float | None]:
     """Calculate min value."""
-    val: float | None = None
-    entity_id: str | None = None
-    for sensor_id, sensor_value, _ in sensor_values:
-        if val is None or val > sensor_value:
-            entity_id, val = sensor_id, sensor_value
-
-    attributes = {ATTR_MIN_ENTITY_ID: entity_id}
-    if TYPE_CHECKING:
-        assert val is not None
-    return attributes, val
+    entity_id, val = aggregate.min or (None, None)
+    return {ATTR_MIN_ENTITY_ID: entity_id}, val
 
 
 def calc_max(
-    sensor_values: list[tuple[str, float, State]],
+    aggregate: NumericAggregate, states: dict[str, State]
 ) -> tuple[dict[str, str | None], float | None]:
     """Calculate max value."""
-    val: float | None = None
-    entity_id: str | None = None
-    for sensor_id, sensor_value, _ in sensor_values:
-        if val is None or val < sensor_value:
-            entity_id, val = sensor_id, sensor_value
-
-    attributes = {ATTR_MAX_ENTITY_ID: entity_id}
-    if TYPE_CHECKING:
-        assert val is not None
-    return attributes, val
+    entity_id, val = aggregate.max or (None, None)
+    return {ATTR_MAX_ENTITY_ID: entity_id}, val
 
 
 def calc_mean(
-    sensor_values: list[tuple[str, float, State]],
+    aggregate: NumericAggregate, states: dict[str, State]
 ) -> tuple[dict[str, str | None], float | None]:
     """Calculate mean value."""
-    result = (sensor_value for _, sensor_value, _ in sensor_values)
-
-    value: float = statistics.mean(result)
-    return {}, value
+    return {}, aggregate.mean
 
 
 def calc_median(
-    sensor_values: list[tuple[str, float, State]],
+    aggregate: NumericAggregate, states: dict[str, State]
 ) -> tuple[dict[str, str | None], float | None]:
     """Calculate median value."""
-    result = (sensor_value for _, sensor_value, _ in sensor_values)
-
-    value: float = statistics.median(result)
-    return {}, value
+    return {}, aggregate.median
 
 
 def calc_last(
-    sensor_values: list[tuple[str, float, State]],
+    aggregate: NumericAggregate, states: dict[str, State]
 ) -> tuple[dict[str, str | None], float | None]:
     """Calculate last value."""
     last_updated: datetime | None = None
     last_entity_id: str | None = None
     last: float | None = None
-    for entity_id, state_f, state in sensor_values:
+    for entity_id, state in states.items():
+        if (state_f := aggregate.get(entity_id)) is None:
+            continue
         if last_updated is None or state.last_updated > last_updated:
             last_updated = state.last_updated
             last = state_f
@@ -250,43 +231,33 @@ def calc_last(
 
 
 def calc_range(
-    sensor_values: list[tuple[str, float, State]],
-) -> tuple[dict[str, str | None], float]:
+    aggregate: NumericAggregate, states: dict[str, State]
+) -> tuple[dict[str, str | None], float | None]:
     """Calculate range value."""
-    max_result = max((sensor_value for _, sensor_value, _ in sensor_values))
-    min_result = min((sensor_value for _, sensor_value, _ in sensor_values))
-
-    value: float = max_result - min_result
-    return {}, value
+    return {}, aggregate.range
 
 
 def calc_stdev(
-    sensor_values: list[tuple[str, float, State]],
+    aggregate: NumericAggregate, states: dict[str, State]
 ) -> tuple[dict[str, str | None], float]:
     """Calculate standard deviation value."""
-    result = (sensor_value for _, sensor_value, _ in sensor_values)
-
-    value: float = statistics.stdev(result)
+    value: float = statistics.stdev(aggregate.values())
     return {}, value
 
 
 def calc_sum(
-    sensor_values: list[tuple[str, float, State]],
+    aggregate: NumericAggregate, states: dict[str, State]
 ) -> tuple[dict[str, str | None], float]:
     """Calculate a sum of values."""
-    result = 0.0
-    for _, sensor_value, _ in sensor_values:
-        result += sensor_value
-
-    return {}, result
+    return {}, aggregate.sum
 
 
 def calc_product(
-    sensor_values: list[tuple[str, float, State]],
+    aggregate: NumericAggregate, states: dict[str, State]
 ) -> tuple[dict[str, str | None], float]:
     """Calculate a product of values."""
     result = 1.0
-    for _, sensor_value, _ in sensor_values:
+    for sensor_value in aggregate.values():
         result *= sensor_value
 
     return {}, result
@@ -295,7 +266,8 @@ def calc_product(
 CALC_TYPES: dict[
     str,
     Callable[
-        [list[tuple[str, float, State]]], tuple[dict[str, str | None], float | None]
+        [NumericAggregate, dict[str, State]],
+        tuple[dict[str, str | None], float | None],
     ],
 ] = {
     "min": calc_min,
@@ -344,13 +316,17 @@ class SensorGroup(GroupEntity, SensorEntity):
         self._attr_extra_state_attributes = {ATTR_ENTITY_ID: entity_ids}
         self._attr_unique_id = unique_id
         self._ignore_non_numeric = ignore_non_numeric
-        self.mode = all if ignore_non_numeric is False else any
         self._state_calc: Callable[
-            [list[tuple[str, float, State]]],
+            [NumericAggregate, dict[str, State]],
             tuple[dict[str, str | None], float | None],
         ] = CALC_TYPES[self._sensor_type]
         self._state_incorrect: set[str] = set()
         self._extra_state_attribute: dict[str, Any] = {}
+        # The last seen state of each member, members are only parsed
+        # again when their state changes.
+        self._member_states: dict[str, State] = {}
+        self._known_members: set[str] = set()
+        self._aggregate = NumericAggregate(entity_ids)
 
     async def async_added_to_hass(self) -> None:
         """When added to hass."""
@@ -380,80 +356,37 @@ class SensorGroup(GroupEntity, SensorEntity):
             self._native_unit_of_measurement
         )
         self._valid_units = self._get_valid_units()
+        # Parse all members again with the new units
+        self._member_states.clear()
+        self._known_members.clear()
+        self._aggregate.clear()
 
     @callback
     def async_update_group_state(self) -> None:
-        """Query all members and determine the sensor group state."""
-        states: list[StateType] = []
-        valid_states: list[bool] = []
-        sensor_values: list[tuple[str, float, State]] = []
+        """Query all members and determine the sensor group state.
+
+        Only members with a new state are parsed and updated in the
+        aggregate, the aggregate is not calculated from all members.
+        """
+        states = self.hass.states
+        member_states = self._member_states
         for entity_id in self._entity_ids:
-            if (state := self.hass.states.get(entity_id)) is not None:
-                states.append(state.state)
-                try:
-                    numeric_state = float(state.state)
-                    if (
-                        self._valid_units
-                        and (uom := state.attributes["unit_of_measurement"])
-                        in self._valid_units
-                        and self._can_convert is True
-                    ):
-                        numeric_state = UNIT_CONVERTERS[self.device_class].convert(
-                            numeric_state, uom, self.native_unit_of_measurement
-                        )
-                    if (
-                        self._valid_units
-                        and (uom := state.attributes["unit_of_measurement"])
-                        not in self._valid_units
-                    ):
-                        raise HomeAssistantError("Not a valid unit")  # noqa: TRY301
-
-                    sensor_values.append((entity_id, numeric_state, state))
-                    if entity_id in self._state_incorrect:
-                        self._state_incorrect.remove(entity_id)
-                    valid_states.append(True)
-                except ValueError:
-                    valid_states.append(False)
-                    # Log invalid states unless ignoring non numeric values
-                    if (
-                        not self._ignore_non_numeric
-                        and entity_id not in self._state_incorrect
-                    ):
-                        self._state_incorrect.add(entity_id)
-                        _LOGGER.warning(
-                            "Unable to use state. Only numerical states are supported,"
-                            " entity %s with value %s excluded from calculation in %s",
-                            entity_id,
-                            state.state,
-                            self.entity_id,
-                        )
-                    continue
-                except (KeyError, HomeAssistantError):
-                    # This exception handling can be simplified
-                    # once sensor entity doesn't allow incorrect unit of measurement
-                    # with a device class, implementation see PR #107639
-                    valid_states.append(False)
-                    if entity_id not in self._state_incorrect:
-                        self._state_incorrect.add(entity_id)
-                        _LOGGER.warning(
-                            "Unable to use state. Only entities with correct unit of measurement"
-                            " is supported,"
-                            " entity %s, value %s with device class %s"
-                            " and unit of measurement %s excluded from calculation in %s",
-                            entity_id,
-                            state.state,
-                            self.device_class,
-                            state.attributes.get("unit_of_measurement"),
-                            self.entity_id,
-                        )
+            if (state := states.get(entity_id)) is not member_states.get(entity_id):
+                self._async_update_member(entity_id, state)
+
+        members = len(member_states)
+        known = len(self._known_members)
+        numeric = len(self._aggregate)
 
         # Set group as unavailable if all members do not have numeric values
-        self._attr_available = any(numeric_state for numeric_state in valid_states)
+        self._attr_available = numeric > 0
 
-        valid_state = self.mode(
-            state not in (STATE_UNKNOWN, STATE_UNAVAILABLE) for state in states
-        )
-        valid_state_numeric = self.mode(numeric_state for numeric_state in valid_states)
+        if self._ignore_non_numeric:
+            valid_state = known > 0
+            valid_state_numeric = numeric > 0
+        else:
+            valid_state = known == members
+            valid_state_numeric = numeric == members
 
         if not valid_state or not valid_state_numeric:
             self._attr_native_value = None
@@ -461,9 +394,70 @@ class SensorGroup(GroupEntity, SensorEntity):
 
         # Calculate values
         self._extra_state_attribute, self._attr_native_value = self._state_calc(
-            sensor_values
+            self._aggregate, member_states
         )
 
+    @callback
+    def _async_update_member(self, entity_id: str, state: State | None) -> None:
+        """Parse the new state of a member and update the aggregate."""
+        self._known_members.discard(entity_id)
+        self._aggregate.discard(entity_id)
+        if state is None:
+            del self._member_states[entity_id]
+            return
+        self._member_states[entity_id] = state
+        if state.state not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+            self._known_members.add(entity_id)
+        try:
+            numeric_state = float(state.state)
+            if (
+                self._valid_units
+                and (uom := state.attributes["unit_of_measurement"])
+                in self._valid_units
+                and self._can_convert is True
+            ):
+                numeric_state = UNIT_CONVERTERS[self.device_class].convert(
+                    numeric_state, uom, self.native_unit_of_measurement
+                )
+            if (
+                self._valid_units
+                and (uom := state.attributes["unit_of_measurement"])
+                not in self._valid_units
+            ):
+                raise HomeAssistantError("Not a valid unit")  # noqa: TRY301
+
+            self._aggregate.set(entity_id, numeric_state)
+            if entity_id in self._state_incorrect:
+                self._state_incorrect.remove(entity_id)
+        except ValueError:
+            # Log invalid states unless ignoring non numeric values
+            if not self._ignore_non_numeric and entity_id not in self._state_incorrect:
+                self._state_incorrect.add(entity_id)
+                _LOGGER.warning(
+                    "Unable to use state. Only numerical states are supported,"
+                    " entity %s with value %s excluded from calculation in %s",
+                    entity_id,
+                    state.state,
+                    self.entity_id,
+                )
+        except (KeyError, HomeAssistantError):
+            # This exception handling can be simplified
+            # once sensor entity doesn't allow incorrect unit of measurement
+            # with a device class, implementation see PR #107639
+            if entity_id not in self._state_incorrect:
+                self._state_incorrect.add(entity_id)
+                _LOGGER.warning(
+                    "Unable to use state. Only entities with correct unit of measurement"
+                    " is supported,"
+                    " entity %s, value %s with device class %s"
+                    " and unit of measurement %s excluded from calculation in %s",
+                    entity_id,
+                    state.state,
+                    self.device_class,
+                    state.attributes.get("unit_of_measurement"),
+                    self.entity_id,
+                )
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes of the sensor."""
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 from datetime import timedelta
 import logging
+from typing import Any
 
 import voluptuous as vol
 
@@ -31,6 +32,7 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.hass_dict import HassKey
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -69,6 +71,206 @@ TRIGGER_ATTRIBUTE_SCHEMA = BASE_SCHEMA.extend(
 )
 
 
+DATA_STATE_TRIGGER_INDEX: HassKey[StateTriggerIndex] = HassKey("state_trigger_index")
+
+type _StateTriggerAction = Callable[[Event[EventStateChangedData], Any, Any], None]
+
+
+class _StateMatcher:
+    """Match state changes of an entity for triggers with the same configuration."""
+
+    __slots__ = (
+        "attribute",
+        "match_from_state",
+        "match_to_state",
+        "match_all",
+        "listeners",
+        "rejected",
+    )
+
+    def __init__(
+        self,
+        attribute: str | None,
+        match_from_state: Callable[[str | None], bool],
+        match_to_state: Callable[[str | None], bool],
+        match_all: bool,
+    ) -> None:
+        """Initialize the matcher."""
+        self.attribute = attribute
+        self.match_from_state = match_from_state
+        self.match_to_state = match_to_state
+        self.match_all = match_all
+        self.listeners: list[_StateTriggerListener] = []
+        self.rejected = 0
+
+    @callback
+    def async_match(
+        self, event: Event[EventStateChangedData]
+    ) -> tuple[Any, Any] | None:
+        """Return the old and new value if the state change matches."""
+        from_s = event.data["old_state"]
+        to_s = event.data["new_state"]
+        attribute = self.attribute
+
+        if from_s is None:
+            old_value = None
+        elif attribute is None:
+            old_value = from_s.state
+        else:
+            old_value = from_s.attributes.get(attribute)
+
+        if to_s is None:
+            new_value = None
+        elif attribute is None:
+            new_value = to_s.state
+        else:
+            new_value = to_s.attributes.get(attribute)
+
+        # When we listen for state changes with `match_all`, we
+        # will trigger even if just an attribute changes. When
+        # we listen to just an attribute, we should ignore all
+        # other attribute changes.
+        if attribute is not None and old_value == new_value:
+            return None
+
+        if (
+            not self.match_from_state(old_value)
+            or not self.match_to_state(new_value)
+            or (not self.match_all and old_value == new_value)
+        ):
+            return None
+
+        return old_value, new_value
+
+
+class _StateTriggerListener:
+    """A state trigger attached to the index."""
+
+    __slots__ = ("name", "action", "fired", "_rejected_since")
+
+    def __init__(self, name: str, action: _StateTriggerAction) -> None:
+        """Initialize the listener."""
+        self.name = name
+        self.action = action
+        self.fired = 0
+        # Number of rejections of each matcher when the listener was added
+        self._rejected_since: dict[_StateMatcher, int] = {}
+
+    def add_matcher(self, matcher: _StateMatcher) -> None:
+        """Start listening to state changes matched by a matcher."""
+        matcher.listeners.append(self)
+        self._rejected_since[matcher] = matcher.rejected
+
+    @property
+    def rejected(self) -> int:
+        """Return the number of state changes which did not match."""
+        return sum(
+            matcher.rejected - rejected_since
+            for matcher, rejected_since in self._rejected_since.items()
+        )
+
+
+class StateTriggerIndex:
+    """Index of state triggers by entity ID and match configuration.
+
+    State triggers with the same entity, attribute, from and to configuration
+    share a matcher, so each state change is matched once per distinct
+    configuration instead of once per trigger.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self._matchers: dict[str, dict[Hashable, _StateMatcher]] = {}
+        self._unsub_track: dict[str, CALLBACK_TYPE] = {}
+        self._listeners: set[_StateTriggerListener] = set()
+
+    @callback
+    def async_add_listener(
+        self,
+        entity_ids: list[str],
+        match_key: Hashable,
+        matcher_factory: Callable[[], _StateMatcher],
+        listener: _StateTriggerListener,
+    ) -> CALLBACK_TYPE:
+        """Add a listener for state changes of entities matching the key."""
+        matchers: list[_StateMatcher] = []
+        for entity_id in entity_ids:
+            entity_matchers = self._matchers.setdefault(entity_id, {})
+            if (matcher := entity_matchers.get(match_key)) is None:
+                matcher = entity_matchers[match_key] = matcher_factory()
+            if entity_id not in self._unsub_track:
+                self._unsub_track[entity_id] = async_track_state_change_event(
+                    self.hass, entity_id, self._async_state_changed
+                )
+            listener.add_matcher(matcher)
+            matchers.append(matcher)
+        self._listeners.add(listener)
+
+        @callback
+        def async_remove_listener() -> None:
+            """Remove the listener."""
+            self._listeners.discard(listener)
+            for entity_id, matcher in zip(entity_ids, matchers, strict=True):
+                matcher.listeners.remove(listener)
+                if matcher.listeners:
+                    continue
+                entity_matchers = self._matchers[entity_id]
+                del entity_matchers[match_key]
+                if not entity_matchers:
+                    del self._matchers[entity_id]
+                    self._unsub_track.pop(entity_id)()
+
+        return async_remove_listener
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Match a state change once per configuration and dispatch it."""
+        if not (matchers := self._matchers.get(event.data["entity_id"])):
+            return
+        for matcher in list(matchers.values()):
+            if (values := matcher.async_match(event)) is None:
+                matcher.rejected += 1
+                continue
+            for listener in matcher.listeners.copy():
+                listener.fired += 1
+                try:
+                    listener.action(event, *values)
+                except Exception:
+                    _LOGGER.exception(
+                        "Error while dispatching state change of %s to %s",
+                        event.data["entity_id"],
+                        listener.name,
+                    )
+
+    @callback
+    def async_get_stats(self) -> dict[str, dict[str, int]]:
+        """Return fired and rejected evaluations per trigger name."""
+        stats: dict[str, dict[str, int]] = {}
+        for listener in self._listeners:
+            trigger_stats = stats.setdefault(listener.name, {"fired": 0, "rejected": 0})
+            trigger_stats["fired"] += listener.fired
+            trigger_stats["rejected"] += listener.rejected
+        return stats
+
+
+@callback
+def async_get_state_trigger_index(hass: HomeAssistant) -> StateTriggerIndex:
+    """Return the state trigger index."""
+    if (index := hass.data.get(DATA_STATE_TRIGGER_INDEX)) is None:
+        index = hass.data[DATA_STATE_TRIGGER_INDEX] = StateTriggerIndex(hass)
+    return index
+
+
+def _freeze_match(value: Any) -> Hashable:
+    """Return a hashable version of a from or to configuration."""
+    if isinstance(value, list):
+        return tuple(_freeze_match(item) for item in value)
+    if not isinstance(value, Hashable):
+        raise TypeError(f"unhashable type: '{type(value).__name__}'")
+    return value
+
+
 async def async_validate_trigger_config(
     hass: HomeAssistant, config: ConfigType
 ) -> ConfigType:
@@ -131,40 +333,16 @@ async def async_attach_trigger(
     _variables = trigger_info["variables"] or {}
 
     @callback
-    def state_automation_listener(event: Event[EventStateChangedData]) -> None:
-        """Listen for state changes and calls action."""
+    def state_automation_listener(
+        event: Event[EventStateChangedData],
+        old_value: str | None,
+        new_value: str | None,
+    ) -> None:
+        """Listen for matching state changes and calls action."""
         entity = event.data["entity_id"]
         from_s = event.data["old_state"]
         to_s = event.data["new_state"]
 
-        if from_s is None:
-            old_value = None
-        elif attribute is None:
-            old_value = from_s.state
-        else:
-            old_value = from_s.attributes.get(attribute)
-
-        if to_s is None:
-            new_value = None
-        elif attribute is None:
-            new_value = to_s.state
-        else:
-            new_value = to_s.attributes.get(attribute)
-
-        # When we listen for state changes with `match_all`, we
-        # will trigger even if just an attribute changes. When
-        # we listen to just an attribute, we should ignore all
-        # other attribute changes.
-        if attribute is not None and old_value == new_value:
-            return
-
-        if (
-            not match_from_state(old_value)
-            or not match_to_state(new_value)
-            or (not match_all and old_value == new_value)
-        ):
-            return
-
         @callback
         def call_action() -> None:
             """Call action with right context."""
@@ -232,7 +410,27 @@ async def async_attach_trigger(
             entity_ids=entity,
         )
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    try:
+        match_key: Hashable = (
+            attribute,
+            match_all,
+            *(
+                (key, _freeze_match(config[key]))
+                for key in (CONF_FROM, CONF_NOT_FROM, CONF_TO, CONF_NOT_TO)
+                if key in config
+            ),
+        )
+        hash(match_key)
+    except TypeError:
+        # Unhashable configuration, don't share the matcher
+        match_key = object()
+
+    unsub = async_get_state_trigger_index(hass).async_add_listener(
+        [entity_id.lower() for entity_id in cv.ensure_list(entity_ids)],
+        match_key,
+        lambda: _StateMatcher(attribute, match_from_state, match_to_state, match_all),
+        _StateTriggerListener(trigger_info["name"], state_automation_listener),
+    )
 
     @callback
     def async_remove() -> None:
@@ -83,6 +83,7 @@ from .models import (
     PublishPayloadType,
     ReceiveMessage,
 )
+from .topic_trie import TopicTrie
 from .util import EnsureJobAfterCooldown, get_file_path, mqtt_config_entry_enabled
 
 if TYPE_CHECKING:
@@ -267,7 +268,6 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
@@ -377,6 +377,7 @@ class MQTT:
             set
         )
         self._wildcard_subscriptions: set[Subscription] = set()
+        self._wildcard_subscriptions_trie: TopicTrie[Subscription] = TopicTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -755,6 +756,7 @@ class MQTT:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
             self._wildcard_subscriptions.add(subscription)
+            self._wildcard_subscriptions_trie.add(subscription.topic, subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
@@ -773,6 +775,7 @@ class MQTT:
                     del simple_subscriptions[topic]
             else:
                 self._wildcard_subscriptions.remove(subscription)
+                self._wildcard_subscriptions_trie.remove(topic, subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError("Can't remove subscription twice") from exc
 
@@ -835,9 +838,8 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
 
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, is_simple_match, job, qos, encoding)
         self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
 
@@ -1049,13 +1051,7 @@ class MQTT:
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        subscriptions.extend(self._wildcard_subscriptions_trie.match(topic))
         return subscriptions
 
     @callback
@@ -1085,7 +1081,12 @@ class MQTT:
             msg.payload[0:8192],
         )
         subscriptions = self._matching_subscriptions(topic)
-        msg_cache_by_subscription_topic: dict[str, ReceiveMessage] = {}
+        # The payload is decoded once per encoding and one message is created
+        # per subscribed topic and encoding, shared by all their subscribers
+        payload_by_encoding: dict[str, str | None] = {}
+        msg_cache_by_subscription_topic: dict[
+            tuple[str, str | None], ReceiveMessage
+        ] = {}
 
         for subscription in subscriptions:
             if msg.retain:
@@ -1097,20 +1098,27 @@ class MQTT:
                 self._retained_topics[subscription].add(topic)
 
             payload: SubscribePayloadType = msg.payload
-            if subscription.encoding is not None:
-                try:
-                    payload = msg.payload.decode(subscription.encoding)
-                except (AttributeError, UnicodeDecodeError):
+            if (encoding := subscription.encoding) is not None:
+                if encoding in payload_by_encoding:
+                    decoded_payload = payload_by_encoding[encoding]
+                else:
+                    try:
+                        decoded_payload = msg.payload.decode(encoding)
+                    except (AttributeError, UnicodeDecodeError):
+                        decoded_payload = None
+                    payload_by_encoding[encoding] = decoded_payload
+                if decoded_payload is None:
                     _LOGGER.warning(
                         "Can't decode payload %s on %s with encoding %s (for %s)",
                         msg.payload[0:8192],
                         topic,
-                        subscription.encoding,
+                        encoding,
                         subscription.job,
                     )
                     continue
-            subscription_topic = subscription.topic
-            if subscription_topic not in msg_cache_by_subscription_topic:
+                payload = decoded_payload
+            cache_key = (subscription.topic, encoding)
+            if cache_key not in msg_cache_by_subscription_topic:
                 # Only make one copy of the message
                 # per topic so we avoid storing a separate
                 # dataclass in memory for each subscriber
@@ -1120,12 +1128,12 @@ class MQTT:
                     payload,
                     msg.qos,
                     msg.retain,
-                    subscription_topic,
+                    subscription.topic,
                     msg.timestamp,
                 )
-                msg_cache_by_subscription_topic[subscription_topic] = receive_msg
+                msg_cache_by_subscription_topic[cache_key] = receive_msg
             else:
-                receive_msg = msg_cache_by_subscription_topic[subscription_topic]
+                receive_msg = msg_cache_by_subscription_topic[cache_key]
             job = subscription.job
             if job.job_type is HassJobType.Callback:
                 # We do not wrap Callback jobs in catch_log_exception since
@@ -1247,13 +1255,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
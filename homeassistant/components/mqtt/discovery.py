@@ -73,7 +73,9 @@ class MQTTDiscoveryPayload(dict[str, Any]):
 
 def clear_discovery_hash(hass: HomeAssistant, discovery_hash: tuple[str, str]) -> None:
     """Clear entry from already discovered list."""
-    hass.data[DATA_MQTT].discovery_already_discovered.discard(discovery_hash)
+    mqtt_data = hass.data[DATA_MQTT]
+    mqtt_data.discovery_already_discovered.discard(discovery_hash)
+    mqtt_data.discovery_payload_hashes.pop(discovery_hash, None)
 
 
 def set_discovery_hash(hass: HomeAssistant, discovery_hash: tuple[str, str]) -> None:
@@ -238,6 +240,25 @@ async def async_start(  # noqa: C901
             return
 
         component, node_id, object_id = match.groups()
+        # If present, the node_id will be included in the discovered object id
+        discovery_id = f"{node_id} {object_id}" if node_id else object_id
+        discovery_hash = (component, discovery_id)
+
+        # When the broker restarts or the client reconnects all retained discovery
+        # messages are received again, skip the payloads that were already applied
+        payload_hashes = mqtt_data.discovery_payload_hashes
+        if not payload:
+            payload_hashes.pop(discovery_hash, None)
+        elif payload_hashes.get(discovery_hash) == (payload_hash := hash(payload)):
+            if discovery_hash in mqtt_data.discovery_already_discovered:
+                _LOGGER.debug(
+                    "Ignoring unchanged discovery payload for %s %s",
+                    component,
+                    discovery_id,
+                )
+                return
+        else:
+            payload_hashes[discovery_hash] = payload_hash
 
         if payload:
             try:
@@ -253,10 +274,6 @@ async def async_start(  # noqa: C901
         else:
             discovery_payload = MQTTDiscoveryPayload({})
 
-        # If present, the node_id will be included in the discovered object id
-        discovery_id = f"{node_id} {object_id}" if node_id else object_id
-        discovery_hash = (component, discovery_id)
-
         if discovery_payload:
             # Attach MQTT topic to the payload, used for debug prints
             setattr(
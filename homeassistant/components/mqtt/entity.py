@@ -242,32 +242,57 @@ def async_setup_entity_entry_helper(
 ) -> None:
     """Set up entity creation dynamically through MQTT discovery."""
     mqtt_data = hass.data[DATA_MQTT]
+    pending_discovery_payloads: list[MQTTDiscoveryPayload] = []
+
+    async def _async_setup_entities_from_discovery() -> None:
+        """Set up the MQTT entities discovered in the last event loop iteration."""
+        nonlocal entity_class
+        entities: list[Entity] = []
+        for discovery_payload in pending_discovery_payloads:
+            try:
+                config: DiscoveryInfoType = discovery_schema(discovery_payload)
+                if schema_class_mapping is not None:
+                    entity_class = schema_class_mapping[config[CONF_SCHEMA]]
+                if TYPE_CHECKING:
+                    assert entity_class is not None
+                entities.append(
+                    entity_class(hass, config, entry, discovery_payload.discovery_data)
+                )
+            except vol.Invalid as err:
+                _handle_discovery_failure(hass, discovery_payload)
+                async_handle_schema_error(discovery_payload, err)
+            except Exception:
+                _handle_discovery_failure(hass, discovery_payload)
+                _LOGGER.exception(
+                    "Error setting up MQTT %s from discovery message topic: '%s'",
+                    domain,
+                    discovery_payload.discovery_data[ATTR_DISCOVERY_TOPIC],
+                )
+        pending_discovery_payloads.clear()
+        if entities:
+            async_add_entities(entities)
 
     @callback
     def _async_setup_entity_entry_from_discovery(
         discovery_payload: MQTTDiscoveryPayload,
     ) -> None:
-        """Set up an MQTT entity from discovery."""
-        nonlocal entity_class
+        """Set up an MQTT entity from discovery.
+
+        Many retained discovery messages are received at once when connecting
+        to the broker, the entities are validated and added in batches.
+        """
         if not _verify_mqtt_config_entry_enabled_for_discovery(
             hass, domain, discovery_payload
         ):
             return
-        try:
-            config: DiscoveryInfoType = discovery_schema(discovery_payload)
-            if schema_class_mapping is not None:
-                entity_class = schema_class_mapping[config[CONF_SCHEMA]]
-            if TYPE_CHECKING:
-                assert entity_class is not None
-            async_add_entities(
-                [entity_class(hass, config, entry, discovery_payload.discovery_data)]
+        if not pending_discovery_payloads:
+            entry.async_create_task(
+                hass,
+                _async_setup_entities_from_discovery(),
+                f"mqtt {domain} discovery",
+                eager_start=False,
             )
-        except vol.Invalid as err:
-            _handle_discovery_failure(hass, discovery_payload)
-            async_handle_schema_error(discovery_payload, err)
-        except Exception:
-            _handle_discovery_failure(hass, discovery_payload)
-            raise
+        pending_discovery_payloads.append(discovery_payload)
 
     mqtt_data.reload_dispatchers.append(
         async_dispatcher_connect(
@@ -8,6 +8,7 @@ from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import StrEnum
+from functools import lru_cache
 import logging
 from typing import TYPE_CHECKING, Any, TypedDict
 
@@ -24,6 +25,7 @@ from homeassistant.helpers.typing import (
     VolSchemaType,
 )
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
 if TYPE_CHECKING:
     from paho.mqtt.client import MQTTMessage
@@ -48,6 +50,10 @@ _LOGGER = logging.getLogger(__name__)
 
 ATTR_THIS = "this"
 
+# The payloads of the most recent messages, a message is rendered by all the
+# templates subscribed to its topic right after each other
+JSON_PAYLOAD_CACHE_SIZE = 64
+
 type PublishPayloadType = str | bytes | int | float | None
 
 
@@ -307,6 +313,7 @@ class MqttValueTemplate:
                 values,
                 self._value_template,
             )
+            _async_add_value_json(values, payload)
             try:
                 rendered_payload = (
                     self._value_template.async_render_with_possible_json_value(
@@ -333,6 +340,7 @@ class MqttValueTemplate:
             default,
             self._value_template,
         )
+        _async_add_value_json(values, payload)
         try:
             rendered_payload = (
                 self._value_template.async_render_with_possible_json_value(
@@ -350,6 +358,26 @@ class MqttValueTemplate:
         return rendered_payload
 
 
+@lru_cache(maxsize=JSON_PAYLOAD_CACHE_SIZE)
+def _parse_json_payload(payload: ReceivePayloadType) -> Any:
+    """Parse a payload as JSON, shared by the templates rendering it.
+
+    Returns PayloadSentinel.NONE if the payload is not valid JSON. The parsed
+    value is only exposed to sandboxed templates, which cannot modify it.
+    """
+    try:
+        return json_loads(payload)
+    except JSON_DECODE_EXCEPTIONS:
+        return PayloadSentinel.NONE
+
+
+@callback
+def _async_add_value_json(values: dict[str, Any], payload: ReceivePayloadType) -> None:
+    """Add the parsed JSON payload to the template variables if valid JSON."""
+    if (value_json := _parse_json_payload(payload)) is not PayloadSentinel.NONE:
+        values["value_json"] = value_json
+
+
 class EntityTopicState:
     """Manage entity state write requests for subscribed topics."""
 
@@ -395,6 +423,7 @@ class MqttData:
     discovery_pending_discovered: dict[tuple[str, str], PendingDiscovered] = field(
         default_factory=dict
     )
+    discovery_payload_hashes: dict[tuple[str, str], int] = field(default_factory=dict)
     discovery_registry_hooks: dict[tuple[str, str], CALLBACK_TYPE] = field(
         default_factory=dict
     )
@@ -0,0 +1,86 @@
+"""Match MQTT topics against topic filters with wildcards."""
+
+from __future__ import annotations
+
+
+class _TopicNode[_T]:
+    """A level of the topic filters in the trie."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicNode[_T]] = {}
+        # Values of the filters ending at this level, in the order they were added
+        self.values: dict[_T, None] = {}
+
+
+class TopicTrie[_T]:
+    """Store values by topic filter and find the values matching a topic.
+
+    Matching a topic follows the levels of the topic and the `+` and `#`
+    wildcards in the trie, the time taken depends on the depth of the topic
+    and not on the number of filters. As in paho's MQTTMatcher, wildcards at
+    the first level do not match topics starting with `$`.
+    """
+
+    __slots__ = ("_len", "_root")
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root: _TopicNode[_T] = _TopicNode()
+        self._len = 0
+
+    def __len__(self) -> int:
+        """Return the number of values."""
+        return self._len
+
+    def add(self, topic_filter: str, value: _T) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicNode()
+            node = child
+        if value not in node.values:
+            node.values[value] = None
+            self._len += 1
+
+    def remove(self, topic_filter: str, value: _T) -> None:
+        """Remove a value of a topic filter, raise KeyError if it was not added."""
+        path: list[tuple[_TopicNode[_T], str]] = []
+        node = self._root
+        for level in topic_filter.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        del node.values[value]
+        self._len -= 1
+        # Remove the levels no filter uses anymore
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.values or child.children:
+                break
+            del parent.children[level]
+
+    def match(self, topic: str) -> list[_T]:
+        """Return the values of all filters matching a topic."""
+        levels = topic.split("/")
+        depth = len(levels)
+        match_wildcards_first = not topic.startswith("$")
+        matches: list[_T] = []
+        stack: list[tuple[_TopicNode[_T], int]] = [(self._root, 0)]
+        while stack:
+            node, idx = stack.pop()
+            children = node.children
+            wildcards = idx or match_wildcards_first
+            # A multi level wildcard also matches its parent level
+            if wildcards and (child := children.get("#")) is not None:
+                matches.extend(child.values)
+            if idx == depth:
+                matches.extend(node.values)
+                continue
+            if (child := children.get(levels[idx])) is not None:
+                stack.append((child, idx + 1))
+            if wildcards and (child := children.get("+")) is not None:
+                stack.append((child, idx + 1))
+        return matches
@@ -18,6 +18,7 @@ from .modern import (
     get_significant_states as _modern_get_significant_states,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
+    state_changes_during_period_for_entities as _modern_state_changes_during_period_for_entities,
 )
 
 # These are the APIs of this package
@@ -29,6 +30,7 @@ __all__ = [
     "get_significant_states",
     "get_significant_states_with_session",
     "state_changes_during_period",
+    "state_changes_during_period_for_entities",
 ]
 
 
@@ -181,3 +183,46 @@ def state_changes_during_period(
         limit,
         include_start_time_state,
     )
+
+
+def state_changes_during_period_for_entities(
+    hass: HomeAssistant,
+    start_time: datetime,
+    entity_ids: list[str],
+    end_time: datetime | None = None,
+    no_attributes: bool = False,
+    descending: bool = False,
+    limit: int | None = None,
+    include_start_time_state: bool = True,
+) -> dict[str, list[State]]:
+    """Return a list of states of multiple entities that changed during a time period."""
+    if not get_instance(hass).states_meta_manager.active:
+        from .legacy import (  # pylint: disable=import-outside-toplevel
+            state_changes_during_period as _legacy_state_changes_during_period,
+        )
+
+        # The legacy schema is only used until the migration is done, query
+        # the entities one by one.
+        result: dict[str, list[State]] = {}
+        for entity_id in entity_ids:
+            result |= _legacy_state_changes_during_period(
+                hass,
+                start_time,
+                end_time,
+                entity_id,
+                no_attributes,
+                descending,
+                limit,
+                include_start_time_state,
+            )
+        return result
+    return _modern_state_changes_during_period_for_entities(
+        hass,
+        start_time,
+        entity_ids,
+        end_time,
+        no_attributes,
+        descending,
+        limit,
+        include_start_time_state,
+    )
@@ -452,6 +452,159 @@ def state_changes_during_period(
         )
 
 
+def _state_changes_during_period_for_entities_stmt(
+    start_time_ts: float,
+    end_time_ts: float | None,
+    single_metadata_id: int | None,
+    metadata_ids: list[int],
+    no_attributes: bool,
+    descending: bool,
+    limit: int | None,
+    include_start_time_state: bool,
+    run_start_ts: float | None,
+) -> Select | CompoundSelect:
+    """Query the database for state changes of multiple entities."""
+    stmt = (
+        _stmt_and_join_attributes(no_attributes, False, False)
+        .filter(
+            (
+                (States.last_changed_ts == States.last_updated_ts)
+                | States.last_changed_ts.is_(None)
+            )
+            & (States.last_updated_ts > start_time_ts)
+        )
+        .filter(States.metadata_id.in_(metadata_ids))
+    )
+    if end_time_ts:
+        stmt = stmt.filter(States.last_updated_ts < end_time_ts)
+    if not no_attributes:
+        stmt = stmt.outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        )
+    if limit:
+        # The limit applies to each entity, number the states of each entity
+        # starting from the end of the period when they are descending
+        numbered_subquery = stmt.add_columns(
+            func.row_number()
+            .over(
+                partition_by=States.metadata_id,
+                order_by=States.last_updated_ts.desc()
+                if descending
+                else States.last_updated_ts,
+            )
+            .label("rownum")
+        ).subquery()
+        changes_subquery = (
+            _select_from_subquery(numbered_subquery, no_attributes, False, False)
+            .filter(numbered_subquery.c.rownum <= limit)
+            .subquery()
+        )
+    elif not include_start_time_state or not run_start_ts:
+        return stmt.order_by(States.metadata_id, States.last_updated_ts)
+    else:
+        changes_subquery = stmt.subquery()
+    if not include_start_time_state or not run_start_ts:
+        return _select_from_subquery(
+            changes_subquery, no_attributes, False, False
+        ).order_by(changes_subquery.c.metadata_id, changes_subquery.c.last_updated_ts)
+    unioned_subquery = union_all(
+        _select_from_subquery(
+            _get_start_time_state_stmt(
+                run_start_ts,
+                start_time_ts,
+                single_metadata_id,
+                metadata_ids,
+                no_attributes,
+                False,
+            ).subquery(),
+            no_attributes,
+            False,
+            False,
+        ),
+        _select_from_subquery(changes_subquery, no_attributes, False, False),
+    ).subquery()
+    return _select_from_subquery(
+        unioned_subquery,
+        no_attributes,
+        False,
+        False,
+    ).order_by(unioned_subquery.c.metadata_id, unioned_subquery.c.last_updated_ts)
+
+
+def state_changes_during_period_for_entities(
+    hass: HomeAssistant,
+    start_time: datetime,
+    entity_ids: list[str],
+    end_time: datetime | None = None,
+    no_attributes: bool = False,
+    descending: bool = False,
+    limit: int | None = None,
+    include_start_time_state: bool = True,
+) -> dict[str, list[State]]:
+    """Return states changes of multiple entities during UTC period start_time - end_time.
+
+    The limit is applied to each entity, when descending the most recent
+    states of each entity are kept.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    entity_ids = [entity_id.lower() for entity_id in entity_ids]
+
+    with session_scope(hass=hass, read_only=True) as session:
+        instance = get_instance(hass)
+        if not (
+            entity_id_to_metadata_id := instance.states_meta_manager.get_many(
+                entity_ids, session, False
+            )
+        ) or not (
+            possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)
+        ):
+            return {}
+        metadata_ids = possible_metadata_ids
+        run_start_ts: float | None = None
+        if include_start_time_state and not (
+            run_start_ts := _get_run_start_ts_for_utc_point_in_time(hass, start_time)
+        ):
+            include_start_time_state = False
+        start_time_ts = dt_util.utc_to_timestamp(start_time)
+        end_time_ts = datetime_to_timestamp_or_none(end_time)
+        single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
+        stmt = lambda_stmt(
+            lambda: _state_changes_during_period_for_entities_stmt(
+                start_time_ts,
+                end_time_ts,
+                single_metadata_id,
+                metadata_ids,
+                no_attributes,
+                descending,
+                limit,
+                include_start_time_state,
+                run_start_ts,
+            ),
+            track_on=[
+                bool(single_metadata_id),
+                bool(end_time_ts),
+                no_attributes,
+                descending,
+                bool(limit),
+                include_start_time_state,
+            ],
+        )
+        return cast(
+            dict[str, list[State]],
+            _sorted_states_to_dict(
+                execute_stmt_lambda_element(
+                    session, stmt, None, end_time, orm_rows=False
+                ),
+                start_time_ts if include_start_time_state else None,
+                entity_ids,
+                entity_id_to_metadata_id,
+                descending=descending,
+                no_attributes=no_attributes,
+            ),
+        )
+
+
 def _get_last_state_changes_single_stmt(metadata_id: int) -> Select:
     return (
         _stmt_and_join_attributes(False, False, False)
@@ -0,0 +1,136 @@
+"""Fetch the recent state changes of many entities with one query."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+from functools import partial
+from typing import NamedTuple
+
+from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.helpers.recorder import get_instance
+from homeassistant.helpers.singleton import singleton
+import homeassistant.util.dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+from .. import history
+
+DATA_HISTORY_PREFETCH: HassKey[HistoryPrefetch] = HassKey("recorder_history_prefetch")
+
+
+class _PrefetchRequest(NamedTuple):
+    """The options of a batch of entities requesting their state changes."""
+
+    window: timedelta | None
+    no_attributes: bool
+    descending: bool
+    limit: int | None
+    include_start_time_state: bool
+
+
+class HistoryPrefetch:
+    """Batch the state changes requested by entities loading their history.
+
+    Entities that request the state changes of the same window with the same
+    options in the same iteration of the event loop, for example when they
+    start up together, are fetched with one multi entity query instead of one
+    query per entity.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the prefetch."""
+        self.hass = hass
+        self._pending: dict[
+            _PrefetchRequest, dict[str, list[asyncio.Future[list[State]]]]
+        ] = {}
+
+    @callback
+    def async_request(
+        self, entity_id: str, request: _PrefetchRequest
+    ) -> asyncio.Future[list[State]]:
+        """Request the state changes of an entity for the next batch."""
+        future: asyncio.Future[list[State]] = self.hass.loop.create_future()
+        if (pending := self._pending.get(request)) is None:
+            pending = self._pending[request] = {}
+            self.hass.loop.call_soon(self._async_fetch_pending, request)
+        pending.setdefault(entity_id.lower(), []).append(future)
+        return future
+
+    @callback
+    def _async_fetch_pending(self, request: _PrefetchRequest) -> None:
+        """Start fetching a batch of requests."""
+        self.hass.async_create_task(
+            self._async_fetch(request, self._pending.pop(request)),
+            "recorder history prefetch",
+        )
+
+    async def _async_fetch(
+        self,
+        request: _PrefetchRequest,
+        pending: dict[str, list[asyncio.Future[list[State]]]],
+    ) -> None:
+        """Fetch the state changes of a batch of entities."""
+        if request.window is None:
+            start_time = datetime.fromtimestamp(0, tz=dt_util.UTC)
+        else:
+            start_time = dt_util.utcnow() - request.window
+        try:
+            result = await get_instance(self.hass).async_add_executor_job(
+                partial(
+                    history.state_changes_during_period_for_entities,
+                    self.hass,
+                    start_time,
+                    list(pending),
+                    no_attributes=request.no_attributes,
+                    descending=request.descending,
+                    limit=request.limit,
+                    include_start_time_state=request.include_start_time_state,
+                )
+            )
+        except Exception as err:  # noqa: BLE001
+            # The error is raised by the entities waiting for the batch
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(err)
+            return
+        except BaseException:
+            for futures in pending.values():
+                for future in futures:
+                    future.cancel()
+            raise
+        for entity_id, futures in pending.items():
+            states = result.get(entity_id, [])
+            for future in futures:
+                if not future.done():
+                    future.set_result(states)
+
+
+@singleton(DATA_HISTORY_PREFETCH)
+@callback
+def _async_get_history_prefetch(hass: HomeAssistant) -> HistoryPrefetch:
+    """Return the history prefetch."""
+    return HistoryPrefetch(hass)
+
+
+async def async_state_changes_during_window(
+    hass: HomeAssistant,
+    entity_id: str,
+    window: timedelta | None,
+    *,
+    no_attributes: bool = False,
+    descending: bool = False,
+    limit: int | None = None,
+    include_start_time_state: bool = True,
+) -> list[State]:
+    """Return the state changes of an entity during a window ending now.
+
+    A window of None returns all recorded state changes. The requests of
+    entities for the same window and options are batched into one query.
+    """
+    return await _async_get_history_prefetch(hass).async_request(
+        entity_id,
+        _PrefetchRequest(
+            window, no_attributes, descending, limit, include_start_time_state
+        ),
+    )
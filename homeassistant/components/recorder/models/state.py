@@ -71,7 +71,7 @@ class LazyState(State):
         return getattr(self._row, "last_changed_ts", None)
 
     @cached_property
-    def last_changed(self) -> datetime:  # type: ignore[override]
+    def last_changed(self) -> datetime:
         """Last changed datetime."""
         return dt_util.utc_from_timestamp(
             self._last_changed_ts or self._last_updated_ts  # type: ignore[arg-type]
@@ -83,14 +83,14 @@ class LazyState(State):
         return getattr(self._row, "last_reported_ts", None)
 
     @cached_property
-    def last_reported(self) -> datetime:  # type: ignore[override]
+    def last_reported(self) -> datetime:
         """Last reported datetime."""
         return dt_util.utc_from_timestamp(
             self._last_reported_ts or self._last_updated_ts  # type: ignore[arg-type]
         )
 
     @cached_property
-    def last_updated(self) -> datetime:  # type: ignore[override]
+    def last_updated(self) -> datetime:
         """Last updated datetime."""
         if TYPE_CHECKING:
             assert self._last_updated_ts is not None
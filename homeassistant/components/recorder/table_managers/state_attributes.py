@@ -4,13 +4,14 @@ from __future__ import annotations
 
 from collections.abc import Collection, Iterable
 import logging
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Event, EventStateChangedData
 from homeassistant.util.collection import chunked_or_all
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
 from ..db_schema import StateAttributes
 from ..queries import get_shared_attributes
@@ -37,11 +38,22 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        # The last serialized attributes of each entity. The state machine
+        # reuses the attributes of the old state when they did not change,
+        # so an identity check is enough to skip serializing them again.
+        self._serialized: dict[str, tuple[ReadOnlyDict[str, Any], bytes]] = {}
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
         """Serialize event data."""
+        entity_id = event.data["entity_id"]
+        if (new_state := event.data["new_state"]) is None:
+            self._serialized.pop(entity_id, None)
+        elif (serialized := self._serialized.get(entity_id)) is not None and serialized[
+            0
+        ] is new_state.attributes:
+            return serialized[1]
         try:
-            return StateAttributes.shared_attrs_bytes_from_event(
+            shared_attrs_bytes = StateAttributes.shared_attrs_bytes_from_event(
                 event, self.recorder.dialect_name
             )
         except JSON_ENCODE_EXCEPTIONS as ex:
@@ -51,6 +63,9 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
                 ex,
             )
             return None
+        if new_state is not None:
+            self._serialized[entity_id] = (new_state.attributes, shared_attrs_bytes)
+        return shared_attrs_bytes
 
     def load(
         self, events: list[Event[EventStateChangedData]], session: Session
@@ -136,6 +151,15 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
             self._id_map[shared_attrs] = db_state_attributes.attributes_id
         self._pending.clear()
 
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._serialized.clear()
+
     def evict_purged(self, attributes_ids: set[int]) -> None:
         """Evict purged attributes_ids from the cache when they are no longer used.
 
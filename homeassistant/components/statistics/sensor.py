@@ -8,13 +8,14 @@ import contextlib
 from datetime import datetime, timedelta
 import logging
 import math
-import statistics
 from typing import Any, cast
 
 import voluptuous as vol
 
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
-from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.history.prefetch import (
+    async_state_changes_during_window,
+)
 from homeassistant.components.sensor import (
     DEVICE_CLASS_STATE_CLASSES,
     PLATFORM_SCHEMA as SENSOR_PLATFORM_SCHEMA,
@@ -56,6 +57,7 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import DOMAIN, PLATFORMS
+from .window import SampleWindow
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -362,8 +364,9 @@ class StatisticsSensor(SensorEntity):
         self._unit_of_measurement: str | None = None
         self._available: bool = False
 
-        self.states: deque[float | bool] = deque(maxlen=self._samples_max_buffer_size)
-        self.ages: deque[datetime] = deque(maxlen=self._samples_max_buffer_size)
+        self._window = SampleWindow(self._samples_max_buffer_size)
+        self.states: deque[float | bool] = self._window.states
+        self.ages: deque[datetime] = self._window.ages
         self.attributes: dict[str, StateType] = {}
 
         self._state_characteristic_fn: Callable[[], StateType | datetime] = (
@@ -446,10 +449,10 @@ class StatisticsSensor(SensorEntity):
         try:
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                value: float | bool = new_state.state == "on"
             else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_updated)
+                value = float(new_state.state)
+            self._window.append(value, new_state.last_updated)
             self.attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self.attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -573,8 +576,7 @@ class StatisticsSensor(SensorEntity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self._window.popleft()
 
     @callback
     def _async_next_to_purge_timestamp(self) -> datetime | None:
@@ -637,43 +639,35 @@ class StatisticsSensor(SensorEntity):
         if not self._preview_callback:
             self.async_write_ha_state()
 
-    def _fetch_states_from_database(self) -> list[State]:
-        """Fetch the states from the database."""
+    async def _initialize_from_database(self) -> None:
+        """Initialize the list of states from the database.
+
+        The query will get the list of states in DESCENDING order so that we
+        can limit the result to self._sample_size. Afterwards reverse the
+        list so that we get it in the right order again.
+
+        If MaxAge is provided then query will restrict to entries younger then
+        current datetime - MaxAge. The states of all statistics sensors starting
+        up together are fetched with one query per MaxAge.
+        """
         _LOGGER.debug("%s: initializing values from the database", self.entity_id)
-        lower_entity_id = self._source_entity_id.lower()
+        window: timedelta | None = None
         if self._samples_max_age is not None:
-            start_date = (
-                dt_util.utcnow() - self._samples_max_age - timedelta(microseconds=1)
-            )
+            window = self._samples_max_age + timedelta(microseconds=1)
             _LOGGER.debug(
                 "%s: retrieve records not older then %s",
                 self.entity_id,
-                start_date,
+                window,
             )
         else:
-            start_date = datetime.fromtimestamp(0, tz=dt_util.UTC)
             _LOGGER.debug("%s: retrieving all records", self.entity_id)
-        return history.state_changes_during_period(
+        if states := await async_state_changes_during_window(
             self.hass,
-            start_date,
-            entity_id=lower_entity_id,
+            self._source_entity_id,
+            window,
             descending=True,
             limit=self._samples_max_buffer_size,
             include_start_time_state=False,
-        ).get(lower_entity_id, [])
-
-    async def _initialize_from_database(self) -> None:
-        """Initialize the list of states from the database.
-
-        The query will get the list of states in DESCENDING order so that we
-        can limit the result to self._sample_size. Afterwards reverse the
-        list so that we get it in the right order again.
-
-        If MaxAge is provided then query will restrict to entries younger then
-        current datetime - MaxAge.
-        """
-        if states := await get_instance(self.hass).async_add_executor_job(
-            self._fetch_states_from_database
         ):
             for state in reversed(states):
                 self._add_state_to_queue(state)
@@ -794,12 +788,12 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_datetime_value_max(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(max(self.states))]
+            return self._window.value_max[1]
         return None
 
     def _stat_datetime_value_min(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(min(self.states))]
+            return self._window.value_min[1]
         return None
 
     def _stat_distance_95_percent_of_values(self) -> StateType:
@@ -814,12 +808,12 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_distance_absolute(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states) - min(self.states)
+            return self._window.value_max[0] - self._window.value_min[0]
         return None
 
     def _stat_mean(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.mean(self.states)
+            return self._window.mean
         return None
 
     def _stat_mean_circular(self) -> StateType:
@@ -831,7 +825,7 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_median(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.median(self.states)
+            return self._window.median
         return None
 
     def _stat_noisiness(self) -> StateType:
@@ -841,34 +835,27 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_percentile(self) -> StateType:
         if len(self.states) >= 2:
-            percentiles = statistics.quantiles(self.states, n=100, method="exclusive")
-            return percentiles[self._percentile - 1]
+            return self._window.percentile(self._percentile)
         return None
 
     def _stat_standard_deviation(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.stdev(self.states)
+            return self._window.standard_deviation
         return None
 
     def _stat_sum(self) -> StateType:
         if len(self.states) > 0:
-            return sum(self.states)
+            return self._window.sum
         return None
 
     def _stat_sum_differences(self) -> StateType:
         if len(self.states) >= 2:
-            return sum(
-                abs(j - i)
-                for i, j in zip(list(self.states), list(self.states)[1:], strict=False)
-            )
+            return self._window.sum_differences
         return None
 
     def _stat_sum_differences_nonnegative(self) -> StateType:
         if len(self.states) >= 2:
-            return sum(
-                (j - i if j >= i else j - 0)
-                for i, j in zip(list(self.states), list(self.states)[1:], strict=False)
-            )
+            return self._window.sum_nonnegative_differences
         return None
 
     def _stat_total(self) -> StateType:
@@ -876,17 +863,17 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_value_max(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states)
+            return self._window.value_max[0]
         return None
 
     def _stat_value_min(self) -> StateType:
         if len(self.states) > 0:
-            return min(self.states)
+            return self._window.value_min[0]
         return None
 
     def _stat_variance(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.variance(self.states)
+            return self._window.variance
         return None
 
     # Statistics for binary sensor
@@ -908,10 +895,10 @@ class StatisticsSensor(SensorEntity):
         return len(self.states)
 
     def _stat_binary_count_on(self) -> StateType:
-        return self.states.count(True)
+        return self._window.count_on
 
     def _stat_binary_count_off(self) -> StateType:
-        return self.states.count(False)
+        return len(self.states) - self._window.count_on
 
     def _stat_binary_datetime_newest(self) -> datetime | None:
         return self._stat_datetime_newest()
@@ -921,5 +908,5 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_binary_mean(self) -> StateType:
         if len(self.states) > 0:
-            return 100.0 / len(self.states) * self.states.count(True)
+            return 100.0 / len(self.states) * self._window.count_on
         return None
@@ -0,0 +1,226 @@
+"""Sliding window of samples with incrementally updated statistics."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import datetime
+import math
+import statistics
+
+from homeassistant.util.aggregation import FLOAT_SCALE, float_to_scaled_int
+
+
+def _difference(previous: float, value: float) -> float:
+    """Return the absolute difference of two consecutive samples."""
+    return abs(value - previous)
+
+
+def _nonnegative_difference(previous: float, value: float) -> float:
+    """Return the difference of two consecutive samples, a reset counts from 0."""
+    return value - previous if value >= previous else value - 0
+
+
+class SampleWindow:
+    """Samples of a source sensor with their ages, in the order they were added.
+
+    Samples are added at the end and removed from the start, the oldest sample
+    is dropped when the window is full. Sums are kept exactly as integers,
+    the extremes in monotonic deques and the values sorted, so the statistics
+    are updated in O(log n) per sample instead of recalculated from all
+    samples. While the window contains a NaN or infinite value the statistics
+    are calculated from all samples.
+    """
+
+    def __init__(self, maxlen: int | None) -> None:
+        """Initialize the window."""
+        self.maxlen = maxlen
+        self.states: deque[float | bool] = deque()
+        self.ages: deque[datetime] = deque()
+        # Sequence number of the oldest sample
+        self._first = 0
+        self._non_finite = 0
+        self._count_on = 0
+        self._sum = 0
+        self._sum_squares = 0
+        self._sum_differences = 0
+        self._sum_nonnegative_differences = 0
+        self._sorted: list[float | bool] = []
+        # Sequence numbers and values of the candidates for the extremes,
+        # the earliest sample with the extreme value comes first.
+        self._max: deque[tuple[int, float | bool]] = deque()
+        self._min: deque[tuple[int, float | bool]] = deque()
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return len(self.states)
+
+    def append(self, value: float | bool, age: datetime) -> None:
+        """Add a sample, dropping the oldest one if the window is full."""
+        states = self.states
+        if self.maxlen is not None and len(states) >= self.maxlen:
+            if not self.maxlen:
+                return
+            self.popleft()
+        if states:
+            self._add_differences(states[-1], value, 1)
+        seq = self._first + len(states)
+        states.append(value)
+        self.ages.append(age)
+        if value is True:
+            self._count_on += 1
+        if not math.isfinite(value):
+            self._non_finite += 1
+            return
+        scaled = float_to_scaled_int(value)
+        self._sum += scaled
+        self._sum_squares += scaled * scaled
+        insort(self._sorted, value)
+        maxima = self._max
+        while maxima and maxima[-1][1] < value:
+            maxima.pop()
+        maxima.append((seq, value))
+        minima = self._min
+        while minima and minima[-1][1] > value:
+            minima.pop()
+        minima.append((seq, value))
+
+    def popleft(self) -> None:
+        """Remove the oldest sample."""
+        states = self.states
+        value = states.popleft()
+        self.ages.popleft()
+        seq = self._first
+        self._first += 1
+        if states:
+            self._add_differences(value, states[0], -1)
+        if value is True:
+            self._count_on -= 1
+        if not math.isfinite(value):
+            self._non_finite -= 1
+            return
+        scaled = float_to_scaled_int(value)
+        self._sum -= scaled
+        self._sum_squares -= scaled * scaled
+        del self._sorted[bisect_left(self._sorted, value)]
+        if self._max[0][0] == seq:
+            self._max.popleft()
+        if self._min[0][0] == seq:
+            self._min.popleft()
+
+    def _add_differences(
+        self, previous: float | bool, value: float | bool, sign: int
+    ) -> None:
+        """Add or remove the differences between two consecutive samples."""
+        if math.isfinite(difference := _difference(previous, value)):
+            self._sum_differences += sign * float_to_scaled_int(difference)
+        if math.isfinite(difference := _nonnegative_difference(previous, value)):
+            self._sum_nonnegative_differences += sign * float_to_scaled_int(difference)
+
+    @property
+    def count_on(self) -> int:
+        """Return the number of True samples."""
+        return self._count_on
+
+    @property
+    def sum(self) -> float:
+        """Return the sum of the samples."""
+        if self._non_finite:
+            return sum(self.states)
+        return self._sum / FLOAT_SCALE
+
+    @property
+    def mean(self) -> float:
+        """Return the mean of the samples."""
+        if self._non_finite:
+            return statistics.mean(self.states)
+        return self._sum / (FLOAT_SCALE * len(self.states))
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance, there must be at least two samples."""
+        if self._non_finite:
+            return statistics.variance(self.states)
+        count = len(self.states)
+        return (count * self._sum_squares - self._sum * self._sum) / (
+            FLOAT_SCALE * FLOAT_SCALE * count * (count - 1)
+        )
+
+    @property
+    def standard_deviation(self) -> float:
+        """Return the sample standard deviation."""
+        if self._non_finite:
+            return statistics.stdev(self.states)
+        return math.sqrt(self.variance)
+
+    @property
+    def median(self) -> float:
+        """Return the median of the samples."""
+        if self._non_finite:
+            return statistics.median(self.states)
+        data = self._sorted
+        middle, odd = divmod(len(data), 2)
+        if odd:
+            return data[middle]
+        return (data[middle - 1] + data[middle]) / 2
+
+    def percentile(self, percentile: int) -> float:
+        """Return a percentile, there must be at least two samples.
+
+        Matches statistics.quantiles with the exclusive method.
+        """
+        if self._non_finite:
+            return statistics.quantiles(self.states, n=100, method="exclusive")[
+                percentile - 1
+            ]
+        data = self._sorted
+        count = len(data)
+        m = count + 1
+        j = min(max(percentile * m // 100, 1), count - 1)
+        delta = percentile * m - j * 100
+        return (data[j - 1] * (100 - delta) + data[j] * delta) / 100
+
+    @property
+    def value_max(self) -> tuple[float | bool, datetime]:
+        """Return the highest value and the age of its earliest sample."""
+        if self._non_finite:
+            value = max(self.states)
+            return value, self.ages[self.states.index(value)]
+        seq, value = self._max[0]
+        return value, self.ages[seq - self._first]
+
+    @property
+    def value_min(self) -> tuple[float | bool, datetime]:
+        """Return the lowest value and the age of its earliest sample."""
+        if self._non_finite:
+            value = min(self.states)
+            return value, self.ages[self.states.index(value)]
+        seq, value = self._min[0]
+        return value, self.ages[seq - self._first]
+
+    @property
+    def sum_differences(self) -> float:
+        """Return the sum of the absolute differences of consecutive samples."""
+        if self._non_finite:
+            return sum(
+                _difference(previous, value)
+                for previous, value in zip(
+                    self.states, list(self.states)[1:], strict=False
+                )
+            )
+        return self._sum_differences / FLOAT_SCALE
+
+    @property
+    def sum_nonnegative_differences(self) -> float:
+        """Return the sum of the differences of consecutive samples.
+
+        A decreasing value is counted as a reset to 0.
+        """
+        if self._non_finite:
+            return sum(
+                _nonnegative_difference(previous, value)
+                for previous, value in zip(
+                    self.states, list(self.states)[1:], strict=False
+                )
+            )
+        return self._sum_nonnegative_differences / FLOAT_SCALE
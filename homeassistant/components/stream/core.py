@@ -77,8 +77,8 @@ class Part:
 
     duration: float
     has_keyframe: bool
-    # video data (moof+mdat)
-    data: bytes
+    # video data (moof+mdat), a view of the segment data once it is complete
+    data: bytes | memoryview
 
 
 @dataclass(slots=True)
@@ -102,6 +102,8 @@ class Segment:
     hls_num_parts_rendered: int = 0
     # Set to true when all the parts are rendered
     hls_playlist_complete: bool = False
+    # Data of all parts, joined once the Segment is complete
+    _data: bytes | None = None
 
     def __post_init__(self) -> None:
         """Run after init."""
@@ -139,8 +141,24 @@ class Segment:
             output.part_put()
 
     def get_data(self) -> bytes:
-        """Return reconstructed data for all parts as bytes, without init."""
-        return b"".join([part.data for part in self.parts])
+        """Return reconstructed data for all parts as bytes, without init.
+
+        The data of a complete Segment is joined once and its parts are
+        replaced by views of it, so serving the Segment to many viewers does
+        not copy it for every request.
+        """
+        if self._data is not None:
+            return self._data
+        data = b"".join([part.data for part in self.parts])
+        if self.complete:
+            view = memoryview(data)
+            offset = 0
+            for part in self.parts:
+                size = len(part.data)
+                part.data = view[offset : offset + size]
+                offset += size
+            self._data = data
+        return data
 
     def _render_hls_template(self, last_stream_id: int, render_parts: bool) -> str:
         """Render the HLS playlist section for the Segment.
@@ -427,6 +445,11 @@ class KeyFrameConverter:
         _generate_image will clear the packet, so there will only be one attempt per packet
     If successful, self._image will be updated and returned by get_image
     If unsuccessful, get_image will return the previous image
+
+    The images of the last keyframe are cached by size and orientation until
+    the next keyframe, so polling for stills does not decode and encode the
+    same keyframe again. Another size is generated by decoding the keyframe
+    again.
     """
 
     def __init__(
@@ -443,9 +466,14 @@ class KeyFrameConverter:
         from homeassistant.components.camera.img_util import TurboJPEGSingleton
 
         self._packet: Packet = None
+        # Number of requests waiting for the next keyframe
+        self._keyframe_waiters = 0
+        # The last keyframe which was decoded successfully
+        self._keyframe: Packet = None
         self._event: asyncio.Event = asyncio.Event()
         self._hass = hass
         self._image: bytes | None = None
+        self._images: dict[tuple[int | None, int | None, int], bytes] = {}
         self._turbojpeg = TurboJPEGSingleton.instance()
         self._lock = asyncio.Lock()
         self._codec_context: CodecContext | None = None
@@ -455,10 +483,12 @@ class KeyFrameConverter:
     def stash_keyframe_packet(self, packet: Packet) -> None:
         """Store the keyframe and set the asyncio.Event from the event loop.
 
-        This is called from the worker thread.
+        This is called from the worker thread. The event loop is only woken up
+        when a request is waiting for the next keyframe.
         """
         self._packet = packet
-        self._hass.loop.call_soon_threadsafe(self._event.set)
+        if self._keyframe_waiters:
+            self._hass.loop.call_soon_threadsafe(self._event.set)
 
     def create_codec_context(self, codec_context: CodecContext) -> None:
         """Create a codec context to be used for decoding the keyframes.
@@ -484,6 +514,12 @@ class KeyFrameConverter:
         """Transform image to a given orientation."""
         return TRANSFORM_IMAGE_FUNCTION[orientation](image)
 
+    def _image_key(
+        self, width: int | None, height: int | None
+    ) -> tuple[int | None, int | None, int]:
+        """Return the key of an image of the keyframe in the image cache."""
+        return (width, height, self._dynamic_stream_settings.orientation)
+
     def _generate_image(self, width: int | None, height: int | None) -> None:
         """Generate the keyframe image.
 
@@ -492,10 +528,18 @@ class KeyFrameConverter:
         at a time per instance.
         """
 
-        if not (self._turbojpeg and self._packet and self._codec_context):
+        if not (self._turbojpeg and self._codec_context):
+            return
+        if (packet := self._packet) is not None:
+            self._packet = None
+            self._keyframe = None
+            self._images.clear()
+        elif (packet := self._keyframe) is None:
+            return
+        key = self._image_key(width, height)
+        if (image := self._images.get(key)) is not None:
+            self._image = image
             return
-        packet = self._packet
-        self._packet = None
         for _ in range(2):  # Retry once if codec context needs to be flushed
             try:
                 # decode packet (flush afterwards)
@@ -511,19 +555,22 @@ class KeyFrameConverter:
                 self._codec_context.open()
         else:
             _LOGGER.debug("Unable to decode keyframe")
+            self._keyframe = None
             return
-        if frames:
-            frame = frames[0]
-            if width and height:
-                if self._dynamic_stream_settings.orientation >= 5:
-                    frame = frame.reformat(width=height, height=width)
-                else:
-                    frame = frame.reformat(width=width, height=height)
-            bgr_array = self.transform_image(
-                frame.to_ndarray(format="bgr24"),
-                self._dynamic_stream_settings.orientation,
-            )
-            self._image = bytes(self._turbojpeg.encode(bgr_array))
+        if not frames:
+            self._keyframe = None
+            return
+        # Keep the keyframe to generate images of other sizes
+        self._keyframe = packet
+        frame = frames[0]
+        orientation = key[2]
+        if width and height:
+            if orientation >= 5:
+                frame = frame.reformat(width=height, height=width)
+            else:
+                frame = frame.reformat(width=width, height=height)
+        bgr_array = self.transform_image(frame.to_ndarray(format="bgr24"), orientation)
+        self._image = self._images[key] = bytes(self._turbojpeg.encode(bgr_array))
 
     async def async_get_image(
         self,
@@ -536,7 +583,18 @@ class KeyFrameConverter:
         # Use a lock to ensure only one thread is working on the keyframe at a time
         if wait_for_next_keyframe:
             self._event.clear()
-            await self._event.wait()
+            self._keyframe_waiters += 1
+            try:
+                await self._event.wait()
+            finally:
+                self._keyframe_waiters -= 1
         async with self._lock:
-            await self._hass.async_add_executor_job(self._generate_image, width, height)
+            if self._packet is None and (
+                image := self._images.get(self._image_key(width, height))
+            ):
+                self._image = image
+            else:
+                await self._hass.async_add_executor_job(
+                    self._generate_image, width, height
+                )
         return self._image
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Mapping
+from dataclasses import dataclass
 from datetime import datetime
 from functools import partial
 import hashlib
@@ -64,6 +65,8 @@ from .const import (
     DEFAULT_CACHE_DIR,
     DEFAULT_TIME_MEMORY,
     DOMAIN,
+    FILE_CACHE_MAX_BYTES,
+    MEM_CACHE_MAX_BYTES,
     TtsAudioType,
 )
 from .helper import get_engine_instance
@@ -130,7 +133,16 @@ class TTSCache(TypedDict):
 
     filename: str
     voice: bytes
-    pending: asyncio.Task | None
+    pending: asyncio.Task[bytes] | None
+
+
+@dataclass(slots=True)
+class TTSCacheStats:
+    """Statistics of a TTS cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
 
 
 @callback
@@ -529,6 +541,8 @@ class SpeechManager:
         use_cache: bool,
         cache_dir: str,
         time_memory: int,
+        mem_cache_max_bytes: int = MEM_CACHE_MAX_BYTES,
+        file_cache_max_bytes: int = FILE_CACHE_MAX_BYTES,
     ) -> None:
         """Initialize a speech store."""
         self.hass = hass
@@ -537,24 +551,50 @@ class SpeechManager:
         self.use_cache = use_cache
         self.cache_dir = cache_dir
         self.time_memory = time_memory
+        self.mem_cache_max_bytes = mem_cache_max_bytes
+        self.file_cache_max_bytes = file_cache_max_bytes
+        # Both caches are kept in least recently used order
         self.file_cache: dict[str, str] = {}
         self.mem_cache: dict[str, TTSCache] = {}
+        self.file_cache_stats = TTSCacheStats()
+        self.mem_cache_stats = TTSCacheStats()
+        self._file_sizes: dict[str, int] = {}
+
+    def _init_cache(self) -> tuple[dict[str, str], dict[str, int]]:
+        """Init cache folder and fetch files with their sizes.
 
-    def _init_cache(self) -> dict[str, str]:
-        """Init cache folder and fetch files."""
+        The files are returned in the order they were last modified.
+        """
         try:
             self.cache_dir = _init_tts_cache_dir(self.hass, self.cache_dir)
         except OSError as err:
             raise HomeAssistantError(f"Can't init cache dir {err}") from err
 
         try:
-            return _get_cache_files(self.cache_dir)
+            files = _get_cache_files(self.cache_dir)
         except OSError as err:
             raise HomeAssistantError(f"Can't read cache dir {err}") from err
 
+        stats: dict[str, tuple[float, int]] = {}
+        for cache_key, filename in files.items():
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, filename))
+            except OSError:
+                stats[cache_key] = (0, 0)
+            else:
+                stats[cache_key] = (stat.st_mtime, stat.st_size)
+        cache_keys = sorted(files, key=lambda cache_key: stats[cache_key][0])
+        return (
+            {cache_key: files[cache_key] for cache_key in cache_keys},
+            {cache_key: stats[cache_key][1] for cache_key in cache_keys},
+        )
+
     async def async_init_cache(self) -> None:
         """Init config folder and load file cache."""
-        self.file_cache.update(await self.hass.async_add_executor_job(self._init_cache))
+        files, sizes = await self.hass.async_add_executor_job(self._init_cache)
+        self.file_cache.update(files)
+        self._file_sizes.update(sizes)
+        await self._async_evict_files()
 
     async def async_clear_cache(self) -> None:
         """Read file cache and delete files."""
@@ -570,6 +610,64 @@ class SpeechManager:
 
         await self.hass.async_add_executor_job(remove_files)
         self.file_cache = {}
+        self._file_sizes = {}
+
+    @callback
+    def _async_get_from_memcache(self, cache_key: str) -> TTSCache | None:
+        """Return a voice from the memcache and mark it as recently used."""
+        if (cached := self.mem_cache.pop(cache_key, None)) is None:
+            self.mem_cache_stats.misses += 1
+            return None
+        self.mem_cache_stats.hits += 1
+        self.mem_cache[cache_key] = cached
+        return cached
+
+    @callback
+    def _async_get_from_file_cache(self, cache_key: str) -> str | None:
+        """Return the file of a voice and mark it as recently used."""
+        if (filename := self.file_cache.pop(cache_key, None)) is None:
+            self.file_cache_stats.misses += 1
+            return None
+        self.file_cache_stats.hits += 1
+        self.file_cache[cache_key] = filename
+        return filename
+
+    @callback
+    def _async_evict_from_memcache(self, keep_key: str) -> None:
+        """Evict the least recently used voices exceeding the memory budget."""
+        size = sum(len(cached["voice"]) for cached in self.mem_cache.values())
+        for cache_key, cached in list(self.mem_cache.items()):
+            if size <= self.mem_cache_max_bytes:
+                return
+            if cache_key == keep_key or cached["pending"]:
+                continue
+            del self.mem_cache[cache_key]
+            size -= len(cached["voice"])
+            self.mem_cache_stats.evictions += 1
+
+    async def _async_evict_files(self) -> None:
+        """Remove the least recently used files exceeding the disk budget."""
+        size = sum(self._file_sizes.values())
+        filenames: list[str] = []
+        for cache_key in list(self.file_cache):
+            if size <= self.file_cache_max_bytes:
+                break
+            filenames.append(self.file_cache.pop(cache_key))
+            size -= self._file_sizes.pop(cache_key, 0)
+            self.file_cache_stats.evictions += 1
+        if not filenames:
+            return
+
+        def remove_files() -> None:
+            """Remove files from filesystem."""
+            for filename in filenames:
+                try:
+                    os.remove(os.path.join(self.cache_dir, filename))
+                except OSError as err:
+                    _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
+
+        _LOGGER.debug("Removing %s files exceeding the cache size", len(filenames))
+        await self.hass.async_add_executor_job(remove_files)
 
     @callback
     def async_register_legacy_engine(
@@ -644,11 +742,11 @@ class SpeechManager:
         use_cache = cache if cache is not None else self.use_cache
 
         # Is speech already in memory
-        if cache_key in self.mem_cache:
-            filename = self.mem_cache[cache_key]["filename"]
+        if cached := self._async_get_from_memcache(cache_key):
+            filename = cached["filename"]
         # Is file store in file cache
-        elif use_cache and cache_key in self.file_cache:
-            filename = self.file_cache[cache_key]
+        elif use_cache and (cached_file := self._async_get_from_file_cache(cache_key)):
+            filename = cached_file
             self.hass.async_create_task(self._async_file_to_mem(cache_key))
         # Load speech from engine into memory
         else:
@@ -675,19 +773,18 @@ class SpeechManager:
         use_cache = cache if cache is not None else self.use_cache
 
         # If we have the file, load it into memory if necessary
-        if cache_key not in self.mem_cache:
-            if use_cache and cache_key in self.file_cache:
+        if not self._async_get_from_memcache(cache_key):
+            if use_cache and self._async_get_from_file_cache(cache_key):
                 await self._async_file_to_mem(cache_key)
             else:
                 await self._async_get_tts_audio(
                     engine_instance, cache_key, message, use_cache, language, options
                 )
 
-        extension = os.path.splitext(self.mem_cache[cache_key]["filename"])[1][1:]
         cached = self.mem_cache[cache_key]
-        if pending := cached.get("pending"):
-            await pending
-            cached = self.mem_cache[cache_key]
+        extension = os.path.splitext(cached["filename"])[1][1:]
+        if pending := cached["pending"]:
+            return extension, await pending
         return extension, cached["voice"]
 
     @callback
@@ -758,7 +855,7 @@ class SpeechManager:
         if sample_bytes is not None:
             sample_bytes = int(sample_bytes)
 
-        async def get_tts_data() -> str:
+        async def get_tts_data() -> bytes:
             """Handle data available."""
             if engine_instance.name is None or engine_instance.name is UNDEFINED:
                 raise HomeAssistantError("TTS engine name is not set.")
@@ -822,7 +919,7 @@ class SpeechManager:
                     self._async_save_tts_audio(cache_key, filename, data)
                 )
 
-            return filename
+            return data
 
         audio_task = self.hass.async_create_task(get_tts_data(), eager_start=False)
 
@@ -857,9 +954,13 @@ class SpeechManager:
 
         try:
             await self.hass.async_add_executor_job(save_speech)
-            self.file_cache[cache_key] = filename
         except OSError as err:
             _LOGGER.error("Can't write %s: %s", filename, err)
+            return
+        self.file_cache.pop(cache_key, None)
+        self.file_cache[cache_key] = filename
+        self._file_sizes[cache_key] = len(data)
+        await self._async_evict_files()
 
     async def _async_file_to_mem(self, cache_key: str) -> None:
         """Load voice from file cache into memory.
@@ -880,6 +981,7 @@ class SpeechManager:
             data = await self.hass.async_add_executor_job(load_speech)
         except OSError as err:
             del self.file_cache[cache_key]
+            self._file_sizes.pop(cache_key, None)
             raise HomeAssistantError(f"Can't read {voice_file}") from err
 
         self._async_store_to_memcache(cache_key, filename, data)
@@ -889,11 +991,13 @@ class SpeechManager:
         self, cache_key: str, filename: str, data: bytes
     ) -> None:
         """Store data to memcache and set timer to remove it."""
+        self.mem_cache.pop(cache_key, None)
         self.mem_cache[cache_key] = {
             "filename": filename,
             "voice": data,
             "pending": None,
         }
+        self._async_evict_from_memcache(cache_key)
 
         @callback
         def async_remove_from_mem(_: datetime) -> None:
@@ -910,31 +1014,47 @@ class SpeechManager:
             ),
         )
 
-    async def async_read_tts(self, filename: str) -> tuple[str | None, bytes]:
-        """Read a voice file and return binary.
-
-        This method is a coroutine.
-        """
+    @staticmethod
+    def _cache_key_from_filename(filename: str) -> str:
+        """Return the cache key of a voice file."""
         if not (record := _RE_VOICE_FILE.match(filename.lower())) and not (
             record := _RE_LEGACY_VOICE_FILE.match(filename.lower())
         ):
             raise HomeAssistantError("Wrong tts file format!")
 
-        cache_key = KEY_PATTERN.format(
+        return KEY_PATTERN.format(
             record.group(1), record.group(2), record.group(3), record.group(4)
         )
 
-        if cache_key not in self.mem_cache:
-            if cache_key not in self.file_cache:
+    @callback
+    def async_get_cached_file(self, filename: str) -> str | None:
+        """Return the path of a voice file that is only cached on disk.
+
+        The file can be streamed to the client without loading it into memory.
+        """
+        cache_key = self._cache_key_from_filename(filename)
+        if cache_key in self.mem_cache:
+            return None
+        if (cached_file := self._async_get_from_file_cache(cache_key)) is None:
+            return None
+        return os.path.join(self.cache_dir, cached_file)
+
+    async def async_read_tts(self, filename: str) -> tuple[str | None, bytes]:
+        """Read a voice file and return binary.
+
+        This method is a coroutine.
+        """
+        cache_key = self._cache_key_from_filename(filename)
+
+        if not (cached := self._async_get_from_memcache(cache_key)):
+            if not self._async_get_from_file_cache(cache_key):
                 raise HomeAssistantError(f"{cache_key} not in cache!")
             await self._async_file_to_mem(cache_key)
-
-        cached = self.mem_cache[cache_key]
-        if pending := cached.get("pending"):
-            await pending
             cached = self.mem_cache[cache_key]
 
         content, _ = mimetypes.guess_type(filename)
+        if pending := cached["pending"]:
+            return content, await pending
         return content, cached["voice"]
 
     @staticmethod
@@ -1073,9 +1193,11 @@ class TextToSpeechView(HomeAssistantView):
         """Initialize a tts view."""
         self.tts = tts
 
-    async def get(self, request: web.Request, filename: str) -> web.Response:
+    async def get(self, request: web.Request, filename: str) -> web.StreamResponse:
         """Start a get request."""
         try:
+            if cached_file := self.tts.async_get_cached_file(filename):
+                return web.FileResponse(cached_file)
             content, data = await self.tts.async_read_tts(filename)
         except HomeAssistantError as err:
             _LOGGER.error("Error on load tts: %s", err)
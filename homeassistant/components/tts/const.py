@@ -25,6 +25,10 @@ DEFAULT_CACHE = True
 DEFAULT_CACHE_DIR = "tts"
 DEFAULT_TIME_MEMORY = 300
 
+# Budgets of the cached voices, the least recently used are evicted first
+MEM_CACHE_MAX_BYTES = 32 * 1024 * 1024
+FILE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
 DOMAIN = "tts"
 DATA_COMPONENT: HassKey[EntityComponent[TextToSpeechEntity]] = HassKey(DOMAIN)
 
@@ -51,6 +51,7 @@ import yarl
 
 from . import util
 from .const import (
+    ATTR_DEVICE_CLASS,
     ATTR_DOMAIN,
     ATTR_FRIENDLY_NAME,
     ATTR_SERVICE,
@@ -1244,11 +1245,26 @@ class HomeAssistant:
             _LOGGER.warning("Shutdown stage '%s': still running: %s", stage, task)
 
 
+def _lazy_cache_getattr(self: Any, name: str) -> Any:
+    """Create the _cache dict of an object on first access."""
+    if name == "_cache":
+        cache: dict[str, Any] = {}
+        self._cache = cache
+        return cache
+    raise AttributeError(
+        f"'{type(self).__name__}' object has no attribute '{name}'",
+        name=name,
+        obj=self,
+    )
+
+
 class Context:
     """The context that triggered something."""
 
     __slots__ = ("id", "user_id", "parent_id", "origin_event", "_cache")
 
+    _cache: dict[str, Any]
+
     def __init__(
         self,
         user_id: str | None = None,
@@ -1260,7 +1276,11 @@ class Context:
         self.user_id = user_id
         self.parent_id = parent_id
         self.origin_event: Event[Any] | None = None
-        self._cache: dict[str, Any] = {}
+
+    if not TYPE_CHECKING:
+        # Most contexts are never serialized so the cache
+        # is only created when a cached property is first used.
+        __getattr__ = _lazy_cache_getattr
 
     def __eq__(self, other: object) -> bool:
         """Compare contexts."""
@@ -1771,17 +1791,22 @@ class State:
         "entity_id",
         "state",
         "attributes",
-        "last_changed",
-        "last_reported",
-        "last_updated",
         "context",
         "state_info",
         "domain",
         "object_id",
+        "last_changed_timestamp",
+        "last_reported_timestamp",
         "last_updated_timestamp",
+        "_last_changed",
+        "_last_reported",
+        "_last_updated",
+        "_attributes_json_fragment",
         "_cache",
     )
 
+    _cache: dict[str, Any]
+
     def __init__(
         self,
         entity_id: str,
@@ -1794,9 +1819,9 @@ class State:
         validate_entity_id: bool | None = True,
         state_info: StateInfo | None = None,
         last_updated_timestamp: float | None = None,
+        last_changed_timestamp: float | None = None,
     ) -> None:
         """Initialize a new state."""
-        self._cache: dict[str, Any] = {}
         state = str(state)
 
         if validate_entity_id and not valid_entity_id(entity_id):
@@ -1816,26 +1841,94 @@ class State:
             self.attributes = ReadOnlyDict(attributes or {})
         else:
             self.attributes = attributes
-        self.last_reported = last_reported or dt_util.utcnow()
-        self.last_updated = last_updated or self.last_reported
-        self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
         self.state_info = state_info
         self.domain, self.object_id = split_entity_id(self.entity_id)
-        # The recorder or the websocket_api will always call the timestamps,
-        # so we will set the timestamp values here to avoid the overhead of
-        # the function call in the property we know will always be called.
-        last_updated = self.last_updated
+        self._attributes_json_fragment: json_fragment | None = None
+        # The timestamps are the canonical representation since the recorder
+        # and the websocket_api always use them. The datetime objects are only
+        # created when they are first accessed.
+        if last_updated_timestamp and not (
+            last_changed or last_reported or last_updated
+        ):
+            # The state machine only passes timestamps
+            self._last_changed: datetime.datetime | None = None
+            self._last_reported: datetime.datetime | None = None
+            self._last_updated: datetime.datetime | None = None
+            self.last_updated_timestamp = last_updated_timestamp
+            self.last_reported_timestamp = last_updated_timestamp
+            self.last_changed_timestamp = (
+                last_changed_timestamp or last_updated_timestamp
+            )
+            return
+        last_reported = last_reported or dt_util.utcnow()
+        last_updated = last_updated or last_reported
+        last_changed = last_changed or last_updated
+        self._last_reported = last_reported
+        self._last_updated = last_updated
+        self._last_changed = last_changed
         if not last_updated_timestamp:
             last_updated_timestamp = last_updated.timestamp()
         self.last_updated_timestamp = last_updated_timestamp
-        if self.last_changed == last_updated:
-            self._cache["last_changed_timestamp"] = last_updated_timestamp
-        # If last_reported is the same as last_updated async_set will pass
-        # the same datetime object for both values so we can use an identity
-        # check here.
-        if self.last_reported is last_updated:
-            self._cache["last_reported_timestamp"] = last_updated_timestamp
+        self.last_changed_timestamp = (
+            last_updated_timestamp
+            if last_changed == last_updated
+            else last_changed.timestamp()
+        )
+        self.last_reported_timestamp = (
+            last_updated_timestamp
+            if last_reported == last_updated
+            else last_reported.timestamp()
+        )
+
+    if not TYPE_CHECKING:
+        # The cache is only created when a cached property is first used.
+        __getattr__ = _lazy_cache_getattr
+
+    @property
+    def last_changed(self) -> datetime.datetime:
+        """Last time the state was changed."""
+        if (last_changed := self._last_changed) is None:
+            last_changed = self._last_changed = dt_util.utc_from_timestamp(
+                self.last_changed_timestamp
+            )
+        return last_changed
+
+    @last_changed.setter
+    def last_changed(self, value: datetime.datetime) -> None:
+        """Set last changed."""
+        self._last_changed = value
+        self.last_changed_timestamp = value.timestamp()
+
+    @property
+    def last_reported(self) -> datetime.datetime:
+        """Last time the state was reported."""
+        if (last_reported := self._last_reported) is None:
+            last_reported = self._last_reported = dt_util.utc_from_timestamp(
+                self.last_reported_timestamp
+            )
+        return last_reported
+
+    @last_reported.setter
+    def last_reported(self, value: datetime.datetime) -> None:
+        """Set last reported."""
+        self._last_reported = value
+        self.last_reported_timestamp = value.timestamp()
+
+    @property
+    def last_updated(self) -> datetime.datetime:
+        """Last time the state or attributes were changed."""
+        if (last_updated := self._last_updated) is None:
+            last_updated = self._last_updated = dt_util.utc_from_timestamp(
+                self.last_updated_timestamp
+            )
+        return last_updated
+
+    @last_updated.setter
+    def last_updated(self, value: datetime.datetime) -> None:
+        """Set last updated."""
+        self._last_updated = value
+        self.last_updated_timestamp = value.timestamp()
 
     @under_cached_property
     def name(self) -> str:
@@ -1844,16 +1937,6 @@ class State:
             "_", " "
         )
 
-    @under_cached_property
-    def last_changed_timestamp(self) -> float:
-        """Timestamp of last change."""
-        return self.last_changed.timestamp()
-
-    @under_cached_property
-    def last_reported_timestamp(self) -> float:
-        """Timestamp of last report."""
-        return self.last_reported.timestamp()
-
     @under_cached_property
     def _as_dict(self) -> dict[str, Any]:
         """Return a dict representation of the State.
@@ -1862,11 +1945,12 @@ class State:
         as it will mutate the cached version.
         """
         last_changed_isoformat = self.last_changed.isoformat()
-        if self.last_changed == self.last_updated:
+        last_changed_timestamp = self.last_changed_timestamp
+        if last_changed_timestamp == self.last_updated_timestamp:
             last_updated_isoformat = last_changed_isoformat
         else:
             last_updated_isoformat = self.last_updated.isoformat()
-        if self.last_changed == self.last_reported:
+        if last_changed_timestamp == self.last_reported_timestamp:
             last_reported_isoformat = last_changed_isoformat
         else:
             last_reported_isoformat = self.last_reported.isoformat()
@@ -1910,10 +1994,25 @@ class State:
             as_dict["context"] = ReadOnlyDict(context)
         return ReadOnlyDict(as_dict)
 
+    @property
+    def attributes_json_fragment(self) -> json_fragment:
+        """Return a JSON fragment of the attributes.
+
+        The fragment is shared with the next state when the
+        attributes do not change.
+        """
+        if (fragment := self._attributes_json_fragment) is None:
+            fragment = self._attributes_json_fragment = json_fragment(
+                json_bytes(self.attributes)
+            )
+        return fragment
+
     @under_cached_property
     def as_dict_json(self) -> bytes:
         """Return a JSON string of the State."""
-        return json_bytes(self._as_dict)
+        return json_bytes(
+            {**self._as_dict, "attributes": self.attributes_json_fragment}
+        )
 
     @under_cached_property
     def json_fragment(self) -> json_fragment:
@@ -1942,7 +2041,7 @@ class State:
             COMPRESSED_STATE_CONTEXT: context,
             COMPRESSED_STATE_LAST_CHANGED: self.last_changed_timestamp,
         }
-        if self.last_changed != self.last_updated:
+        if self.last_changed_timestamp != self.last_updated_timestamp:
             compressed_state[COMPRESSED_STATE_LAST_UPDATED] = (
                 self.last_updated_timestamp
             )
@@ -1956,7 +2055,14 @@ class State:
 
         It is used for sending multiple states in a single message.
         """
-        return json_bytes({self.entity_id: self.as_compressed_state})[1:-1]
+        return json_bytes(
+            {
+                self.entity_id: {
+                    **self.as_compressed_state,
+                    COMPRESSED_STATE_ATTRIBUTES: self.attributes_json_fragment,
+                }
+            }
+        )[1:-1]
 
     @classmethod
     def from_dict(cls, json_dict: dict[str, Any]) -> Self | None:
@@ -2025,14 +2131,16 @@ class State:
 class States(UserDict[str, State]):
     """Container for states, maps entity_id -> State.
 
-    Maintains an additional index:
+    Maintains additional indexes:
     - domain -> dict[str, State]
+    - device_class -> dict[str, State]
     """
 
     def __init__(self) -> None:
         """Initialize the container."""
         super().__init__()
         self._domain_index: defaultdict[str, dict[str, State]] = defaultdict(dict)
+        self._device_class_index: defaultdict[str, dict[str, State]] = defaultdict(dict)
 
     def values(self) -> ValuesView[State]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -2040,15 +2148,34 @@ class States(UserDict[str, State]):
 
     def __setitem__(self, key: str, entry: State) -> None:
         """Add an item."""
-        self.data[key] = entry
+        data = self.data
+        if (old_entry := data.get(key)) is not None and (
+            old_entry.attributes is not entry.attributes
+        ):
+            self._unindex_device_class(old_entry)
+        data[key] = entry
         self._domain_index[entry.domain][entry.entity_id] = entry
+        device_class = entry.attributes.get(ATTR_DEVICE_CLASS)
+        if isinstance(device_class, str):
+            self._device_class_index[device_class][entry.entity_id] = entry
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
         del self._domain_index[entry.domain][entry.entity_id]
+        self._unindex_device_class(entry)
         super().__delitem__(key)
 
+    def _unindex_device_class(self, entry: State) -> None:
+        """Remove a state from the device class index."""
+        device_class = entry.attributes.get(ATTR_DEVICE_CLASS)
+        if not isinstance(device_class, str):
+            return
+        index = self._device_class_index[device_class]
+        del index[entry.entity_id]
+        if not index:
+            del self._device_class_index[device_class]
+
     def domain_entity_ids(self, key: str) -> KeysView[str] | tuple[()]:
         """Get all entity_ids for a domain."""
         # Avoid polluting _domain_index with non-existing domains
@@ -2063,6 +2190,13 @@ class States(UserDict[str, State]):
             return ()
         return self._domain_index[key].values()
 
+    def device_class_states(self, key: str) -> ValuesView[State] | tuple[()]:
+        """Get all states for a device class."""
+        # Avoid polluting _device_class_index with non-existing device classes
+        if key not in self._device_class_index:
+            return ()
+        return self._device_class_index[key].values()
+
 
 class StateMachine:
     """Helper class that tracks the state of different entities."""
@@ -2148,6 +2282,33 @@ class StateMachine:
             states.extend(self._states.domain_states(domain))
         return states
 
+    @callback
+    def async_all_for_device_class(
+        self,
+        device_class: str | Iterable[str],
+        domain_filter: str | Iterable[str] | None = None,
+    ) -> list[State]:
+        """Create a list of all states with the device class matching the filter.
+
+        The device class is taken from the device_class state attribute.
+
+        This method must be run in the event loop.
+        """
+        device_classes = (
+            (device_class,) if isinstance(device_class, str) else device_class
+        )
+        states: list[State] = []
+        for device_class_ in device_classes:
+            states.extend(self._states.device_class_states(device_class_))
+        if domain_filter is None:
+            return states
+        domains = (
+            {domain_filter.lower()}
+            if isinstance(domain_filter, str)
+            else set(domain_filter)
+        )
+        return [state for state in states if state.domain in domains]
+
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
 
@@ -2314,24 +2475,13 @@ class StateMachine:
             old_state = None
             same_state = False
             same_attr = False
-            last_changed = None
+            last_changed_timestamp = None
         else:
             same_state = old_state.state == new_state and not force_update
             same_attr = old_state.attributes == attributes
-            last_changed = old_state.last_changed if same_state else None
-
-        # It is much faster to convert a timestamp to a utc datetime object
-        # than converting a utc datetime object to a timestamp since cpython
-        # does not have a fast path for handling the UTC timezone and has to do
-        # multiple local timezone conversions.
-        #
-        # from_timestamp implementation:
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L2936
-        #
-        # timestamp implementation:
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
-        now = dt_util.utc_from_timestamp(timestamp)
+            last_changed_timestamp = (
+                old_state.last_changed_timestamp if same_state else None
+            )
 
         if context is None:
             context = Context(id=ulid_at_time(timestamp))
@@ -2339,8 +2489,9 @@ class StateMachine:
         if same_state and same_attr:
             # mypy does not understand this is only possible if old_state is not None
             old_last_reported = old_state.last_reported  # type: ignore[union-attr]
-            old_state.last_reported = now  # type: ignore[union-attr]
-            old_state._cache["last_reported_timestamp"] = timestamp  # type: ignore[union-attr] # noqa: SLF001
+            # The new datetime is only created if something asks for it
+            old_state._last_reported = None  # type: ignore[union-attr] # noqa: SLF001
+            old_state.last_reported_timestamp = timestamp  # type: ignore[union-attr]
             # Avoid creating an EventStateReportedData
             self._bus.async_fire_internal(  # type: ignore[misc]
                 EVENT_STATE_REPORTED,
@@ -2365,14 +2516,18 @@ class StateMachine:
             entity_id,
             new_state,
             attributes,
-            last_changed,
-            now,
-            now,
+            None,
+            None,
+            None,
             context,
             old_state is None,
             state_info,
             timestamp,
+            last_changed_timestamp,
         )
+        if same_attr:
+            # Share the serialized attributes with the new state
+            state._attributes_json_fragment = old_state._attributes_json_fragment  # type: ignore[union-attr] # noqa: SLF001
         if old_state is not None:
             old_state.expire()
         self._states[entity_id] = state
@@ -1359,22 +1359,147 @@ def is_entity_service_schema(validator: VolSchemaType) -> bool:
     return False
 
 
+_TARGET_ID_FIELDS = (ATTR_DEVICE_ID, ATTR_AREA_ID, ATTR_FLOOR_ID, ATTR_LABEL_ID)
+_TARGET_FIELD_KEYS = frozenset((ATTR_ENTITY_ID, *_TARGET_ID_FIELDS))
+
+
+def _static_entity_ids(value: Any, allow_uuid: bool) -> str | list[str] | None:
+    """Validate static entity IDs without going through voluptuous.
+
+    Returns None if the value needs to be validated by the full schema, either
+    because it is invalid or because it may contain templates.
+    """
+    if isinstance(value, str):
+        lower_value = value.lower()
+        if lower_value in (ENTITY_MATCH_ALL, ENTITY_MATCH_NONE):
+            return lower_value
+        value = [ent_id.strip() for ent_id in value.split(",")]
+    elif not isinstance(value, list):
+        return None
+
+    validated: list[str] = []
+    for ent_id in value:
+        if not isinstance(ent_id, str):
+            return None
+        if valid_entity_id(lower_ent_id := ent_id.lower()):
+            validated.append(lower_ent_id)
+        elif allow_uuid and _FAKE_UUID_4_HEX.match(ent_id):
+            validated.append(ent_id)
+        else:
+            return None
+    return validated
+
+
+def _static_target_ids(value: Any) -> str | list[str] | None:
+    """Validate static device, area, floor or label IDs without voluptuous.
+
+    Returns None if the value needs to be validated by the full schema.
+    """
+    if isinstance(value, str):
+        if value == ENTITY_MATCH_NONE:
+            return value
+        value = [value]
+    elif not isinstance(value, list):
+        return None
+
+    for target_id in value:
+        if not isinstance(target_id, str) or template_helper.is_template_string(
+            target_id
+        ):
+            return None
+    return list(value)
+
+
+def _static_target_fields(
+    value: dict, allow_uuid: bool, rest: dict | None
+) -> dict | None:
+    """Validate static target fields without going through voluptuous.
+
+    Keys which are not target fields are collected in rest, if rest is None
+    they are not allowed. Returns None if the value needs to be validated by
+    the full schema.
+    """
+    validated: dict[str, Any] = {}
+    for key, val in value.items():
+        if key == ATTR_ENTITY_ID:
+            if (entity_ids := _static_entity_ids(val, allow_uuid)) is None:
+                return None
+            validated[key] = entity_ids
+        elif key in _TARGET_ID_FIELDS:
+            if (target_ids := _static_target_ids(val)) is None:
+                return None
+            validated[key] = target_ids
+        elif rest is None:
+            return None
+        else:
+            rest[key] = val
+    return validated
+
+
+class _EntityServiceSchema(vol.All):
+    """Entity service schema with a fast path for static targets.
+
+    Service calls targeting static entity, device, area, floor or label IDs
+    are validated by specialized code. Other calls, including all invalid
+    ones, are validated by voluptuous to get the usual error reporting.
+    """
+
+    _entity_service_schema = True
+
+    def __init__(self, schema: dict, extra: int) -> None:
+        """Initialize the schema."""
+        super().__init__(
+            vol.Schema(
+                {
+                    # The frontend stores data here. Don't use in core.
+                    vol.Remove("metadata"): dict,
+                    **schema,
+                    **ENTITY_SERVICE_FIELDS,
+                },
+                extra=extra,
+            ),
+            _HAS_ENTITY_SERVICE_FIELD,
+        )
+        self._extra = extra
+        self._fast_path = all(
+            isinstance(name := key.schema if isinstance(key, vol.Marker) else key, str)
+            and name not in _TARGET_FIELD_KEYS
+            and name != "metadata"
+            for key in schema
+        )
+        self._fields_schema = vol.Schema(schema, extra=extra) if schema else None
+
+    def _exec(self, funcs: Any, v: Any, path: list[Hashable] | None = None) -> Any:
+        """Validate the service data, trying the fast path first."""
+        if self._fast_path and (validated := self._validate_static(v)) is not None:
+            return validated
+        return super()._exec(funcs, v, path)  # type: ignore[no-untyped-call]
+
+    def _validate_static(self, value: Any) -> dict | None:
+        """Validate service data with static targets."""
+        if not isinstance(value, dict):
+            return None
+        rest: dict[str, Any] = {}
+        if not (targets := _static_target_fields(value, False, rest)):
+            return None
+        if "metadata" in rest and not isinstance(rest.pop("metadata"), dict):
+            return None
+        if self._fields_schema is not None:
+            try:
+                rest = self._fields_schema(rest)
+            except vol.Invalid:
+                return None
+        elif rest:
+            if self._extra == vol.PREVENT_EXTRA:
+                return None
+            if self._extra == vol.REMOVE_EXTRA:
+                rest = {}
+        return {**rest, **targets}
+
+
 def _make_entity_service_schema(schema: dict, extra: int) -> VolSchemaType:
     """Create an entity service schema."""
-    validator = vol.All(
-        vol.Schema(
-            {
-                # The frontend stores data here. Don't use in core.
-                vol.Remove("metadata"): dict,
-                **schema,
-                **ENTITY_SERVICE_FIELDS,
-            },
-            extra=extra,
-        ),
-        _HAS_ENTITY_SERVICE_FIELD,
-    )
-    setattr(validator, "_entity_service_schema", True)
-    return validator
+    return _EntityServiceSchema(schema, extra)
 
 
 BASE_ENTITY_SCHEMA = _make_entity_service_schema({}, vol.PREVENT_EXTRA)
@@ -1450,6 +1575,21 @@ def _backward_compat_service_schema(value: Any | None) -> Any:
     return value
 
 
+_TARGET_SERVICE_FIELDS_OR_TEMPLATE_SCHEMA = vol.Schema(
+    vol.Any(TARGET_SERVICE_FIELDS, dynamic_template)
+)
+
+
+def _target_service_fields_or_template(value: Any) -> Any:
+    """Validate a service action target, trying the fast path for static targets."""
+    if (
+        isinstance(value, dict)
+        and (validated := _static_target_fields(value, True, None)) is not None
+    ):
+        return validated
+    return _TARGET_SERVICE_FIELDS_OR_TEMPLATE_SCHEMA(value)
+
+
 SERVICE_SCHEMA = vol.All(
     _backward_compat_service_schema,
     vol.Schema(
@@ -1468,7 +1608,7 @@ SERVICE_SCHEMA = vol.All(
                 template, vol.All(dict, template_complex)
             ),
             vol.Optional(CONF_ENTITY_ID): comp_entity_ids,
-            vol.Optional(CONF_TARGET): vol.Any(TARGET_SERVICE_FIELDS, dynamic_template),
+            vol.Optional(CONF_TARGET): _target_service_fields_or_template,
             vol.Optional(CONF_RESPONSE_VARIABLE): str,
             # The frontend stores data here. Don't use in core.
             vol.Remove("metadata"): dict,
@@ -45,6 +45,7 @@ from homeassistant.core import (
     HassJobType,
     HomeAssistant,
     ReleaseChannel,
+    State,
     callback,
     get_hassjob_callable_job_type,
     get_release_channel,
@@ -324,6 +325,8 @@ class CachedProperties(type):
                 o.__dict__.pop(name, None)
                 # Delete the __attr_ attribute
                 delattr(o, private_attr_name)
+                # Mark the state as changed for entities tracking changes
+                o._state_dirty = True  # noqa: SLF001
 
             return _deleter
 
@@ -342,6 +345,8 @@ class CachedProperties(type):
                 setattr(o, private_attr_name, val)
                 # Invalidate the cache of the cached property
                 o.__dict__.pop(name, None)
+                # Mark the state as changed for entities tracking changes
+                o._state_dirty = True  # noqa: SLF001
 
             return _setter
 
@@ -475,6 +480,20 @@ class Entity(
     # to be writable. This is used to avoid repeated checks.
     _verified_state_writable = False
 
+    # Set to True by entities whose state and attributes only depend on _attr_
+    # attributes of cached properties, and not on values mutated in place or
+    # computed in overridden properties. Writing the state of such an entity
+    # skips calculating it when none of them was assigned a different value
+    # since the last write, the state is then only reported again.
+    _state_change_tracking = False
+
+    # If an _attr_ attribute of a cached property changed since the state
+    # was last written
+    _state_dirty = True
+
+    # The state last written by an entity tracking changes
+    __written_state: State | None = None
+
     # Process updates in parallel
     parallel_updates: asyncio.Semaphore | None = None
 
@@ -1125,6 +1144,29 @@ class Entity(
                 )
             return
 
+        if self._state_change_tracking:
+            if (
+                not self._state_dirty
+                and self._context_set is None
+                and (written_state := self.__written_state) is not None
+                and hass.states.get(entity_id) is written_state
+                and not self.force_update
+            ):
+                # Nothing changed since the last write
+                hass.states.async_set_internal(
+                    entity_id,
+                    written_state.state,
+                    written_state.attributes,
+                    False,
+                    self._context,
+                    self._state_info,
+                    timer(),
+                )
+                return
+            # Cleared before calculating the state so changes made while
+            # writing it mark it dirty again
+            self._state_dirty = False
+
         state_calculate_start = timer()
         state, attr, capabilities, original_device_class, supported_features = (
             self.__async_calculate_state()
@@ -1222,6 +1264,8 @@ class Entity(
             hass.states.async_set(
                 entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
             )
+        if self._state_change_tracking:
+            self.__written_state = hass.states.get(entity_id)
 
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
@@ -1515,6 +1559,9 @@ class Entity(
         if "device_id" in data["changes"]:
             self._async_subscribe_device_updates()
 
+        # Registry settings like name and icon override the state attributes
+        self._state_dirty = True
+
         ent_reg = er.async_get(self.hass)
         old = self.registry_entry
         registry_entry = ent_reg.async_get(data["entity_id"])
@@ -1565,6 +1612,8 @@ class Entity(
             return
 
         self.device_entry = dr.async_get(self.hass).async_get(data["device_id"])
+        # The device name is part of the friendly name
+        self._state_dirty = True
         self.async_write_ha_state()
 
     @callback
@@ -19,6 +19,7 @@ from homeassistant.core import (
     CALLBACK_TYPE,
     DOMAIN as HOMEASSISTANT_DOMAIN,
     CoreState,
+    EntityServiceResponse,
     HomeAssistant,
     ServiceCall,
     SupportsResponse,
@@ -47,7 +48,15 @@ from . import (
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
 from .event import async_call_later
 from .issue_registry import IssueSeverity, async_create_issue
-from .typing import UNDEFINED, ConfigType, DiscoveryInfoType, VolDictType, VolSchemaType
+from .polling import PollingRegistration, async_get_polling_scheduler
+from .typing import (
+    UNDEFINED,
+    ConfigType,
+    DiscoveryInfoType,
+    UndefinedType,
+    VolDictType,
+    VolSchemaType,
+)
 
 if TYPE_CHECKING:
     from .entity import Entity
@@ -70,6 +79,11 @@ PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
 _LOGGER = getLogger(__name__)
 
+type EntityServiceBatchHandler = Callable[
+    [list[Entity], dict[str, Any]],
+    Coroutine[Any, Any, EntityServiceResponse | None],
+]
+
 
 class AddEntitiesCallback(Protocol):
     """Protocol type for EntityPlatform.add_entities callback."""
@@ -150,12 +164,17 @@ class EntityPlatform:
         self._setup_complete = False
         # Method to cancel the state change listener
         self._async_polling_timer: asyncio.TimerHandle | None = None
+        self._poll_registration: PollingRegistration | None = None
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
 
         self.parallel_updates: asyncio.Semaphore | None = None
+        self._parallel_updates_override: int | None | UndefinedType = UNDEFINED
         self._update_in_sequence: bool = False
+        # Handlers called with all targeted entities of this platform at once
+        # instead of calling an entity service method on each entity
+        self.entity_service_batch_handlers: dict[str, EntityServiceBatchHandler] = {}
 
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
@@ -209,7 +228,10 @@ class EntityPlatform:
 
         self.parallel_updates_created = True
 
-        parallel_updates = getattr(self.platform, "PARALLEL_UPDATES", None)
+        if self._parallel_updates_override is not UNDEFINED:
+            parallel_updates = self._parallel_updates_override
+        else:
+            parallel_updates = getattr(self.platform, "PARALLEL_UPDATES", None)
 
         if parallel_updates is None and entity_has_sync_update:
             parallel_updates = 1
@@ -223,6 +245,34 @@ class EntityPlatform:
 
         return self.parallel_updates
 
+    @callback
+    def async_set_parallel_updates(self, parallel_updates: int | None) -> None:
+        """Set the number of parallel updates and service calls of the platform.
+
+        This overrides PARALLEL_UPDATES of the platform module, which allows
+        integrations to configure the limit per config entry. It must be called
+        before the first entity is added.
+        """
+        if self.parallel_updates_created:
+            raise HomeAssistantError(
+                "Parallel updates can only be set before entities are added"
+            )
+        self._parallel_updates_override = parallel_updates
+
+    @callback
+    def async_register_entity_service_batch_handler(
+        self, func: str, handler: EntityServiceBatchHandler
+    ) -> None:
+        """Register a handler for an entity service method of the platform.
+
+        When an entity service targets entities of this platform, the handler
+        is called once with all of them and the service data, instead of
+        calling the method named func on each entity. This allows a single
+        command to be sent for a group of entities, for example a light group
+        of a hub. The handler may return a response per entity ID.
+        """
+        self.entity_service_batch_handlers[func] = handler
+
     async def async_setup(
         self,
         platform_config: ConfigType,
@@ -663,28 +713,41 @@ class EntityPlatform:
         ):
             return
 
-        self._async_polling_timer = self.hass.loop.call_later(
-            self.scan_interval_seconds,
+        self._poll_registration = async_get_polling_scheduler(self.hass).async_register(
+            f"{self.domain}.{self.platform_name}", self.scan_interval_seconds
+        )
+        self._async_schedule_poll()
+
+    @callback
+    def _async_schedule_poll(self) -> None:
+        """Schedule the next poll on the phase assigned by the polling scheduler."""
+        if TYPE_CHECKING:
+            assert self._poll_registration is not None
+        loop = self.hass.loop
+        self._async_polling_timer = loop.call_at(
+            self._poll_registration.async_next_poll(loop.time()),
             self._async_handle_interval_callback,
         )
 
     @callback
     def _async_handle_interval_callback(self) -> None:
         """Update all the entity states in a single platform."""
-        self._async_polling_timer = self.hass.loop.call_later(
-            self.scan_interval_seconds,
-            self._async_handle_interval_callback,
-        )
+        if TYPE_CHECKING:
+            assert self._poll_registration is not None
+        registration = self._poll_registration
+        # Capture the time this poll was due before scheduling the next one
+        due = registration.next_poll
+        self._async_schedule_poll()
         if self.config_entry:
             self.config_entry.async_create_background_task(
                 self.hass,
-                self._async_update_entity_states(),
+                registration.async_run(self._async_update_entity_states, due),
                 name=f"EntityPlatform poll {self.domain}.{self.platform_name}",
                 eager_start=True,
             )
         else:
             self.hass.async_create_background_task(
-                self._async_update_entity_states(),
+                registration.async_run(self._async_update_entity_states, due),
                 name=f"EntityPlatform poll {self.domain}.{self.platform_name}",
                 eager_start=True,
             )
@@ -948,6 +1011,9 @@ class EntityPlatform:
         if self._async_polling_timer is not None:
             self._async_polling_timer.cancel()
             self._async_polling_timer = None
+        if self._poll_registration is not None:
+            self._poll_registration.async_unregister()
+            self._poll_registration = None
 
     @callback
     def async_prepare(self) -> None:
@@ -10,6 +10,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import partial, wraps
 import logging
+import math
 from random import randint
 import time
 from typing import TYPE_CHECKING, Any, Concatenate, Generic, TypeVar
@@ -75,6 +76,10 @@ _TRACK_ENTITY_REGISTRY_UPDATED_DATA: HassKey[
 _TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventDeviceRegistryUpdatedData]
 ] = HassKey("track_device_registry_updated_data")
+_TIMER_WHEELS: HassKey[dict[bool, _TimerWheel]] = HassKey("timer_wheels")
+_NEXT_TIME_EXPRESSION_CACHE: HassKey[
+    dict[tuple[Any, ...], tuple[float, float, datetime]]
+] = HassKey("next_time_expression_cache")
 
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
@@ -89,6 +94,10 @@ _LOGGER = logging.getLogger(__name__)
 RANDOM_MICROSECOND_MIN = 50000
 RANDOM_MICROSECOND_MAX = 500000
 
+# Time trackers due within the same tick (in seconds) share one loop wakeup
+TIMER_WHEEL_TICK = 0.001
+MAX_NEXT_TIME_EXPRESSION_CACHE_SIZE = 256
+
 _TypedDictT = TypeVar("_TypedDictT", bound=Mapping[str, Any])
 _StateEventDataT = TypeVar("_StateEventDataT", bound=EventStateEventData)
 
@@ -1481,19 +1490,145 @@ def async_track_point_in_time(
 track_point_in_time = threaded_listener_factory(async_track_point_in_time)
 
 
+class _TimerWheel:
+    """Schedule time trackers on shared loop timers.
+
+    Trackers are grouped into ticks of TIMER_WHEEL_TICK seconds. Each occupied
+    tick holds a single loop TimerHandle, so all trackers due in the same tick
+    are run from one wakeup instead of each keeping their own TimerHandle.
+    """
+
+    __slots__ = ("_handles", "_job", "_loop", "_running", "_ticks")
+
+    def __init__(self, hass: HomeAssistant, cancel_on_shutdown: bool) -> None:
+        """Initialize the timer wheel."""
+        self._loop = hass.loop
+        self._ticks: dict[int, dict[int, _TimerWheelEntry]] = {}
+        self._handles: dict[int, asyncio.TimerHandle] = {}
+        self._running: dict[int, _TimerWheelEntry] = {}
+        # Home Assistant cancels timer handles carrying a job marked
+        # cancel_on_shutdown when it stops
+        self._job: HassJob[[int, Any], None] | None = (
+            HassJob(
+                self._async_run,
+                "timer wheel",
+                job_type=HassJobType.Callback,
+                cancel_on_shutdown=True,
+            )
+            if cancel_on_shutdown
+            else None
+        )
+
+    @callback
+    def async_schedule(self, entry: _TimerWheelEntry, when: float) -> int:
+        """Schedule an entry to run at or after loop time when.
+
+        Returns the tick the entry was added to.
+        """
+        tick = math.ceil(when / TIMER_WHEEL_TICK)
+        if (entries := self._ticks.get(tick)) is None:
+            self._ticks[tick] = entries = {}
+        if (handle := self._handles.get(tick)) is None or handle.cancelled():
+            if self._job is None:
+                handle = self._loop.call_at(
+                    tick * TIMER_WHEEL_TICK, self._async_run, tick
+                )
+            else:
+                handle = self._loop.call_at(
+                    tick * TIMER_WHEEL_TICK,
+                    partial(self._async_run, tick),
+                    self._job,
+                )
+            self._handles[tick] = handle
+        entries[id(entry)] = entry
+        return tick
+
+    @callback
+    def async_cancel(self, entry: _TimerWheelEntry, tick: int) -> None:
+        """Remove an entry from a tick."""
+        if (entries := self._ticks.get(tick)) is None:
+            # The tick may be running right now
+            self._running.pop(id(entry), None)
+            return
+        if entries.pop(id(entry), None) is not None and not entries:
+            del self._ticks[tick]
+            self._handles.pop(tick).cancel()
+
+    @callback
+    def async_entries(self) -> list[_TimerWheelEntry]:
+        """Return all scheduled entries."""
+        return [entry for entries in self._ticks.values() for entry in entries.values()]
+
+    @callback
+    def _async_run(self, tick: int, _: Any = None) -> None:
+        """Run all entries scheduled for a tick."""
+        del self._handles[tick]
+        self._running = running = self._ticks.pop(tick)
+        for key, entry in list(running.items()):
+            # Skip entries cancelled by an earlier entry in the same tick
+            if running.pop(key, None) is None:
+                continue
+            try:
+                entry()
+            except Exception as exc:  # noqa: BLE001
+                self._loop.call_exception_handler(
+                    {"message": f"Exception in callback {entry!r}", "exception": exc}
+                )
+
+
+@callback
+def _async_get_timer_wheel(
+    hass: HomeAssistant, cancel_on_shutdown: bool
+) -> _TimerWheel:
+    """Return the timer wheel for trackers with the given shutdown behavior."""
+    if (wheels := hass.data.get(_TIMER_WHEELS)) is None:
+        wheels = hass.data[_TIMER_WHEELS] = {}
+    if (wheel := wheels.get(cancel_on_shutdown)) is None:
+        wheel = wheels[cancel_on_shutdown] = _TimerWheel(hass, cancel_on_shutdown)
+    return wheel
+
+
+def _timer_integration(entry: _TimerWheelEntry) -> str:
+    """Return the integration that owns a time tracker."""
+    target: Any = (
+        entry.job.target if isinstance(entry, _TrackPointUTCTime) else entry.action
+    )
+    while isinstance(owner := getattr(target, "__self__", None), _TrackUTCTimeChange):
+        target = owner.job.target
+    if isinstance(target, partial):
+        target = target.func
+    parts = (getattr(target, "__module__", None) or "").split(".")
+    if parts[0] == "homeassistant" and len(parts) > 2 and parts[1] == "components":
+        return parts[2]
+    if parts[0] == "custom_components" and len(parts) > 1:
+        return parts[1]
+    return "homeassistant"
+
+
+@callback
+def async_get_scheduled_timer_counts(hass: HomeAssistant) -> dict[str, int]:
+    """Return the number of scheduled time trackers per integration."""
+    counts: defaultdict[str, int] = defaultdict(int)
+    for wheel in hass.data.get(_TIMER_WHEELS, {}).values():
+        for entry in wheel.async_entries():
+            counts[_timer_integration(entry)] += 1
+    return dict(counts)
+
+
 @dataclass(slots=True)
 class _TrackPointUTCTime:
     hass: HomeAssistant
     job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     utc_point_in_time: datetime
     expected_fire_timestamp: float
-    _cancel_callback: asyncio.TimerHandle | None = None
+    _wheel: _TimerWheel | None = None
+    _tick: int = 0
 
     def async_attach(self) -> None:
         """Initialize track job."""
-        loop = self.hass.loop
-        self._cancel_callback = loop.call_at(
-            loop.time() + self.expected_fire_timestamp - time.time(), self
+        self._wheel = _async_get_timer_wheel(self.hass, False)
+        self._tick = self._wheel.async_schedule(
+            self, self.hass.loop.time() + self.expected_fire_timestamp - time.time()
         )
 
     @callback
@@ -1512,18 +1647,19 @@ class _TrackPointUTCTime:
         # time.
         if (delta := (self.expected_fire_timestamp - time_tracker_timestamp())) > 0:
             _LOGGER.debug("Called %f seconds too early, rearming", delta)
-            loop = self.hass.loop
-            self._cancel_callback = loop.call_at(loop.time() + delta, self)
+            if TYPE_CHECKING:
+                assert self._wheel is not None
+            self._tick = self._wheel.async_schedule(self, self.hass.loop.time() + delta)
             return
 
         self.hass.async_run_hass_job(self.job, self.utc_point_in_time)
 
     @callback
     def async_cancel(self) -> None:
-        """Cancel the call_at."""
+        """Remove the tracker from the timer wheel."""
         if TYPE_CHECKING:
-            assert self._cancel_callback is not None
-        self._cancel_callback.cancel()
+            assert self._wheel is not None
+        self._wheel.async_cancel(self, self._tick)
 
 
 @callback
@@ -1616,37 +1752,30 @@ class _TrackTimeInterval:
     job_name: str
     action: Callable[[datetime], Coroutine[Any, Any, None] | None]
     cancel_on_shutdown: bool | None
-    _track_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
     _run_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
-    _timer_handle: asyncio.TimerHandle | None = None
+    _wheel: _TimerWheel | None = None
+    _tick: int = 0
 
     def async_attach(self) -> None:
         """Initialize track job."""
-        self._track_job = HassJob(
-            self._interval_listener,
-            self.job_name,
-            job_type=HassJobType.Callback,
-            cancel_on_shutdown=self.cancel_on_shutdown,
-        )
         self._run_job = HassJob(
             self.action,
             f"track time interval {self.seconds}",
             cancel_on_shutdown=self.cancel_on_shutdown,
         )
+        self._wheel = _async_get_timer_wheel(self.hass, bool(self.cancel_on_shutdown))
         self._schedule_timer()
 
     def _schedule_timer(self) -> None:
         """Schedule the timer."""
         if TYPE_CHECKING:
-            assert self._track_job is not None
-        hass = self.hass
-        loop = hass.loop
-        self._timer_handle = loop.call_at(
-            loop.time() + self.seconds, self._interval_listener, self._track_job
+            assert self._wheel is not None
+        self._tick = self._wheel.async_schedule(
+            self, self.hass.loop.time() + self.seconds
         )
 
     @callback
-    def _interval_listener(self, _: Any) -> None:
+    def __call__(self) -> None:
         """Handle elapsed intervals."""
         if TYPE_CHECKING:
             assert self._run_job is not None
@@ -1655,10 +1784,13 @@ class _TrackTimeInterval:
 
     @callback
     def async_cancel(self) -> None:
-        """Cancel the call_at."""
+        """Remove the tracker from the timer wheel."""
         if TYPE_CHECKING:
-            assert self._timer_handle is not None
-        self._timer_handle.cancel()
+            assert self._wheel is not None
+        self._wheel.async_cancel(self, self._tick)
+
+
+type _TimerWheelEntry = _TrackPointUTCTime | _TrackTimeInterval
 
 
 @callback
@@ -1783,6 +1915,35 @@ time_tracker_utcnow = dt_util.utcnow
 time_tracker_timestamp = time.time
 
 
+@callback
+def _async_find_next_time_expression_time(
+    hass: HomeAssistant,
+    expression_key: tuple[tuple[int, ...], ...],
+    time_match_expression: tuple[list[int], list[int], list[int]],
+    now: datetime,
+) -> datetime:
+    """Find the next time matching a time expression, with caching.
+
+    The next match only depends on the time truncated to the second, so a
+    result stays valid for every time between the time it was computed
+    for and the match itself. Trackers sharing an expression reuse it.
+    """
+    if (cache := hass.data.get(_NEXT_TIME_EXPRESSION_CACHE)) is None:
+        cache = hass.data[_NEXT_TIME_EXPRESSION_CACHE] = {}
+    now = now.replace(microsecond=0)
+    key = (expression_key, now.tzinfo)
+    # Compare timestamps, aware datetimes sharing a tzinfo are compared by
+    # wall time which ignores fold and is ambiguous when DST ends
+    timestamp = now.timestamp()
+    if (cached := cache.get(key)) is not None and cached[0] <= timestamp <= cached[1]:
+        return cached[2]
+    result = dt_util.find_next_time_expression_time(now, *time_match_expression)
+    if len(cache) >= MAX_NEXT_TIME_EXPRESSION_CACHE_SIZE:
+        cache.clear()
+    cache[key] = (timestamp, result.timestamp(), result)
+    return result
+
+
 @dataclass(slots=True)
 class _TrackUTCTimeChange:
     hass: HomeAssistant
@@ -1793,9 +1954,11 @@ class _TrackUTCTimeChange:
     listener_job_name: str
     _pattern_time_change_listener_job: HassJob[[datetime], None] | None = None
     _cancel_callback: CALLBACK_TYPE | None = None
+    _expression_key: tuple[tuple[int, ...], ...] = ()
 
     def async_attach(self) -> None:
         """Initialize track job."""
+        self._expression_key = tuple(map(tuple, self.time_match_expression))
         self._pattern_time_change_listener_job = HassJob(
             self._pattern_time_change_listener,
             self.listener_job_name,
@@ -1810,8 +1973,8 @@ class _TrackUTCTimeChange:
     def _calculate_next(self, utc_now: datetime) -> datetime:
         """Calculate and set the next time the trigger should fire."""
         localized_now = dt_util.as_local(utc_now) if self.local else utc_now
-        return dt_util.find_next_time_expression_time(
-            localized_now, *self.time_match_expression
+        return _async_find_next_time_expression_time(
+            self.hass, self._expression_key, self.time_match_expression, localized_now
         ).replace(microsecond=self.microsecond)
 
     @callback
@@ -0,0 +1,280 @@
+"""Helpers to schedule polling of coordinators and entity platforms."""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from heapq import heappop, heappush
+import math
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .singleton import singleton
+
+DATA_POLLING_SCHEDULER: HassKey[PollingScheduler] = HassKey("polling_scheduler")
+
+# Maximum number of scheduled polls that can be in flight at the same time
+MAX_CONCURRENT_POLLS = 64
+
+# Minimum delay before the next poll so a poll that fires slightly early
+# is not scheduled again for the same phase
+MIN_POLL_DELAY = 0.05
+
+# Maximum fraction of an interval a poll is moved earlier to align it with
+# its phase, so consecutive polls are always at least this close to one
+# interval apart
+MAX_PHASE_SHIFT = 0.25
+
+# Used to give each interval its own phase offset, so the first pollers of
+# different intervals do not all fire together on shared multiples
+_GOLDEN_RATIO = (1 + math.sqrt(5)) / 2
+
+# Upper bounds in seconds of the refresh duration and latency histogram buckets
+HISTOGRAM_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _spread(index: int) -> float:
+    """Return the fraction of an interval to use as phase for a slot.
+
+    Uses the base 2 van der Corput sequence (0, 1/2, 1/4, 3/4, 1/8, ...) so
+    phases stay evenly spread however many pollers share an interval.
+    """
+    fraction = 0.0
+    denominator = 1.0
+    while index:
+        denominator *= 2
+        index, remainder = divmod(index, 2)
+        fraction += remainder / denominator
+    return fraction
+
+
+def _interval_offset(interval: float) -> float:
+    """Return the fraction of an interval all phases of the interval are offset by."""
+    return (interval * _GOLDEN_RATIO) % 1
+
+
+@dataclass(slots=True)
+class PollHistogram:
+    """Histogram of poll timings in seconds."""
+
+    buckets: list[int] = field(default_factory=lambda: [0] * len(HISTOGRAM_BUCKETS))
+    overflow: int = 0
+    count: int = 0
+    total: float = 0.0
+
+    def add(self, value: float) -> None:
+        """Add a value to the histogram."""
+        self.count += 1
+        self.total += value
+        if (index := bisect_left(HISTOGRAM_BUCKETS, value)) < len(HISTOGRAM_BUCKETS):
+            self.buckets[index] += 1
+        else:
+            self.overflow += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the histogram."""
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "buckets": {
+                **{
+                    str(bound): count
+                    for bound, count in zip(
+                        HISTOGRAM_BUCKETS, self.buckets, strict=True
+                    )
+                },
+                "+Inf": self.overflow,
+            },
+        }
+
+
+@dataclass(slots=True)
+class _IntervalSlots:
+    """Phase slots handed out for an interval."""
+
+    in_use: int = 0
+    next_slot: int = 0
+    free: list[int] = field(default_factory=list)
+    # Slots shared by pollers with the same phase key and their user count
+    shared: dict[Hashable, list[int]] = field(default_factory=dict)
+
+
+class PollingRegistration:
+    """A poller registered with the polling scheduler."""
+
+    __slots__ = (
+        "_scheduler",
+        "interval",
+        "name",
+        "next_poll",
+        "phase",
+        "phase_key",
+        "refresh_duration",
+        "refresh_latency",
+        "slot",
+    )
+
+    def __init__(
+        self,
+        scheduler: PollingScheduler,
+        name: str,
+        interval: float,
+        slot: int,
+        phase_key: Hashable | None,
+    ) -> None:
+        """Initialize the registration."""
+        self._scheduler = scheduler
+        self.next_poll: float | None = None
+        self.name = name
+        self.interval = interval
+        self.phase_key = phase_key
+        self.slot = slot
+        self.phase = interval * ((_interval_offset(interval) + _spread(slot)) % 1)
+        self.refresh_duration = PollHistogram()
+        self.refresh_latency = PollHistogram()
+
+    @callback
+    def async_next_poll(self, now: float) -> float:
+        """Return the loop time of the next poll.
+
+        The next poll is one interval after the poll that is due, or after now
+        when polling is rescheduled before it, like after a manual refresh.
+        It is moved up to MAX_PHASE_SHIFT of an interval earlier to fall on
+        the phase of this poller, so pollers converge on their phase while
+        consecutive polls stay about one interval apart.
+        """
+        if (interval := self.interval) <= 0:
+            next_poll = now + MIN_POLL_DELAY
+        else:
+            if (
+                due := self.next_poll
+            ) is not None and due - MIN_POLL_DELAY <= now < due + interval:
+                latest = due + interval
+            else:
+                latest = now + interval
+            phase = self.phase
+            phase_point = (
+                phase
+                + math.floor((latest + MIN_POLL_DELAY - phase) / interval) * interval
+            )
+            next_poll = max(
+                phase_point,
+                latest - interval * MAX_PHASE_SHIFT,
+                now + MIN_POLL_DELAY,
+            )
+        self.next_poll = next_poll
+        return next_poll
+
+    async def async_run(
+        self, target: Callable[[], Awaitable[Any]], due: float | None
+    ) -> None:
+        """Run a scheduled poll within the global concurrency limit.
+
+        The latency of the poll is measured from the time it was due.
+        """
+        scheduler = self._scheduler
+        loop = scheduler.loop
+        async with scheduler.semaphore:
+            start = loop.time()
+            if due is not None:
+                self.refresh_latency.add(max(start - due, 0.0))
+            try:
+                await target()
+            finally:
+                self.refresh_duration.add(loop.time() - start)
+
+    @callback
+    def async_unregister(self) -> None:
+        """Release the phase of this poller."""
+        self._scheduler.async_release(self)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the registration."""
+        return {
+            "name": self.name,
+            "interval": self.interval,
+            "phase": self.phase,
+            "refresh_duration": self.refresh_duration.as_dict(),
+            "refresh_latency": self.refresh_latency.as_dict(),
+        }
+
+
+class PollingScheduler:
+    """Spread polls of coordinators and entity platforms.
+
+    Pollers sharing an interval get evenly spread phases within it, and the
+    number of scheduled polls running at the same time is limited.
+    """
+
+    __slots__ = ("_registrations", "_slots", "loop", "semaphore")
+
+    def __init__(
+        self, hass: HomeAssistant, max_concurrent: int = MAX_CONCURRENT_POLLS
+    ) -> None:
+        """Initialize the polling scheduler."""
+        self.loop = hass.loop
+        self.semaphore = asyncio.Semaphore(max_concurrent)
+        self._slots: dict[float, _IntervalSlots] = {}
+        self._registrations: dict[int, PollingRegistration] = {}
+
+    @callback
+    def async_register(
+        self, name: str, interval: float, phase_key: Hashable | None = None
+    ) -> PollingRegistration:
+        """Register a poller and assign it a phase.
+
+        Pollers registered with the same phase key and interval share a phase,
+        so pollers that coalesce their fetches poll at the same time.
+        """
+        if (slots := self._slots.get(interval)) is None:
+            slots = self._slots[interval] = _IntervalSlots()
+        if phase_key is not None and (shared := slots.shared.get(phase_key)):
+            slot = shared[0]
+            shared[1] += 1
+        else:
+            # Reuse the lowest released slot first to keep phases evenly spread
+            if slots.free:
+                slot = heappop(slots.free)
+            else:
+                slot = slots.next_slot
+                slots.next_slot += 1
+            slots.in_use += 1
+            if phase_key is not None:
+                slots.shared[phase_key] = [slot, 1]
+        registration = PollingRegistration(self, name, interval, slot, phase_key)
+        self._registrations[id(registration)] = registration
+        return registration
+
+    @callback
+    def async_release(self, registration: PollingRegistration) -> None:
+        """Release the phase of a poller."""
+        if self._registrations.pop(id(registration), None) is None:
+            return
+        slots = self._slots[registration.interval]
+        if (phase_key := registration.phase_key) is not None:
+            shared = slots.shared[phase_key]
+            shared[1] -= 1
+            if shared[1]:
+                return
+            del slots.shared[phase_key]
+        slots.in_use -= 1
+        if not slots.in_use:
+            del self._slots[registration.interval]
+        else:
+            heappush(slots.free, registration.slot)
+
+    @callback
+    def async_get_stats(self) -> list[dict[str, Any]]:
+        """Return the timing statistics of all registered pollers."""
+        return [registration.as_dict() for registration in self._registrations.values()]
+
+
+@callback
+@singleton(DATA_POLLING_SCHEDULER)
+def async_get_polling_scheduler(hass: HomeAssistant) -> PollingScheduler:
+    """Return the polling scheduler."""
+    return PollingScheduler(hass)
@@ -32,6 +32,7 @@ from homeassistant.const import (
 from homeassistant.core import (
     Context,
     EntityServiceResponse,
+    Event,
     HassJob,
     HassJobType,
     HomeAssistant,
@@ -68,6 +69,7 @@ from .typing import ConfigType, TemplateVarsType, VolDictType, VolSchemaType
 
 if TYPE_CHECKING:
     from .entity import Entity
+    from .entity_platform import EntityServiceBatchHandler
 
 CONF_SERVICE_ENTITY_ID = "entity_id"
 
@@ -502,7 +504,7 @@ def _has_match(ids: str | list[str] | None) -> TypeGuard[str | list[str]]:
 
 
 @bind_hass
-def async_extract_referenced_entity_ids(  # noqa: C901
+def async_extract_referenced_entity_ids(
     hass: HomeAssistant, service_call: ServiceCall, expand_group: bool = True
 ) -> SelectedEntities:
     """Extract referenced entity IDs from a service call."""
@@ -526,12 +528,154 @@ def async_extract_referenced_entity_ids(  # noqa: C901
     ):
         return selected
 
-    entities = entity_registry.async_get(hass).entities
-    dev_reg = device_registry.async_get(hass)
-    area_reg = area_registry.async_get(hass)
+    async_get_target_resolution_cache(hass).async_resolve(selector).apply(selected)
+    return selected
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class _ResolvedTarget:
+    """Devices, areas and entities resolved from a target through the registries."""
+
+    indirectly_referenced: frozenset[str]
+    missing_devices: frozenset[str]
+    missing_areas: frozenset[str]
+    missing_floors: frozenset[str]
+    missing_labels: frozenset[str]
+    referenced_devices: frozenset[str]
+    referenced_areas: frozenset[str]
+
+    def apply(self, selected: SelectedEntities) -> None:
+        """Add the resolved target to the selected entities."""
+        selected.indirectly_referenced.update(self.indirectly_referenced)
+        selected.missing_devices.update(self.missing_devices)
+        selected.missing_areas.update(self.missing_areas)
+        selected.missing_floors.update(self.missing_floors)
+        selected.missing_labels.update(self.missing_labels)
+        selected.referenced_devices.update(self.referenced_devices)
+        selected.referenced_areas.update(self.referenced_areas)
+
+
+type _TargetKey = tuple[frozenset[str], frozenset[str], frozenset[str], frozenset[str]]
+
+TARGET_RESOLUTION_CACHE: HassKey[TargetResolutionCache] = HassKey(
+    "service_target_resolution_cache"
+)
+MAX_TARGET_RESOLUTION_CACHE_SIZE = 1024
+
+_REGISTRY_UPDATED_EVENTS = (
+    area_registry.EVENT_AREA_REGISTRY_UPDATED,
+    device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+    entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+    floor_registry.EVENT_FLOOR_REGISTRY_UPDATED,
+    label_registry.EVENT_LABEL_REGISTRY_UPDATED,
+)
+
+
+class TargetResolutionCache:
+    """Cache of service call targets resolved through the registries.
+
+    Targets are keyed by their device, area, floor and label IDs. The cache is
+    cleared whenever one of the registries is updated.
+    """
+
+    __slots__ = ("hass", "_cache", "_registries", "hits", "misses", "invalidations")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache and listen for registry updates."""
+        self.hass = hass
+        self._cache: dict[_TargetKey, _ResolvedTarget] = {}
+        self._registries: tuple[Any, ...] = ()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        for event_type in _REGISTRY_UPDATED_EVENTS:
+            hass.bus.async_listen(event_type, self._async_registry_updated)
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the share of resolutions served from the cache."""
+        if not (total := self.hits + self.misses):
+            return 0.0
+        return self.hits / total
+
+    @callback
+    def async_diagnostics(self) -> dict[str, Any]:
+        """Return diagnostics for the cache."""
+        return {
+            "size": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "invalidations": self.invalidations,
+        }
+
+    @callback
+    def _async_registry_updated(self, event: Event[Any]) -> None:
+        """Clear the cache when a registry is updated."""
+        self._async_invalidate()
+
+    @callback
+    def _async_invalidate(self) -> None:
+        """Clear the cache."""
+        if self._cache:
+            self.invalidations += 1
+            self._cache.clear()
+
+    @callback
+    def async_resolve(self, selector: ServiceTargetSelector) -> _ResolvedTarget:
+        """Resolve the devices, areas and entities referenced by a target."""
+        hass = self.hass
+        registries = (
+            entity_registry.async_get(hass),
+            device_registry.async_get(hass),
+            area_registry.async_get(hass),
+            floor_registry.async_get(hass),
+            label_registry.async_get(hass),
+        )
+        if registries != self._registries:
+            # The registries have been replaced, cached results are stale
+            self._registries = registries
+            self._async_invalidate()
+
+        key = (
+            frozenset(selector.device_ids),
+            frozenset(selector.area_ids),
+            frozenset(selector.floor_ids),
+            frozenset(selector.label_ids),
+        )
+        if (resolved := self._cache.get(key)) is not None:
+            self.hits += 1
+            return resolved
+
+        self.misses += 1
+        resolved = _async_resolve_target(selector, *registries)
+        if len(self._cache) >= MAX_TARGET_RESOLUTION_CACHE_SIZE:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = resolved
+        return resolved
+
+
+@callback
+def async_get_target_resolution_cache(hass: HomeAssistant) -> TargetResolutionCache:
+    """Return the target resolution cache."""
+    if (cache := hass.data.get(TARGET_RESOLUTION_CACHE)) is None:
+        cache = hass.data[TARGET_RESOLUTION_CACHE] = TargetResolutionCache(hass)
+    return cache
+
+
+def _async_resolve_target(  # noqa: C901
+    selector: ServiceTargetSelector,
+    ent_reg: entity_registry.EntityRegistry,
+    dev_reg: device_registry.DeviceRegistry,
+    area_reg: area_registry.AreaRegistry,
+    floor_reg: floor_registry.FloorRegistry,
+    label_reg: label_registry.LabelRegistry,
+) -> _ResolvedTarget:
+    """Resolve a target through the registries."""
+    selected = SelectedEntities()
+    entities = ent_reg.entities
 
     if selector.floor_ids:
-        floor_reg = floor_registry.async_get(hass)
         for floor_id in selector.floor_ids:
             if floor_id not in floor_reg.floors:
                 selected.missing_floors.add(floor_id)
@@ -545,7 +689,6 @@ def async_extract_referenced_entity_ids(  # noqa: C901
             selected.missing_devices.add(device_id)
 
     if selector.label_ids:
-        label_reg = label_registry.async_get(hass)
         for label_id in selector.label_ids:
             if label_id not in label_reg.labels:
                 selected.missing_labels.add(label_id)
@@ -582,40 +725,47 @@ def async_extract_referenced_entity_ids(  # noqa: C901
                 for device_entry in dev_reg.devices.get_devices_for_area_id(area_id)
             )
 
-    if not selected.referenced_areas and not selected.referenced_devices:
-        return selected
-
-    # Add indirectly referenced by area
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for area_id in selected.referenced_areas
-        # The entity's area matches a targeted area
-        for entry in entities.get_entries_for_area_id(area_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if entry.entity_category is None and entry.hidden_by is None
-    )
-    # Add indirectly referenced by device
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for device_id in selected.referenced_devices
-        for entry in entities.get_entries_for_device_id(device_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if (
-            entry.entity_category is None
-            and entry.hidden_by is None
-            and (
-                # The entity's device matches a device referenced
-                # by an area and the entity
-                # has no explicitly set area
-                not entry.area_id
-                # The entity's device matches a targeted device
-                or device_id in selector.device_ids
+    if selected.referenced_areas or selected.referenced_devices:
+        # Add indirectly referenced by area
+        selected.indirectly_referenced.update(
+            entry.entity_id
+            for area_id in selected.referenced_areas
+            # The entity's area matches a targeted area
+            for entry in entities.get_entries_for_area_id(area_id)
+            # Do not add entities which are hidden or which are config
+            # or diagnostic entities.
+            if entry.entity_category is None and entry.hidden_by is None
+        )
+        # Add indirectly referenced by device
+        selected.indirectly_referenced.update(
+            entry.entity_id
+            for device_id in selected.referenced_devices
+            for entry in entities.get_entries_for_device_id(device_id)
+            # Do not add entities which are hidden or which are config
+            # or diagnostic entities.
+            if (
+                entry.entity_category is None
+                and entry.hidden_by is None
+                and (
+                    # The entity's device matches a device referenced
+                    # by an area and the entity
+                    # has no explicitly set area
+                    not entry.area_id
+                    # The entity's device matches a targeted device
+                    or device_id in selector.device_ids
+                )
             )
         )
+
+    return _ResolvedTarget(
+        frozenset(selected.indirectly_referenced),
+        frozenset(selected.missing_devices),
+        frozenset(selected.missing_areas),
+        frozenset(selected.missing_floors),
+        frozenset(selected.missing_labels),
+        frozenset(selected.referenced_devices),
+        frozenset(selected.referenced_areas),
     )
-    return selected
 
 
 @bind_hass
@@ -990,7 +1140,9 @@ async def entity_service_call(
             )
         return None
 
-    if len(entities) == 1:
+    individual, batches = _split_entity_batches(func, entities)
+
+    if len(entities) == 1 and not batches:
         # Single entity case avoids creating task
         entity = entities[0]
         single_response = await _handle_entity_call(
@@ -1004,22 +1156,39 @@ async def entity_service_call(
         return {entity.entity_id: single_response} if return_response else None
 
     # Use asyncio.gather here to ensure the returned results
-    # are in the same order as the entities list
-    results: list[ServiceResponse | BaseException] = await asyncio.gather(
+    # are in the same order as the entities and batches
+    results: list[
+        ServiceResponse | EntityServiceResponse | None | BaseException
+    ] = await asyncio.gather(
         *[
             entity.async_request_call(
                 _handle_entity_call(hass, entity, func, data, call.context)
             )
-            for entity in entities
+            for entity in individual
+        ],
+        *[
+            _handle_entity_batch_call(
+                batch_handler, batch, cast(dict, data), call.context
+            )
+            for batch_handler, batch in batches.items()
         ],
         return_exceptions=True,
     )
 
     response_data: EntityServiceResponse = {}
-    for entity, result in zip(entities, results, strict=False):
+    for entity, result in zip(individual, results, strict=False):
         if isinstance(result, BaseException):
             raise result from None
-        response_data[entity.entity_id] = result
+        response_data[entity.entity_id] = cast(ServiceResponse, result)
+
+    for batch, batch_result in zip(
+        batches.values(), results[len(individual) :], strict=True
+    ):
+        if isinstance(batch_result, BaseException):
+            raise batch_result from None
+        batch_response = cast(EntityServiceResponse | None, batch_result) or {}
+        for entity in batch:
+            response_data[entity.entity_id] = batch_response.get(entity.entity_id)
 
     tasks: list[asyncio.Task[None]] = []
 
@@ -1041,6 +1210,38 @@ async def entity_service_call(
     return response_data if return_response and response_data else None
 
 
+def _split_entity_batches(
+    func: str | HassJob, entities: list[Entity]
+) -> tuple[list[Entity], dict[EntityServiceBatchHandler, list[Entity]]]:
+    """Split entities into those called individually and batches per handler."""
+    if not isinstance(func, str):
+        return entities, {}
+    individual: list[Entity] = []
+    batches: dict[EntityServiceBatchHandler, list[Entity]] = {}
+    for entity in entities:
+        if (
+            entity.platform is not None
+            and (handlers := entity.platform.entity_service_batch_handlers)
+            and (batch_handler := handlers.get(func)) is not None
+        ):
+            batches.setdefault(batch_handler, []).append(entity)
+        else:
+            individual.append(entity)
+    return individual, batches
+
+
+async def _handle_entity_batch_call(
+    batch_handler: EntityServiceBatchHandler,
+    entities: list[Entity],
+    data: dict[str, Any],
+    context: Context,
+) -> EntityServiceResponse | None:
+    """Handle calling a batch handler for the entities of a platform."""
+    for entity in entities:
+        entity.async_set_context(context)
+    return await batch_handler(entities, data)
+
+
 async def _handle_entity_call(
     hass: HomeAssistant,
     entity: Entity,
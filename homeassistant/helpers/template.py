@@ -783,7 +783,8 @@ class Template:
     ) -> Any:
         """Render template with value exposed.
 
-        If valid JSON will expose value_json too.
+        If valid JSON will expose value_json too, unless the variables already
+        contain the parsed value_json.
 
         This method must be run in the event loop.
         """
@@ -797,10 +798,11 @@ class Template:
         variables = dict(variables or {})
         variables["value"] = value
 
-        try:  # noqa: SIM105 - suppress is much slower
-            variables["value_json"] = json_loads(value)
-        except JSON_DECODE_EXCEPTIONS:
-            pass
+        if "value_json" not in variables:
+            try:  # noqa: SIM105 - suppress is much slower
+                variables["value_json"] = json_loads(value)
+            except JSON_DECODE_EXCEPTIONS:
+                pass
 
         try:
             render_result = _render_with_context(
@@ -1080,24 +1082,42 @@ class TemplateStateBase(State):
         self._collect_state()
         return self._state.attributes
 
-    @property
-    def last_changed(self) -> datetime:  # type: ignore[override]
+    @property  # type: ignore[misc]
+    def last_changed(self) -> datetime:
         """Wrap State.last_changed."""
         self._collect_state()
         return self._state.last_changed
 
-    @property
-    def last_reported(self) -> datetime:  # type: ignore[override]
+    @property  # type: ignore[misc]
+    def last_reported(self) -> datetime:
         """Wrap State.last_reported."""
         self._collect_state()
         return self._state.last_reported
 
-    @property
-    def last_updated(self) -> datetime:  # type: ignore[override]
+    @property  # type: ignore[misc]
+    def last_updated(self) -> datetime:
         """Wrap State.last_updated."""
         self._collect_state()
         return self._state.last_updated
 
+    @property
+    def last_changed_timestamp(self) -> float:  # type: ignore[override]
+        """Wrap State.last_changed_timestamp."""
+        self._collect_state()
+        return self._state.last_changed_timestamp
+
+    @property
+    def last_reported_timestamp(self) -> float:  # type: ignore[override]
+        """Wrap State.last_reported_timestamp."""
+        self._collect_state()
+        return self._state.last_reported_timestamp
+
+    @property
+    def last_updated_timestamp(self) -> float:  # type: ignore[override]
+        """Wrap State.last_updated_timestamp."""
+        self._collect_state()
+        return self._state.last_updated_timestamp
+
     @property
     def context(self) -> Context:  # type: ignore[override]
         """Wrap State.context."""
@@ -4,12 +4,11 @@ from __future__ import annotations
 
 from abc import abstractmethod
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine, Generator
+from collections.abc import Awaitable, Callable, Coroutine, Generator, Hashable
 from datetime import datetime, timedelta
 import logging
-from random import randint
 from time import monotonic
-from typing import Any, Generic, Protocol
+from typing import Any, Generic, Protocol, cast
 import urllib.error
 
 import aiohttp
@@ -26,14 +25,21 @@ from homeassistant.exceptions import (
     ConfigEntryNotReady,
 )
 from homeassistant.util.dt import utcnow
+from homeassistant.util.hass_dict import HassKey
 
-from . import entity, event
+from . import entity
 from .debounce import Debouncer
 from .frame import report
+from .polling import PollingRegistration, async_get_polling_scheduler
 from .typing import UNDEFINED, UndefinedType
 
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
 REQUEST_REFRESH_DEFAULT_IMMEDIATE = True
+REQUEST_COALESCE_DEFAULT_WINDOW = 1
+
+DATA_COORDINATOR_GROUPS: HassKey[dict[Hashable, DataUpdateCoordinatorGroup[Any]]] = (
+    HassKey("update_coordinator_groups")
+)
 
 _DataT = TypeVar("_DataT", default=dict[str, Any])
 _DataUpdateCoordinatorT = TypeVar(
@@ -77,6 +83,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         setup_method: Callable[[], Awaitable[None]] | None = None,
         request_refresh_debouncer: Debouncer[Coroutine[Any, Any, None]] | None = None,
         always_update: bool = True,
+        group: DataUpdateCoordinatorGroup[Any] | None = None,
     ) -> None:
         """Initialize global data updater."""
         self.hass = hass
@@ -102,18 +109,19 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         # when it was already checked during setup.
         self.data: _DataT = None  # type: ignore[assignment]
 
-        # Pick a random microsecond in range 0.05..0.50 to stagger the refreshes
-        # and avoid a thundering herd.
-        self._microsecond = (
-            randint(event.RANDOM_MICROSECOND_MIN, event.RANDOM_MICROSECOND_MAX) / 10**6
-        )
-
         self._listeners: dict[CALLBACK_TYPE, tuple[CALLBACK_TYPE, object | None]] = {}
         self._unsub_refresh: CALLBACK_TYPE | None = None
+        self._poll_registration: PollingRegistration | None = None
         self._unsub_shutdown: CALLBACK_TYPE | None = None
         self._request_refresh_task: asyncio.TimerHandle | None = None
         self.last_update_success = True
         self.last_exception: Exception | None = None
+        self._refresh_in_progress = False
+
+        self.group = group
+        self._unsub_group: CALLBACK_TYPE | None = None
+        if group is not None:
+            self._unsub_group = group.async_add_member(self)
 
         if request_refresh_debouncer is None:
             request_refresh_debouncer = Debouncer(
@@ -179,15 +187,27 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         """Cancel any scheduled call, and ignore new runs."""
         self._shutdown_requested = True
         self._async_unsub_refresh()
+        self._async_unregister_polling()
         self._async_unsub_shutdown()
+        if self._unsub_group:
+            self._unsub_group()
+            self._unsub_group = None
         self._debounced_refresh.async_shutdown()
 
     @callback
     def _unschedule_refresh(self) -> None:
         """Unschedule any pending refresh since there is no longer any listeners."""
         self._async_unsub_refresh()
+        self._async_unregister_polling()
         self._debounced_refresh.async_cancel()
 
+    @callback
+    def _async_unregister_polling(self) -> None:
+        """Release the polling phase of the coordinator."""
+        if self._poll_registration:
+            self._poll_registration.async_unregister()
+            self._poll_registration = None
+
     def async_contexts(self) -> Generator[Any]:
         """Return all registered contexts."""
         yield from (
@@ -230,17 +250,30 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         # than the debouncer cooldown, this would cause the debounce to never be called
         self._async_unsub_refresh()
 
+        # The polling scheduler spreads the refreshes of all coordinators
+        # sharing an update interval evenly over that interval to avoid
+        # a thundering herd.
+        if (
+            registration := self._poll_registration
+        ) is None or registration.interval != self._update_interval_seconds:
+            if registration:
+                registration.async_unregister()
+            # Members of a group poll together so their fetches are coalesced
+            registration = self._poll_registration = async_get_polling_scheduler(
+                self.hass
+            ).async_register(
+                self.name,
+                self._update_interval_seconds,
+                self.group.identity if self.group else None,
+            )
+
         # We use loop.call_at because DataUpdateCoordinator does
         # not need an exact update interval which also avoids
         # calling dt_util.utcnow() on every update.
-        hass = self.hass
-        loop = hass.loop
-
-        next_refresh = (
-            int(loop.time()) + self._microsecond + self._update_interval_seconds
-        )
+        loop = self.hass.loop
         self._unsub_refresh = loop.call_at(
-            next_refresh, self.__wrap_handle_refresh_interval
+            registration.async_next_poll(loop.time()),
+            self.__wrap_handle_refresh_interval,
         ).cancel
 
     @callback
@@ -263,18 +296,33 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     async def _handle_refresh_interval(self, _now: datetime | None = None) -> None:
         """Handle a refresh interval occurrence."""
         self._unsub_refresh = None
+        if (registration := self._poll_registration) is None:
+            await self._async_refresh(log_failures=True, scheduled=True)
+            return
+        await registration.async_run(
+            self._async_scheduled_refresh, registration.next_poll
+        )
+
+    async def _async_scheduled_refresh(self) -> None:
+        """Refresh data on a scheduled poll."""
         await self._async_refresh(log_failures=True, scheduled=True)
 
     async def async_request_refresh(self) -> None:
         """Request a refresh.
 
-        Refresh will wait a bit to see if it can batch them.
+        Refresh will wait a bit to see if it can batch them. Requests of
+        members of a group are batched for the whole group.
         """
+        if self.group:
+            await self.group.debouncer.async_call()
+            return
         await self._debounced_refresh.async_call()
 
     async def _async_update_data(self) -> _DataT:
         """Fetch the latest data from the source."""
         if self.update_method is None:
+            if self.group:
+                return cast(_DataT, await self.group.async_fetch())
             raise NotImplementedError("Update method not implemented")
         return await self.update_method()
 
@@ -379,6 +427,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         previous_data = self.data
 
         try:
+            self._refresh_in_progress = True
             self.data = await self._async_update_data()
 
         except (TimeoutError, requests.exceptions.Timeout) as err:
@@ -458,6 +507,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
                 self.logger.info("Fetching %s data recovered", self.name)
 
         finally:
+            self._refresh_in_progress = False
             if log_timing:
                 self.logger.debug(
                     "Finished fetching %s data in %.3f seconds (success: %s)",
@@ -529,6 +579,131 @@ class TimestampDataUpdateCoordinator(DataUpdateCoordinator[_DataT]):
             self.last_update_success_time = utcnow()
 
 
+class DataUpdateCoordinatorGroup(Generic[_DataT]):
+    """Share fetches between coordinators polling the same endpoint.
+
+    Members of a group fetch their data through :meth:`async_fetch`, directly
+    or from their own update method. Fetches requested while one is in flight,
+    or within ``coalesce_window`` seconds after it finished, are served by that
+    single upstream call. The result of every upstream call is pushed to the
+    other members fetching through the group directly.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        logger: logging.Logger,
+        *,
+        identity: Hashable,
+        fetch_method: Callable[[], Awaitable[_DataT]],
+        coalesce_window: float = REQUEST_COALESCE_DEFAULT_WINDOW,
+        request_refresh_debouncer: Debouncer[Coroutine[Any, Any, None]] | None = None,
+    ) -> None:
+        """Initialize the coordinator group."""
+        self.hass = hass
+        self.logger = logger
+        self.identity = identity
+        self.fetch_method = fetch_method
+        self.coalesce_window = coalesce_window
+        self._members: list[DataUpdateCoordinator[Any]] = []
+        self._fetch_task: asyncio.Task[_DataT] | None = None
+        self._fetched_at: float | None = None
+
+        if request_refresh_debouncer is None:
+            request_refresh_debouncer = Debouncer(
+                hass,
+                logger,
+                cooldown=REQUEST_REFRESH_DEFAULT_COOLDOWN,
+                immediate=REQUEST_REFRESH_DEFAULT_IMMEDIATE,
+                function=self.async_refresh_members,
+            )
+        else:
+            request_refresh_debouncer.function = self.async_refresh_members
+
+        self.debouncer = request_refresh_debouncer
+
+    @callback
+    def async_add_member(
+        self, coordinator: DataUpdateCoordinator[Any]
+    ) -> CALLBACK_TYPE:
+        """Add a coordinator to the group."""
+        self._members.append(coordinator)
+
+        @callback
+        def remove_member() -> None:
+            """Remove the coordinator from the group."""
+            self._members.remove(coordinator)
+            if not self._members:
+                self.debouncer.async_shutdown()
+                groups = self.hass.data.get(DATA_COORDINATOR_GROUPS, {})
+                if groups.get(self.identity) is self:
+                    del groups[self.identity]
+
+        return remove_member
+
+    async def async_fetch(self) -> _DataT:
+        """Fetch data, sharing the upstream call with other members."""
+        if (task := self._fetch_task) is None or (
+            (fetched_at := self._fetched_at) is not None
+            and self.hass.loop.time() - fetched_at >= self.coalesce_window
+        ):
+            self._fetched_at = None
+            # Not started eagerly so members fanned out to see the task
+            self._fetch_task = task = self.hass.async_create_task(
+                self._async_fetch(), f"{self.identity} fetch", eager_start=False
+            )
+        # The fetch is shared, so a cancelled member must not cancel it
+        return await asyncio.shield(task)
+
+    async def _async_fetch(self) -> _DataT:
+        """Run the upstream fetch."""
+        try:
+            data = await self.fetch_method()
+        finally:
+            self._fetched_at = self.hass.loop.time()
+        # Push the data instead of refreshing the other members, a refresh
+        # started after the coalesce window would fetch and fan out again.
+        # Members with their own update method may transform the data, they
+        # get it from their own polls which share a phase with the group.
+        for member in self._members:
+            if (
+                member.update_method is None
+                and not member._refresh_in_progress  # noqa: SLF001
+                and not member._shutdown_requested  # noqa: SLF001
+            ):
+                member.async_set_updated_data(data)
+        return data
+
+    async def async_refresh_members(self) -> None:
+        """Refresh all members with a single upstream fetch."""
+        await asyncio.gather(*(member.async_refresh() for member in self._members))
+
+
+@callback
+def async_get_coordinator_group(
+    hass: HomeAssistant,
+    logger: logging.Logger,
+    *,
+    identity: Hashable,
+    fetch_method: Callable[[], Awaitable[_DataT]],
+    coalesce_window: float = REQUEST_COALESCE_DEFAULT_WINDOW,
+) -> DataUpdateCoordinatorGroup[_DataT]:
+    """Return the coordinator group for a fetch identity, creating it if needed.
+
+    The fetch method and coalesce window of the first caller are used.
+    """
+    groups = hass.data.setdefault(DATA_COORDINATOR_GROUPS, {})
+    if (group := groups.get(identity)) is None:
+        group = groups[identity] = DataUpdateCoordinatorGroup(
+            hass,
+            logger,
+            identity=identity,
+            fetch_method=fetch_method,
+            coalesce_window=coalesce_window,
+        )
+    return cast(DataUpdateCoordinatorGroup[_DataT], group)
+
+
 class BaseCoordinatorEntity[
     _BaseDataUpdateCoordinatorT: BaseDataUpdateCoordinatorProtocol
 ](entity.Entity):
@@ -4,19 +4,28 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+from collections import deque
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
 import logging
+import statistics
 from timeit import default_timer as timer
+import tracemalloc
+
+import voluptuous as vol
 
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -308,3 +317,386 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def service_call_validation(hass):
+    """Validate 10k service calls, in bursts of 1k calls per second of load."""
+    calls_per_burst = 1000
+    bursts = 10
+    count = 0
+
+    @core.callback
+    def handle_service(call):
+        """Handle service call."""
+        nonlocal count
+        count += 1
+
+    hass.services.async_register(
+        "light",
+        "turn_on",
+        handle_service,
+        cv.make_entity_service_schema(
+            {
+                vol.Optional("brightness"): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=255)
+                ),
+                vol.Optional("transition"): vol.Coerce(float),
+            }
+        ),
+    )
+    service_data = [
+        {"entity_id": "light.kitchen"},
+        {"entity_id": ["light.kitchen", "light.living_room"], "brightness": 128},
+        {"area_id": "kitchen", "transition": 2},
+        {"entity_id": "light.kitchen, light.bedroom", "brightness": 255},
+    ]
+    size = len(service_data)
+
+    start = timer()
+
+    for _ in range(bursts):
+        for idx in range(calls_per_burst):
+            await hass.services.async_call(
+                "light", "turn_on", service_data[idx % size], blocking=True
+            )
+
+    assert count == bursts * calls_per_burst
+
+    return timer() - start
+
+
+async def _write_unchanged_sensor_state(hass, state_change_tracking):
+    """Write the state of a sensor reporting the same value 10 times a second.
+
+    Simulates 10k seconds of reports.
+    """
+
+    class BenchmarkSensor(Entity):
+        """Sensor reporting the same value."""
+
+        _attr_should_poll = False
+        _attr_icon = "mdi:thermometer"
+        _attr_name = "Living room temperature"
+        _attr_unit_of_measurement = "°C"
+        _state_change_tracking = state_change_tracking
+
+        @core.callback
+        def async_report(self, value):
+            """Report a value."""
+            self._attr_state = value
+            self.async_write_ha_state()
+
+    sensor = BenchmarkSensor()
+    sensor.hass = hass
+    sensor.entity_id = "sensor.living_room_temperature"
+
+    start = timer()
+
+    for _ in range(10**4):
+        for _ in range(10):
+            sensor.async_report("21.5")
+
+    return timer() - start
+
+
+@benchmark
+async def write_unchanged_state(hass):
+    """Write an unchanged sensor state 100k times."""
+    return await _write_unchanged_sensor_state(hass, False)
+
+
+@benchmark
+async def write_unchanged_state_tracking_changes(hass):
+    """Write an unchanged sensor state 100k times while tracking changes."""
+    return await _write_unchanged_sensor_state(hass, True)
+
+
+async def _state_memory(hass, count):
+    """Measure the memory used by the state machine for count entities.
+
+    Each entity has its state set, changed and then reported again so the
+    states in the state machine look like the ones of a running instance.
+    """
+    attributes = {"unit_of_measurement": "W", "device_class": "power"}
+
+    tracemalloc.start()
+    start = timer()
+    before = tracemalloc.take_snapshot()
+
+    for idx in range(count):
+        entity_id = f"sensor.power_{idx}"
+        for value in ("0", "1", "1"):
+            hass.states.async_set(entity_id, value, attributes)
+
+    after = tracemalloc.take_snapshot()
+    runtime = timer() - start
+    tracemalloc.stop()
+
+    used = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    print(f"{count} states use {used // count} bytes per state")
+    return runtime
+
+
+@benchmark
+async def state_memory_10k(hass):
+    """Measure the memory used by 10k states."""
+    return await _state_memory(hass, 10**4)
+
+
+@benchmark
+async def state_memory_100k(hass):
+    """Measure the memory used by 100k states."""
+    return await _state_memory(hass, 10**5)
+
+
+def _statistics_samples(count):
+    """Return pseudo random sensor samples with their ages."""
+    start = dt_util.utcnow()
+    return [
+        ((idx * 7919) % 1000 / 10, start + timedelta(seconds=idx))
+        for idx in range(count)
+    ]
+
+
+@benchmark
+async def statistics_window_incremental(hass):
+    """Update statistics of a 10k sample window 1k times incrementally."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.statistics.window import SampleWindow
+
+    window = SampleWindow(10**4)
+    samples = _statistics_samples(11 * 10**3)
+    for value, age in samples[: 10**4]:
+        window.append(value, age)
+
+    start = timer()
+
+    for value, age in samples[10**4 :]:
+        window.append(value, age)
+        _ = (
+            window.mean,
+            window.median,
+            window.standard_deviation,
+            window.percentile(95),
+            window.value_max,
+        )
+
+    return timer() - start
+
+
+@benchmark
+async def statistics_window_full_scan(hass):
+    """Update statistics of a 10k sample window 1k times from all samples."""
+    states = deque(maxlen=10**4)
+    ages = deque(maxlen=10**4)
+    samples = _statistics_samples(11 * 10**3)
+    for value, age in samples[: 10**4]:
+        states.append(value)
+        ages.append(age)
+
+    start = timer()
+
+    for value, age in samples[10**4 :]:
+        states.append(value)
+        ages.append(age)
+        _ = (
+            statistics.mean(states),
+            statistics.median(states),
+            statistics.stdev(states),
+            statistics.quantiles(states, n=100, method="exclusive")[94],
+            ages[states.index(max(states))],
+        )
+
+    return timer() - start
+
+
+def _mqtt_wildcard_subscriptions(count):
+    """Return wildcard topic filters and matching topics of a device fleet."""
+    topic_filters = [
+        f"zigbee2mqtt/device_{idx}/+" if idx % 2 else f"tasmota/+/device_{idx}/#"
+        for idx in range(count)
+    ]
+    topics = [
+        f"zigbee2mqtt/device_{idx}/state"
+        if idx % 2
+        else f"tasmota/tele/device_{idx}/SENSOR"
+        for idx in range(0, count, count // 100)
+    ]
+    return topic_filters, topics
+
+
+@benchmark
+async def mqtt_topic_trie_match(hass):
+    """Match 100 topics against 10k wildcard subscriptions in a topic trie."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.topic_trie import TopicTrie
+
+    topic_filters, topics = _mqtt_wildcard_subscriptions(10**4)
+    trie = TopicTrie()
+    for topic_filter in topic_filters:
+        trie.add(topic_filter, topic_filter)
+
+    start = timer()
+
+    for topic in topics:
+        trie.match(topic)
+
+    return timer() - start
+
+
+@benchmark
+async def mqtt_topic_matcher_per_subscription(hass):
+    """Match 100 topics against 10k wildcard subscriptions one by one."""
+    # pylint: disable-next=import-outside-toplevel
+    from paho.mqtt.matcher import MQTTMatcher
+
+    topic_filters, topics = _mqtt_wildcard_subscriptions(10**4)
+    matchers = []
+    for topic_filter in topic_filters:
+        matcher = MQTTMatcher()
+        matcher[topic_filter] = True
+        matchers.append(matcher)
+
+    start = timer()
+
+    for topic in topics:
+        for matcher in matchers:
+            next(matcher.iter_match(topic), False)
+
+    return timer() - start
+
+
+def _camera_jpeg_image():
+    """Return a noisy 1080p camera image."""
+    # pylint: disable-next=import-outside-toplevel
+    import numpy as np
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.camera import Image
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.camera.img_util import TurboJPEGSingleton
+
+    if not (turbo_jpeg := TurboJPEGSingleton.instance()):
+        raise RuntimeError("libturbojpeg is required to scale camera images")
+    pixels = np.random.default_rng(0).integers(0, 256, (1080, 1920, 3), dtype=np.uint8)
+    return Image("image/jpeg", bytes(turbo_jpeg.encode(pixels)))
+
+
+@benchmark
+async def camera_scale_jpeg(hass):
+    """Scale a 1080p camera image to a thumbnail 100 times."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.camera.img_util import scale_jpeg_camera_image
+
+    image = _camera_jpeg_image()
+
+    start = timer()
+
+    for _ in range(100):
+        scale_jpeg_camera_image(image, 480, 270)
+
+    return timer() - start
+
+
+@benchmark
+async def camera_scaled_image_cache(hass):
+    """Request the thumbnail of a 1080p camera image 100 times."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.camera.img_util import ScaledImageCache
+
+    image = _camera_jpeg_image()
+    cache = ScaledImageCache(hass)
+
+    start = timer()
+
+    for _ in range(100):
+        await cache.async_scale("camera.benchmark", image, 480, 270)
+
+    return timer() - start
+
+
+def _conversation_slot_lists(count):
+    """Return English intents and slot lists of a house with many entities."""
+    # pylint: disable-next=import-outside-toplevel
+    from hassil.intents import Intents
+
+    # pylint: disable-next=import-outside-toplevel
+    from home_assistant_intents import get_intents
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.conversation.slot_index import IndexedTextSlotList
+
+    areas = ["kitchen", "bedroom", "living room", "office", "garage", "hallway"]
+    names = [
+        (name, name, {"domain": domain})
+        for idx in range(count)
+        for domain in ("light", "switch")
+        if (name := f"{areas[idx % len(areas)]} {domain} {idx}")
+    ][:count]
+    slot_lists = {
+        "area": IndexedTextSlotList.from_tuples(
+            [(area, area) for area in areas], allow_template=False
+        ),
+        "name": IndexedTextSlotList.from_tuples(names, allow_template=False),
+        "floor": IndexedTextSlotList.from_tuples(
+            [("ground floor", "ground floor"), ("first floor", "first floor")],
+            allow_template=False,
+        ),
+    }
+    return Intents.from_dict(get_intents("en")), slot_lists
+
+
+_CONVERSATION_SENTENCES = [
+    "turn on the kitchen light 12",
+    "turn off bedroom switch 1501",
+    "switch on the office light 9",
+    "set the brightness of hallway light 2995 to 50%",
+    "turn off the lights in the living room",
+    "what is the garage switch 604?",
+    "please turn on living room light 2",
+    "turn on the ground floor lights",
+]
+
+
+@benchmark
+async def conversation_recognize_indexed(hass):
+    """Recognize 8 sentences with 3k entity names narrowed down by the index."""
+    # pylint: disable-next=import-outside-toplevel
+    from hassil.recognize import recognize_all
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.conversation.slot_index import sentence_match_text
+
+    intents, slot_lists = _conversation_slot_lists(3000)
+
+    start = timer()
+
+    for sentence in _CONVERSATION_SENTENCES:
+        match_text = sentence_match_text(
+            sentence, intents.skip_words, intents.settings.ignore_whitespace
+        )
+        narrowed_slot_lists = {
+            list_name: slot_list.matching(match_text)
+            for list_name, slot_list in slot_lists.items()
+        }
+        list(recognize_all(sentence, intents, slot_lists=narrowed_slot_lists))
+
+    return timer() - start
+
+
+@benchmark
+async def conversation_recognize_full_lists(hass):
+    """Recognize 8 sentences with all 3k entity names."""
+    # pylint: disable-next=import-outside-toplevel
+    from hassil.recognize import recognize_all
+
+    intents, slot_lists = _conversation_slot_lists(3000)
+
+    start = timer()
+
+    for sentence in _CONVERSATION_SENTENCES:
+        list(recognize_all(sentence, intents, slot_lists=slot_lists))
+
+    return timer() - start
@@ -0,0 +1,175 @@
+"""Incrementally maintained aggregates of numeric values."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+import math
+
+# Every finite float is an integer multiple of 2**-1074, so sums of floats
+# can be kept exactly as integers and only rounded when they are read.
+FLOAT_SCALE = 1 << 1074
+
+
+def float_to_scaled_int(value: float) -> int:
+    """Return a finite float as an exact multiple of 2**-1074.
+
+    Dividing a sum of the returned integers by FLOAT_SCALE rounds it
+    correctly to a float.
+    """
+    numerator, denominator = value.as_integer_ratio()
+    return numerator * (FLOAT_SCALE // denominator)
+
+
+class NumericAggregate:
+    """Aggregate the numeric values of an ordered collection of members.
+
+    Setting or discarding the value of a member is a binary search in the
+    sorted values, reading the count, sum, mean, min, max, median or range
+    does not iterate over the members.
+
+    The sum and the mean are exact before being rounded to a float, they match
+    math.fsum and statistics.mean. Ties for min and max go to the member that
+    is listed first. NaN values are counted and make the sum, mean and median
+    NaN, but they are never the min or max.
+    """
+
+    __slots__ = (
+        "_members",
+        "_order",
+        "_values",
+        "_sorted",
+        "_sum",
+        "_nan",
+        "_pos_inf",
+        "_neg_inf",
+    )
+
+    def __init__(self, members: Iterable[str]) -> None:
+        """Initialize the aggregate."""
+        self._members = list(dict.fromkeys(members))
+        self._order = {member: idx for idx, member in enumerate(self._members)}
+        self._values: dict[str, float] = {}
+        self._sorted: list[tuple[float, int]] = []
+        self._sum = 0
+        self._nan = 0
+        self._pos_inf = 0
+        self._neg_inf = 0
+
+    def __len__(self) -> int:
+        """Return the number of members with a value."""
+        return len(self._values)
+
+    def __contains__(self, member: object) -> bool:
+        """Return if a member has a value."""
+        return member in self._values
+
+    def get(self, member: str) -> float | None:
+        """Return the value of a member."""
+        return self._values.get(member)
+
+    def set(self, member: str, value: float) -> None:
+        """Set the value of a member."""
+        if member in self._values:
+            self.discard(member)
+        self._values[member] = value
+        if math.isnan(value):
+            self._nan += 1
+            return
+        insort(self._sorted, (value, self._order[member]))
+        if value == math.inf:
+            self._pos_inf += 1
+        elif value == -math.inf:
+            self._neg_inf += 1
+        else:
+            self._sum += float_to_scaled_int(value)
+
+    def discard(self, member: str) -> None:
+        """Remove the value of a member if it has one."""
+        if (value := self._values.pop(member, None)) is None:
+            return
+        if math.isnan(value):
+            self._nan -= 1
+            return
+        del self._sorted[bisect_left(self._sorted, (value, self._order[member]))]
+        if value == math.inf:
+            self._pos_inf -= 1
+        elif value == -math.inf:
+            self._neg_inf -= 1
+        else:
+            self._sum -= float_to_scaled_int(value)
+
+    def clear(self) -> None:
+        """Remove the values of all members."""
+        self._values.clear()
+        self._sorted.clear()
+        self._sum = self._nan = self._pos_inf = self._neg_inf = 0
+
+    def values(self) -> list[float]:
+        """Return the values in the order of the members."""
+        values = self._values
+        return [values[member] for member in self._members if member in values]
+
+    def _non_finite_sum(self) -> float | None:
+        """Return the sum if it is not finite."""
+        if self._nan or (self._pos_inf and self._neg_inf):
+            return math.nan
+        if self._pos_inf:
+            return math.inf
+        if self._neg_inf:
+            return -math.inf
+        return None
+
+    @property
+    def sum(self) -> float:
+        """Return the sum of the values."""
+        if (non_finite := self._non_finite_sum()) is not None:
+            return non_finite
+        return self._sum / FLOAT_SCALE
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of the values."""
+        if not (count := len(self._values)):
+            return None
+        if (non_finite := self._non_finite_sum()) is not None:
+            return non_finite
+        return self._sum / (FLOAT_SCALE * count)
+
+    @property
+    def median(self) -> float | None:
+        """Return the median of the values."""
+        if not self._values:
+            return None
+        if self._nan:
+            return math.nan
+        sorted_values = self._sorted
+        middle, odd = divmod(len(sorted_values), 2)
+        if odd:
+            return sorted_values[middle][0]
+        return (sorted_values[middle - 1][0] + sorted_values[middle][0]) / 2
+
+    @property
+    def min(self) -> tuple[str, float] | None:
+        """Return the first member with the lowest value and the value."""
+        if not self._sorted:
+            return None
+        value, order = self._sorted[0]
+        return self._members[order], value
+
+    @property
+    def max(self) -> tuple[str, float] | None:
+        """Return the first member with the highest value and the value."""
+        if not (sorted_values := self._sorted):
+            return None
+        value, order = sorted_values[
+            bisect_left(sorted_values, (sorted_values[-1][0], -1))
+        ]
+        return self._members[order], value
+
+    @property
+    def range(self) -> float | None:
+        """Return the difference between the highest and the lowest value."""
+        if not (sorted_values := self._sorted):
+            return None
+        return sorted_values[-1][0] - sorted_values[0][0]
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterator
+from collections.abc import Callable
+from dataclasses import dataclass, field
 import fnmatch
 from io import StringIO, TextIOWrapper
 import logging
 import os
 from pathlib import Path
+import threading
+import time
 from typing import Any, TextIO, overload
 
+from lru import LRU
 import yaml
 
 try:
@@ -36,6 +40,134 @@ JSON_TYPE = list | dict | str
 
 _LOGGER = logging.getLogger(__name__)
 
+# Files modified less than this long ago are not cached, since a second
+# write within the file system timestamp granularity would go unnoticed.
+_RACY_MTIME_WINDOW_NS = 2 * 1_000_000_000
+
+type _FileStamp = tuple[int, int]
+
+
+@dataclass(slots=True)
+class _YamlDependencies:
+    """Everything a parsed YAML file depends on besides its own content."""
+
+    files: dict[str, _FileStamp] = field(default_factory=dict)
+    directories: dict[tuple[str, str], list[str]] = field(default_factory=dict)
+    secrets: dict[tuple[str, str], Any] = field(default_factory=dict)
+    env_vars: dict[str, str | None] = field(default_factory=dict)
+
+    def merge(self, other: _YamlDependencies) -> None:
+        """Merge the dependencies of an included file."""
+        self.files.update(other.files)
+        self.directories.update(other.directories)
+        self.secrets.update(other.secrets)
+        self.env_vars.update(other.env_vars)
+
+    def is_racy(self, now_ns: int) -> bool:
+        """Return if any of the files was modified too recently to be cached."""
+        return any(
+            now_ns - mtime_ns < _RACY_MTIME_WINDOW_NS
+            for mtime_ns, _ in self.files.values()
+        )
+
+    def is_valid(self, secrets: Secrets | None) -> bool:
+        """Return if the dependencies are unchanged."""
+        for fname, stamp in self.files.items():
+            if _file_stamp(fname) != stamp:
+                return False
+        for (directory, pattern), fnames in self.directories.items():
+            if _walk_files(directory, pattern) != fnames:
+                return False
+        for env_var, value in self.env_vars.items():
+            if os.environ.get(env_var) != value:
+                return False
+        if self.secrets:
+            if secrets is None:
+                return False
+            for (requester, secret), value in self.secrets.items():
+                try:
+                    if secrets.get(requester, secret) != value:
+                        return False
+                except HomeAssistantError:
+                    return False
+        return True
+
+
+@dataclass(slots=True)
+class _YamlCacheEntry:
+    """A parsed YAML file and what it was parsed from."""
+
+    dependencies: _YamlDependencies
+    result: JSON_TYPE | None
+
+
+# The number of parsed YAML files to keep in memory. The cache holds a copy of
+# each file, so it is bounded to the files that are loaded repeatedly.
+YAML_CACHE_SIZE = 256
+
+_YAML_CACHE: LRU[str, _YamlCacheEntry] = LRU(YAML_CACHE_SIZE)
+_LOADING = threading.local()
+
+
+def _file_stamp(fname: str) -> _FileStamp | None:
+    """Return the modification time and size of a file."""
+    try:
+        stat = os.stat(fname)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _loading_stack() -> list[_YamlDependencies]:
+    """Return the stack of files being loaded by the current thread."""
+    try:
+        return _LOADING.stack
+    except AttributeError:
+        stack: list[_YamlDependencies] = []
+        _LOADING.stack = stack
+        return stack
+
+
+def _current_dependencies() -> _YamlDependencies | None:
+    """Return the dependencies of the file currently being loaded."""
+    stack = _loading_stack()
+    return stack[-1] if stack else None
+
+
+def clear_yaml_cache() -> None:
+    """Clear the cache of parsed YAML files."""
+    _YAML_CACHE.clear()
+
+
+def _copy_node(obj: Any) -> Any:
+    """Copy the mutable containers of a parsed YAML tree.
+
+    Strings and other scalars are immutable and shared with the cache.
+    """
+    if isinstance(obj, NodeDictClass):
+        return _copy_reference(
+            obj, NodeDictClass({key: _copy_node(val) for key, val in obj.items()})
+        )
+    if isinstance(obj, NodeListClass):
+        return _copy_reference(obj, NodeListClass([_copy_node(val) for val in obj]))
+    if isinstance(obj, dict):
+        return {key: _copy_node(val) for key, val in obj.items()}
+    if isinstance(obj, list):
+        return [_copy_node(val) for val in obj]
+    return obj
+
+
+def _copy_reference[_NodeT: (NodeDictClass, NodeListClass)](
+    src: _NodeT, dst: _NodeT
+) -> _NodeT:
+    """Copy file reference information from one node class object to another."""
+    try:  # suppress is much slower
+        dst.__config_file__ = src.__config_file__
+        dst.__line__ = src.__line__
+    except AttributeError:
+        pass
+    return dst
+
 
 class YamlTypeError(HomeAssistantError):
     """Raised by load_yaml_dict if top level data is not a dict."""
@@ -223,9 +355,47 @@ def load_yaml(
 ) -> JSON_TYPE | None:
     """Load a YAML file.
 
+    Parsed files are cached by path, modification time and size, together with
+    the files, directories, secrets and environment variables they reference.
+    Unchanged files are returned from the cache without being parsed again.
+
     If opening the file raises an OSError it will be wrapped in a HomeAssistantError,
     except for FileNotFoundError which will be re-raised.
     """
+    path = os.fspath(fname)
+    parent = _current_dependencies()
+
+    if (cached := _YAML_CACHE.get(path)) is not None:
+        if cached.dependencies.is_valid(secrets):
+            if parent is not None:
+                parent.merge(cached.dependencies)
+            return _copy_node(cached.result)
+        # Another thread may have invalidated the entry already
+        _YAML_CACHE.pop(path, None)
+
+    if (stamp := _file_stamp(path)) is None:
+        # Not a regular file on disk, don't cache it
+        return _load_yaml(fname, secrets)
+
+    dependencies = _YamlDependencies(files={path: stamp})
+    stack = _loading_stack()
+    stack.append(dependencies)
+    try:
+        result = _load_yaml(fname, secrets)
+    finally:
+        stack.pop()
+
+    if parent is not None:
+        parent.merge(dependencies)
+    if not dependencies.is_racy(time.time_ns()):
+        _YAML_CACHE[path] = _YamlCacheEntry(dependencies, _copy_node(result))
+    return result
+
+
+def _load_yaml(
+    fname: str | os.PathLike[str], secrets: Secrets | None = None
+) -> JSON_TYPE | None:
+    """Load and parse a YAML file."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
             return parse_yaml(conf_file, secrets)
@@ -394,14 +564,25 @@ def _is_file_valid(name: str) -> bool:
     return not name.startswith(".")
 
 
-def _find_files(directory: str, pattern: str) -> Iterator[str]:
-    """Recursively load files in a directory."""
+def _walk_files(directory: str, pattern: str) -> list[str]:
+    """Recursively find files in a directory."""
+    found: list[str] = []
     for root, dirs, files in os.walk(directory, topdown=True):
         dirs[:] = [d for d in dirs if _is_file_valid(d)]
-        for basename in sorted(files):
-            if _is_file_valid(basename) and fnmatch.fnmatch(basename, pattern):
-                filename = os.path.join(root, basename)
-                yield filename
+        found.extend(
+            os.path.join(root, basename)
+            for basename in sorted(files)
+            if _is_file_valid(basename) and fnmatch.fnmatch(basename, pattern)
+        )
+    return found
+
+
+def _find_files(directory: str, pattern: str) -> list[str]:
+    """Recursively find files in a directory and track them as a dependency."""
+    found = _walk_files(directory, pattern)
+    if (dependencies := _current_dependencies()) is not None:
+        dependencies.directories[(directory, pattern)] = found
+    return found
 
 
 @_raise_if_no_value
@@ -529,6 +710,9 @@ def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
 
+    if (dependencies := _current_dependencies()) is not None:
+        dependencies.env_vars[args[0]] = os.environ.get(args[0])
+
     # Check for a default value
     if len(args) > 1:
         return os.getenv(args[0], " ".join(args[1:]))
@@ -543,7 +727,10 @@ def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     if loader.secrets is None:
         raise HomeAssistantError("Secrets not supported in this YAML file")
 
-    return loader.secrets.get(loader.get_name, node.value)
+    value = loader.secrets.get(loader.get_name, node.value)
+    if (dependencies := _current_dependencies()) is not None:
+        dependencies.secrets[(loader.get_name, node.value)] = value
+    return value
 
 
 def add_constructor(tag: Any, constructor: Any) -> None:
@@ -29,6 +29,7 @@ from typing import Any, Literal, NoReturn
 from unittest.mock import AsyncMock, Mock, patch
 
 from aiohttp.test_utils import unused_port as get_test_instance_port  # noqa: F401
+from lru import LRU
 import pytest
 from syrupy import SnapshotAssertion
 from typing_extensions import TypeVar
@@ -1106,6 +1107,7 @@ async def start_reauth_flow(
     )
 
 
+@contextmanager
 def patch_yaml_files(files_dict, endswith=True):
     """Patch load_yaml with a dictionary of yaml files."""
     # match using endswith, start search with longest string
@@ -1139,7 +1141,11 @@ def patch_yaml_files(files_dict, endswith=True):
         # Not found
         raise FileNotFoundError(f"File not found: {fname}")
 
-    return patch.object(yaml_loader, "open", mock_open_f, create=True)
+    with (
+        patch.object(yaml_loader, "open", mock_open_f, create=True),
+        patch.object(yaml_loader, "_YAML_CACHE", LRU(yaml_loader.YAML_CACHE_SIZE)),
+    ):
+        yield
 
 
 @contextmanager
@@ -147,6 +147,45 @@ async def test_get_image_from_camera_with_width_height_scaled(
     assert image.content == EMPTY_8_6_JPEG
 
 
+@pytest.mark.usefixtures("image_mock_url")
+async def test_get_image_scaled_cached(hass: HomeAssistant) -> None:
+    """Test a scaled image is reused while the camera returns the same image."""
+
+    turbo_jpeg = mock_turbo_jpeg()
+    turbo_jpeg.decode_header.side_effect = None
+    turbo_jpeg.decode_header.return_value = (16, 12, 0, 0)
+    with (
+        patch(
+            "homeassistant.components.camera.img_util.TurboJPEGSingleton.instance",
+            return_value=turbo_jpeg,
+        ),
+        patch(
+            "homeassistant.components.demo.camera.Path.read_bytes",
+            autospec=True,
+            return_value=b"Valid jpeg",
+        ) as mock_camera,
+    ):
+        for _ in range(2):
+            image = await camera.async_get_image(
+                hass, "camera.demo_camera", width=4, height=3
+            )
+            assert image.content == EMPTY_8_6_JPEG
+        assert turbo_jpeg.scale_with_quality.call_count == 1
+
+        # Another size is scaled separately
+        image = await camera.async_get_image(
+            hass, "camera.demo_camera", width=8, height=6
+        )
+        assert turbo_jpeg.scale_with_quality.call_count == 2
+
+        # A new image from the camera is scaled again
+        mock_camera.return_value = b"Another valid jpeg"
+        image = await camera.async_get_image(
+            hass, "camera.demo_camera", width=4, height=3
+        )
+        assert turbo_jpeg.scale_with_quality.call_count == 3
+
+
 @pytest.mark.usefixtures("image_mock_url")
 async def test_get_image_from_camera_not_jpeg(hass: HomeAssistant) -> None:
     """Grab an image from camera entity that we cannot scale."""
@@ -647,6 +686,35 @@ async def test_record_service(
         )
 
 
+@pytest.mark.usefixtures("mock_camera")
+async def test_camera_proxy_etag(hass_client: ClientSessionGenerator) -> None:
+    """Test the camera proxy answers with not modified for a known ETag."""
+    client = await hass_client()
+
+    resp = await client.get("/api/camera_proxy/camera.demo_camera")
+    assert resp.status == HTTPStatus.OK
+    assert await resp.read() == b"Test"
+    assert (etag := resp.headers["ETag"])
+
+    resp = await client.get(
+        "/api/camera_proxy/camera.demo_camera", headers={"If-None-Match": etag}
+    )
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+    assert await resp.read() == b""
+    assert resp.headers["ETag"] == etag
+
+    with patch(
+        "homeassistant.components.demo.camera.Path.read_bytes",
+        return_value=b"New image",
+    ):
+        resp = await client.get(
+            "/api/camera_proxy/camera.demo_camera", headers={"If-None-Match": etag}
+        )
+    assert resp.status == HTTPStatus.OK
+    assert await resp.read() == b"New image"
+    assert resp.headers["ETag"] != etag
+
+
 @pytest.mark.usefixtures("mock_camera")
 async def test_camera_proxy_stream(hass_client: ClientSessionGenerator) -> None:
     """Test record service."""
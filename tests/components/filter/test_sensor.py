@@ -137,7 +137,7 @@ async def test_chain_history(
 
     with (
         patch(
-            "homeassistant.components.recorder.history.state_changes_during_period",
+            "homeassistant.components.recorder.history.state_changes_during_period_for_entities",
             return_value=fake_states,
         ),
         patch(
@@ -244,7 +244,7 @@ async def test_history_time(recorder_mock: Recorder, hass: HomeAssistant) -> Non
     }
     with (
         patch(
-            "homeassistant.components.recorder.history.state_changes_during_period",
+            "homeassistant.components.recorder.history.state_changes_during_period_for_entities",
             return_value=fake_states,
         ),
         patch(
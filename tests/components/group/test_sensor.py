@@ -329,6 +329,49 @@ async def test_sensor_incorrect_state_with_not_ignore_non_numeric(
     assert state.state == "20.0"
 
 
+async def test_sensor_updates_with_unavailable_members(hass: HomeAssistant) -> None:
+    """Test the group follows members becoming unavailable and coming back."""
+    config = {
+        SENSOR_DOMAIN: {
+            "platform": GROUP_DOMAIN,
+            "name": "test_max",
+            "type": "max",
+            "ignore_non_numeric": True,
+            "entities": ["sensor.test_1", "sensor.test_2", "sensor.test_3"],
+        }
+    }
+
+    assert await async_setup_component(hass, "sensor", config)
+    await hass.async_block_till_done()
+
+    entity_ids = config["sensor"]["entities"]
+    for entity_id, value in dict(zip(entity_ids, VALUES, strict=False)).items():
+        hass.states.async_set(entity_id, value)
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.test_max")
+    assert state.state == "20.0"
+    assert state.attributes[ATTR_MAX_ENTITY_ID] == "sensor.test_2"
+
+    hass.states.async_set("sensor.test_2", STATE_UNAVAILABLE)
+    await hass.async_block_till_done()
+    state = hass.states.get("sensor.test_max")
+    assert state.state == "17.0"
+    assert state.attributes[ATTR_MAX_ENTITY_ID] == "sensor.test_1"
+
+    hass.states.async_set("sensor.test_1", STATE_UNAVAILABLE)
+    hass.states.async_set("sensor.test_3", STATE_UNAVAILABLE)
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.test_max").state == STATE_UNAVAILABLE
+
+    hass.states.async_set("sensor.test_3", "17")
+    hass.states.async_set("sensor.test_2", "17")
+    await hass.async_block_till_done()
+    state = hass.states.get("sensor.test_max")
+    assert state.state == "17.0"
+    assert state.attributes[ATTR_MAX_ENTITY_ID] == "sensor.test_2"
+
+
 async def test_sensor_require_all_states(hass: HomeAssistant) -> None:
     """Test the sum sensor with missing state require all."""
     config = {
@@ -1771,3 +1771,75 @@ async def test_variables_priority(
     await hass.async_block_till_done()
     assert len(service_calls) == 2
     assert service_calls[1].data["some"] == "test.entity_2 - 0:00:10"
+
+
+async def test_state_triggers_share_matchers(
+    hass: HomeAssistant, service_calls: list[ServiceCall]
+) -> None:
+    """Test triggers with the same configuration share one matcher."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "alias": f"to_on_{idx}",
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": "test.entity",
+                        "to": "on",
+                    },
+                    "action": {"service": "test.automation"},
+                }
+                for idx in range(3)
+            ]
+            + [
+                {
+                    "alias": "to_off",
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": ["test.entity", "test.other"],
+                        "to": ["off"],
+                    },
+                    "action": {"service": "test.automation"},
+                }
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    index = state_trigger.async_get_state_trigger_index(hass)
+    with patch.object(
+        state_trigger._StateMatcher,
+        "async_match",
+        autospec=True,
+        side_effect=state_trigger._StateMatcher.async_match,
+    ) as mock_match:
+        hass.states.async_set("test.entity", "on")
+        await hass.async_block_till_done()
+
+    assert len(service_calls) == 3
+    # One evaluation per distinct configuration, not per trigger
+    assert mock_match.call_count == 2
+
+    hass.states.async_set("test.entity", "off")
+    hass.states.async_set("test.other", "off")
+    await hass.async_block_till_done()
+    assert len(service_calls) == 5
+
+    assert index.async_get_stats() == {
+        "to_on_0": {"fired": 1, "rejected": 1},
+        "to_on_1": {"fired": 1, "rejected": 1},
+        "to_on_2": {"fired": 1, "rejected": 1},
+        "to_off": {"fired": 2, "rejected": 1},
+    }
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_MATCH_ALL},
+        blocking=True,
+    )
+    assert index.async_get_stats() == {}
+    assert not index._matchers
+    assert not index._unsub_track
@@ -250,6 +250,32 @@ async def test_all_subscriptions_run_when_decode_fails(
     assert len(recorded_calls) == 1
 
 
+async def test_subscribers_share_decoded_message(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    recorded_calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test subscribers with the same topic and encoding share the message."""
+    await mqtt_mock_entry()
+    await mqtt.async_subscribe(hass, "test-topic", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic", record_calls, encoding=None)
+    await mqtt.async_subscribe(hass, "test-topic", record_calls, encoding="ascii")
+
+    async_fire_mqtt_message(hass, "test-topic", "test-payload")
+
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 4
+    decoded = [msg for msg in recorded_calls if msg.payload == "test-payload"]
+    assert len(decoded) == 3
+    # One message per encoding
+    assert len({id(msg) for msg in decoded}) == 2
+    assert [msg.payload for msg in recorded_calls if msg not in decoded] == [
+        b"test-payload"
+    ]
+
+
 async def test_subscribe_topic(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
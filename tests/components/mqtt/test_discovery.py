@@ -40,6 +40,7 @@ from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
 )
+from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.helpers.service_info.mqtt import MqttServiceInfo
 from homeassistant.setup import async_setup_component
 from homeassistant.util.signal_type import SignalTypeFormat
@@ -570,6 +571,69 @@ async def test_non_duplicate_discovery(
     assert "Component has already been discovered: binary_sensor bla" in caplog.text
 
 
+@pytest.mark.parametrize("mqtt_config_entry_data", [ENTRY_DEFAULT_BIRTH_MESSAGE])
+async def test_unchanged_discovery_payload_is_skipped(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a retained discovery payload received again is not processed again."""
+    await mqtt_mock_entry()
+    payload = '{ "name": "Beer", "state_topic": "test-topic" }'
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", payload)
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer") is not None
+
+    # The payload is received again, for example after the broker restarted
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", payload)
+    await hass.async_block_till_done()
+    assert "Ignoring unchanged discovery payload for binary_sensor bla" in caplog.text
+    assert "Got update for" not in caplog.text
+
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/bla/config",
+        '{ "name": "Milk", "state_topic": "test-topic" }',
+    )
+    await hass.async_block_till_done()
+    assert "Got update for" in caplog.text
+    state = hass.states.get("binary_sensor.beer")
+    assert state is not None
+    assert state.name == "Milk"
+
+
+async def test_discovered_entities_added_in_batches(
+    hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
+) -> None:
+    """Test entities discovered together are added to the platform at once."""
+    await mqtt_mock_entry()
+    # Set up the platform
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/bla/config",
+        '{ "name": "Beer", "state_topic": "test-topic" }',
+    )
+    await hass.async_block_till_done()
+
+    with patch(
+        "homeassistant.helpers.entity_platform.EntityPlatform.async_add_entities",
+        autospec=True,
+        side_effect=EntityPlatform.async_add_entities,
+    ) as add_entities_mock:
+        for object_id in ("milk", "wine", "water"):
+            async_fire_mqtt_message(
+                hass,
+                f"homeassistant/binary_sensor/{object_id}/config",
+                f'{{ "name": "{object_id}", "state_topic": "test-topic" }}',
+            )
+        await hass.async_block_till_done()
+
+    assert len(add_entities_mock.mock_calls) == 1
+    assert len(add_entities_mock.mock_calls[0].args[1]) == 3
+    for object_id in ("milk", "wine", "water"):
+        assert hass.states.get(f"binary_sensor.{object_id}") is not None
+
+
 async def test_removal(
     hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
 ) -> None:
@@ -40,6 +40,7 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import (
     MockConfigEntry,
@@ -214,6 +215,43 @@ async def test_value_template_value(hass: HomeAssistant) -> None:
         assert template_state_calls.call_count == 1
 
 
+async def test_value_template_json_payload_parsed_once(hass: HomeAssistant) -> None:
+    """Test templates rendering the same payload share the parsed JSON."""
+    payload = '{"id": 4321, "name": "parsed once"}'
+    val_tpl1 = mqtt.MqttValueTemplate(
+        template.Template("{{ value_json.id }}", hass=hass)
+    )
+    val_tpl2 = mqtt.MqttValueTemplate(
+        template.Template("{{ value_json.name }}", hass=hass)
+    )
+    val_tpl3 = mqtt.MqttValueTemplate(
+        template.Template("{{ value_json is defined }}", hass=hass)
+    )
+    with (
+        patch(
+            "homeassistant.components.mqtt.models.json_loads",
+            side_effect=json_loads,
+        ) as mqtt_json_loads,
+        patch(
+            "homeassistant.helpers.template.json_loads", side_effect=json_loads
+        ) as template_json_loads,
+    ):
+        assert val_tpl1.async_render_with_possible_json_value(payload) == "4321"
+        assert val_tpl2.async_render_with_possible_json_value(payload) == "parsed once"
+        assert (
+            val_tpl3.async_render_with_possible_json_value("not json parsed once")
+            == "False"
+        )
+        assert (
+            val_tpl3.async_render_with_possible_json_value("not json parsed once")
+            == "False"
+        )
+
+    assert mqtt_json_loads.call_count == 2
+    # The template only parses the payload which is not valid JSON
+    assert template_json_loads.call_count == 2
+
+
 async def test_value_template_fails(hass: HomeAssistant) -> None:
     """Test the rendering of MQTT value template fails."""
     entity = MockEntity(entity_id="sensor.test")
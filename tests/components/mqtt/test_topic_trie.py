@@ -0,0 +1,78 @@
+"""Test the MQTT topic trie."""
+
+from paho.mqtt.matcher import MQTTMatcher
+import pytest
+
+from homeassistant.components.mqtt.topic_trie import TopicTrie
+
+TOPIC_FILTERS = [
+    "#",
+    "+",
+    "a",
+    "a/#",
+    "a/+",
+    "a/b",
+    "a/b/#",
+    "a/+/c",
+    "+/b/c",
+    "+/+/+",
+    "a//c",
+    "a/+/+/#",
+    "$SYS/#",
+    "$SYS/+/load",
+    "+/broker",
+]
+
+TOPICS = [
+    "a",
+    "b",
+    "a/b",
+    "a/b/c",
+    "a/x/c",
+    "x/b/c",
+    "a//c",
+    "a/b/c/d/e",
+    "/a",
+    "a/",
+    "",
+    "$SYS/broker",
+    "$SYS/broker/load",
+]
+
+
+@pytest.mark.parametrize("topic", TOPICS)
+def test_topic_trie_matches_like_paho(topic: str) -> None:
+    """Test the trie matches the same filters as paho."""
+    trie: TopicTrie[str] = TopicTrie()
+    for topic_filter in TOPIC_FILTERS:
+        trie.add(topic_filter, topic_filter)
+    matcher = MQTTMatcher()
+    for topic_filter in TOPIC_FILTERS:
+        matcher[topic_filter] = topic_filter
+    assert sorted(trie.match(topic)) == sorted(matcher.iter_match(topic))
+
+
+def test_topic_trie_add_remove() -> None:
+    """Test adding and removing values of topic filters."""
+    trie: TopicTrie[int] = TopicTrie()
+    trie.add("a/+/c", 1)
+    trie.add("a/+/c", 2)
+    trie.add("a/+/c", 2)
+    trie.add("a/#", 3)
+    assert len(trie) == 3
+    assert trie.match("a/b/c") == [3, 1, 2]
+
+    trie.remove("a/+/c", 1)
+    assert trie.match("a/b/c") == [3, 2]
+    trie.remove("a/+/c", 2)
+    assert trie.match("a/b/c") == [3]
+    assert len(trie) == 1
+
+    with pytest.raises(KeyError):
+        trie.remove("a/+/c", 2)
+    with pytest.raises(KeyError):
+        trie.remove("a/b", 3)
+
+    trie.remove("a/#", 3)
+    assert not trie.match("a/b/c")
+    assert len(trie) == 0
@@ -0,0 +1,39 @@
+"""The tests for the recorder state attributes manager."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder.db_schema import StateAttributes
+from homeassistant.core import HomeAssistant
+
+from ..common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+async def test_unchanged_attributes_serialized_once(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test unchanged attributes are not serialized again."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    with patch.object(
+        StateAttributes,
+        "shared_attrs_bytes_from_event",
+        wraps=StateAttributes.shared_attrs_bytes_from_event,
+    ) as serialize_mock:
+        for value in range(3):
+            hass.states.async_set("sensor.power", str(value), {"unit": "W"})
+            await async_wait_recording_done(hass)
+        assert serialize_mock.call_count == 1
+
+        hass.states.async_set("sensor.power", "4", {"unit": "kW"})
+        await async_wait_recording_done(hass)
+        assert serialize_mock.call_count == 2
+
+        hass.states.async_remove("sensor.power")
+        await async_wait_recording_done(hass)
+        assert "sensor.power" not in instance.state_attributes_manager._serialized
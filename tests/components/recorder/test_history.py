@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 from copy import copy
 from datetime import datetime, timedelta
 import json
-from unittest.mock import sentinel
+from unittest.mock import patch, sentinel
 
 from freezegun import freeze_time
 import pytest
@@ -18,6 +19,9 @@ from homeassistant.components.recorder.db_schema import (
     StatesMeta,
 )
 from homeassistant.components.recorder.filters import Filters
+from homeassistant.components.recorder.history.prefetch import (
+    async_state_changes_during_window,
+)
 from homeassistant.components.recorder.models import process_timestamp
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.core import HomeAssistant, State
@@ -928,6 +932,104 @@ async def test_state_changes_during_period_multiple_entities_single_test(
         assert hist[entity_id][0].state == value
 
 
+@pytest.mark.parametrize(
+    ("descending", "limit", "expected_values"),
+    [
+        (False, None, ["1", "2", "3"]),
+        (True, None, ["3", "2", "1"]),
+        (False, 2, ["1", "2"]),
+        (True, 2, ["3", "2"]),
+    ],
+)
+async def test_state_changes_during_period_for_entities(
+    hass: HomeAssistant,
+    descending: bool,
+    limit: int | None,
+    expected_values: list[str],
+) -> None:
+    """Test state changes of multiple entities during a period."""
+    start = dt_util.utcnow()
+    entity_ids = ["sensor.one", "sensor.two", "sensor.three"]
+
+    with freeze_time(start) as freezer:
+        hass.states.async_set("sensor.two", "before")
+        for value in ("1", "2", "3"):
+            freezer.tick(timedelta(seconds=1))
+            for entity_id in entity_ids[:2]:
+                hass.states.async_set(entity_id, value, {"value": value})
+            # Attribute changes are not state changes
+            freezer.tick(timedelta(milliseconds=100))
+            hass.states.async_set("sensor.one", value, {"value": "changed"})
+    await async_wait_recording_done(hass)
+
+    hist = history.state_changes_during_period_for_entities(
+        hass,
+        start + timedelta(microseconds=1),
+        [*entity_ids, "Sensor.Missing"],
+        descending=descending,
+        limit=limit,
+        include_start_time_state=False,
+    )
+    assert list(hist) == ["sensor.one", "sensor.two"]
+    for entity_id in ("sensor.one", "sensor.two"):
+        assert [state.state for state in hist[entity_id]] == expected_values
+        assert [state.attributes for state in hist[entity_id]] == [
+            {"value": value} for value in expected_values
+        ]
+
+    start_time = start + timedelta(seconds=1, microseconds=1)
+    hist = history.state_changes_during_period_for_entities(
+        hass, start_time, entity_ids, no_attributes=True, limit=1
+    )
+    for entity_id in ("sensor.one", "sensor.two"):
+        assert [state.state for state in hist[entity_id]] == ["1", "2"]
+        assert hist[entity_id][0].last_updated == start_time
+        assert hist[entity_id][1].attributes == {}
+
+
+async def test_state_changes_during_window_batched(hass: HomeAssistant) -> None:
+    """Test the state changes of entities requested together are fetched at once."""
+    for value in ("1", "2"):
+        hass.states.async_set("sensor.one", value)
+        hass.states.async_set("sensor.two", value)
+    await async_wait_recording_done(hass)
+
+    with patch.object(
+        history,
+        "state_changes_during_period_for_entities",
+        wraps=history.state_changes_during_period_for_entities,
+    ) as state_changes_mock:
+        one, two, one_again = await asyncio.gather(
+            async_state_changes_during_window(
+                hass, "sensor.one", timedelta(hours=1), limit=1, descending=True
+            ),
+            async_state_changes_during_window(
+                hass, "sensor.two", timedelta(hours=1), limit=1, descending=True
+            ),
+            async_state_changes_during_window(
+                hass, "sensor.one", timedelta(hours=1), limit=1, descending=True
+            ),
+        )
+    assert [state.state for state in one] == ["2"]
+    assert [state.state for state in two] == ["2"]
+    assert one_again == one
+    assert len(state_changes_mock.mock_calls) == 1
+    assert state_changes_mock.mock_calls[0].args[2] == ["sensor.one", "sensor.two"]
+
+    with patch.object(
+        history,
+        "state_changes_during_period_for_entities",
+        side_effect=ValueError("boom"),
+    ):
+        results = await asyncio.gather(
+            async_state_changes_during_window(hass, "sensor.one", None),
+            async_state_changes_during_window(hass, "sensor.two", None),
+            return_exceptions=True,
+        )
+    assert [str(result) for result in results] == ["boom", "boom"]
+    assert await async_state_changes_during_window(hass, "sensor.missing", None) == []
+
+
 @pytest.mark.freeze_time("2039-01-19 03:14:07.555555-00:00")
 async def test_get_full_significant_states_past_year_2038(
     hass: HomeAssistant,
@@ -0,0 +1,81 @@
+"""Test the sliding window of the statistics sensor."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import math
+import statistics
+
+import pytest
+
+from homeassistant.components.statistics.window import SampleWindow
+from homeassistant.util import dt as dt_util
+
+START = datetime(2024, 1, 1, tzinfo=dt_util.UTC)
+
+VALUES = [17.0, 20.0, 15.3, 17.0, -0.1, 1e20, 20.0, 0.0153, 15.3, -3.5, 8.25, 20.0]
+
+
+def _assert_matches_full_scan(window: SampleWindow) -> None:
+    """Assert the window matches calculating the statistics from all samples."""
+    states = list(window.states)
+    ages = list(window.ages)
+    assert window.sum == math.fsum(states)
+    assert window.mean == statistics.mean(states)
+    assert window.median == statistics.median(states)
+    assert window.value_max == (max(states), ages[states.index(max(states))])
+    assert window.value_min == (min(states), ages[states.index(min(states))])
+    if len(states) < 2:
+        return
+    assert window.variance == statistics.variance(states)
+    assert window.standard_deviation == pytest.approx(statistics.stdev(states))
+    percentiles = statistics.quantiles(states, n=100, method="exclusive")
+    for percentile in (1, 10, 50, 95, 99):
+        assert window.percentile(percentile) == percentiles[percentile - 1]
+    pairs = list(zip(states, states[1:], strict=False))
+    assert window.sum_differences == math.fsum(abs(j - i) for i, j in pairs)
+    assert window.sum_nonnegative_differences == math.fsum(
+        j - i if j >= i else j for i, j in pairs
+    )
+
+
+def test_sample_window() -> None:
+    """Test the statistics follow samples being added and removed."""
+    window = SampleWindow(5)
+    for idx, value in enumerate(VALUES):
+        window.append(value, START + timedelta(seconds=idx))
+        assert len(window) == min(idx + 1, 5)
+        _assert_matches_full_scan(window)
+
+    while len(window) > 1:
+        window.popleft()
+        _assert_matches_full_scan(window)
+
+
+def test_sample_window_non_finite() -> None:
+    """Test the statistics are calculated from all samples with non finite values."""
+    window = SampleWindow(3)
+    window.append(1.0, START)
+    window.append(math.inf, START + timedelta(seconds=1))
+    assert window.sum == math.inf
+    assert window.value_max == (math.inf, START + timedelta(seconds=1))
+
+    window.append(2.0, START + timedelta(seconds=2))
+    window.append(3.0, START + timedelta(seconds=3))
+    window.append(4.0, START + timedelta(seconds=4))
+    # The infinite value left the window
+    assert window.sum == 9.0
+    assert window.value_max == (4.0, START + timedelta(seconds=4))
+    assert window.sum_differences == 2.0
+
+
+def test_sample_window_binary() -> None:
+    """Test counting binary samples."""
+    window = SampleWindow(None)
+    for idx, value in enumerate((True, False, True, True)):
+        window.append(value, START + timedelta(seconds=idx))
+    assert window.count_on == 3
+
+    window.popleft()
+    assert window.count_on == 2
+    assert len(window) == 3
@@ -432,6 +432,41 @@ async def test_hls_max_segments(
     await stream.stop()
 
 
+async def test_hls_segment_data_shared_by_viewers(
+    hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
+) -> None:
+    """Test a complete segment is joined once and its parts are views of it."""
+    stream = create_stream(hass, STREAM_SOURCE, {}, dynamic_stream_settings())
+    stream_worker_sync.pause()
+    hls = stream.add_provider(HLS_PROVIDER)
+    segment = Segment(sequence=0, duration=SEGMENT_DURATION)
+    segment.init = INIT_BYTES
+    segment.parts = [
+        Part(duration=SEGMENT_DURATION / 2, has_keyframe=True, data=b"part-0"),
+        Part(duration=SEGMENT_DURATION / 2, has_keyframe=False, data=b"part-1"),
+    ]
+    hls.put(segment)
+    await hass.async_block_till_done()
+
+    hls_client = await hls_stream(stream)
+
+    for _ in range(2):
+        segment_response = await hls_client.get("/segment/0.m4s")
+        assert segment_response.status == HTTPStatus.OK
+        assert await segment_response.read() == b"part-0part-1"
+    assert segment.get_data() is segment.get_data()
+
+    for part_num, part in enumerate(segment.parts):
+        assert isinstance(part.data, memoryview)
+        assert part.data.obj is segment.get_data()
+        part_response = await hls_client.get(f"/segment/0.{part_num}.m4s")
+        assert part_response.status == HTTPStatus.OK
+        assert await part_response.read() == f"part-{part_num}".encode()
+
+    stream_worker_sync.resume()
+    await stream.stop()
+
+
 async def test_hls_playlist_view_discontinuity(
     hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
 ) -> None:
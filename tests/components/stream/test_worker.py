@@ -20,7 +20,7 @@ import logging
 import math
 from pathlib import Path
 import threading
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import av
 import numpy as np
@@ -1028,6 +1028,55 @@ async def test_get_image(hass: HomeAssistant, h264_video, filename) -> None:
     await stream.stop()
 
 
+async def test_get_image_cached(hass: HomeAssistant, h264_video, filename) -> None:
+    """Test images of the same keyframe are cached by size."""
+    await async_setup_component(hass, "stream", {"stream": {}})
+
+    # Since libjpeg-turbo is not installed on the CI runner, we use a mock
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton"
+    ) as mock_turbo_jpeg_singleton:
+        mock_turbo_jpeg_singleton.instance.return_value = mock_turbo_jpeg()
+        stream = create_stream(hass, h264_video, {}, dynamic_stream_settings())
+
+    with patch.object(hass.config, "is_allowed_path", return_value=True):
+        await stream.async_record(filename)
+
+    encode = mock_turbo_jpeg_singleton.instance.return_value.encode
+    # Ignore new keyframes from the worker
+    with patch.object(stream._keyframe_converter, "stash_keyframe_packet"):
+        assert await stream.async_get_image() == EMPTY_8_6_JPEG
+        assert await stream.async_get_image() == EMPTY_8_6_JPEG
+        assert encode.call_count == 1
+
+        # Another size is generated from the same keyframe
+        assert await stream.async_get_image(width=4, height=3) == EMPTY_8_6_JPEG
+        assert await stream.async_get_image(width=4, height=3) == EMPTY_8_6_JPEG
+        assert encode.call_count == 2
+        assert encode.call_args[0][0].shape[:2] == (3, 4)
+
+    await stream.stop()
+
+
+async def test_stash_keyframe_packet_wakes_waiters(hass: HomeAssistant) -> None:
+    """Test a keyframe only wakes up the event loop when a request waits for it."""
+    keyframe_converter = KeyFrameConverter(hass, None, dynamic_stream_settings())
+
+    with patch.object(hass.loop, "call_soon_threadsafe") as mock_call_soon_threadsafe:
+        keyframe_converter.stash_keyframe_packet(Mock())
+    mock_call_soon_threadsafe.assert_not_called()
+
+    next_keyframe_request = hass.async_create_task(
+        keyframe_converter.async_get_image(wait_for_next_keyframe=True)
+    )
+    await asyncio.sleep(0)
+    assert not next_keyframe_request.done()
+    await hass.async_add_executor_job(keyframe_converter.stash_keyframe_packet, Mock())
+    # There is no image since the keyframe is not decoded without a codec context
+    assert await next_keyframe_request is None
+    assert keyframe_converter._keyframe_waiters == 0
+
+
 async def test_worker_disable_ll_hls(hass: HomeAssistant) -> None:
     """Test that the worker disables ll-hls for hls inputs."""
     stream_settings = StreamSettings(
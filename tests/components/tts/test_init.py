@@ -2,6 +2,7 @@
 
 import asyncio
 from http import HTTPStatus
+import os
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -1224,6 +1225,53 @@ async def test_load_cache_retrieve_without_mem_cache(
     assert await req.read() == tts_data
 
 
+async def test_mem_cache_evicts_least_recently_used(hass: HomeAssistant) -> None:
+    """Test the memory cache evicts the least recently used voices over budget."""
+    manager = tts.SpeechManager(hass, False, "", 60, mem_cache_max_bytes=8)
+    manager._async_store_to_memcache("first", "first.mp3", b"1234")
+    manager._async_store_to_memcache("second", "second.mp3", b"1234")
+    assert manager._async_get_from_memcache("first")
+
+    manager._async_store_to_memcache("third", "third.mp3", b"1234")
+    assert list(manager.mem_cache) == ["first", "third"]
+    assert manager._async_get_from_memcache("second") is None
+    assert manager.mem_cache_stats == tts.TTSCacheStats(hits=1, misses=1, evictions=1)
+
+    # A voice larger than the budget is kept until another voice is stored
+    manager._async_store_to_memcache("large", "large.mp3", b"123456789")
+    assert list(manager.mem_cache) == ["large"]
+
+
+async def test_file_cache_evicts_least_recently_used(
+    hass: HomeAssistant, mock_tts_cache_dir: Path
+) -> None:
+    """Test the file cache removes the least recently used files over budget."""
+    files = [
+        mock_tts_cache_dir / f"{cache_key}_en_-_test.mp3"
+        for cache_key in ("1" * 40, "2" * 40, "3" * 40)
+    ]
+    for mtime, cache_file in enumerate(files):
+        cache_file.write_bytes(b"1234")
+        os.utime(cache_file, (mtime, mtime))
+
+    manager = tts.SpeechManager(
+        hass, True, str(mock_tts_cache_dir), 60, file_cache_max_bytes=8
+    )
+    await manager.async_init_cache()
+    assert not files[0].exists()
+    assert files[1].exists()
+    assert files[2].exists()
+
+    assert manager._async_get_from_file_cache(f"{'2' * 40}_en_-_test")
+    await manager._async_save_tts_audio(
+        f"{'4' * 40}_en_-_test", f"{'4' * 40}_en_-_test.mp3", b"1234"
+    )
+    assert files[1].exists()
+    assert not files[2].exists()
+    assert (mock_tts_cache_dir / f"{'4' * 40}_en_-_test.mp3").exists()
+    assert manager.file_cache_stats == tts.TTSCacheStats(hits=1, misses=0, evictions=2)
+
+
 @pytest.mark.parametrize(
     ("setup", "data", "expected_url_suffix"),
     [
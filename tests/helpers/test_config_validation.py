@@ -558,6 +558,96 @@ def test_entity_service_schema_with_metadata() -> None:
         assert "metadata" in validated
 
 
+@pytest.mark.parametrize(
+    "schema",
+    [
+        cv.make_entity_service_schema({}),
+        cv.make_entity_service_schema(
+            {vol.Required("required"): cv.positive_int, "optional": cv.string}
+        ),
+        cv.make_entity_service_schema({}, extra=vol.ALLOW_EXTRA),
+        cv.make_entity_service_schema({}, extra=vol.REMOVE_EXTRA),
+    ],
+)
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"entity_id": "light.kitchen"},
+        {"entity_id": "Light.Kitchen, light.living_room"},
+        {"entity_id": ["light.kitchen", "LIGHT.BED"]},
+        {"entity_id": []},
+        {"entity_id": "ALL"},
+        {"entity_id": "none"},
+        {"entity_id": "a" * 32},
+        {"area_id": "kitchen", "floor_id": ["first", "second"]},
+        {"device_id": "none", "label_id": "lights"},
+        {"entity_id": "light.kitchen", "metadata": {"some": "frontend_stuff"}},
+        {"entity_id": "light.kitchen", "required": 1, "optional": "value"},
+        {"entity_id": "light.kitchen", "required": "one"},
+        {"entity_id": "light.kitchen", "foo": "bar"},
+        {"entity_id": "light.kitchen", "metadata": None},
+        {"entity_id": "invalid"},
+        {"entity_id": ["light.kitchen", 1]},
+        {"area_id": None},
+        {"area_id": ["kitchen", 1]},
+        {"metadata": {}},
+        {},
+        None,
+    ],
+)
+def test_entity_service_schema_fast_path(schema: vol.All, value: Any) -> None:
+    """Test the entity service schema fast path matches voluptuous validation."""
+    voluptuous_schema = vol.All(*schema.validators)
+    expected_error: str | None = None
+    try:
+        expected = voluptuous_schema(value)
+    except vol.Invalid as err:
+        expected_error = str(err)
+
+    if expected_error is None:
+        assert schema(value) == expected
+    else:
+        with pytest.raises(vol.Invalid, match=f"^{re.escape(expected_error)}$"):
+            schema(value)
+
+
+@pytest.mark.parametrize(
+    "target",
+    [
+        {"entity_id": "light.kitchen"},
+        {"entity_id": ["light.kitchen", "a" * 32], "area_id": "kitchen"},
+        {"floor_id": ["first"], "label_id": "none"},
+        {},
+        {"entity_id": "invalid"},
+        {"foo": "bar"},
+    ],
+)
+def test_service_schema_static_target(target: dict[str, Any]) -> None:
+    """Test the fast path for static service action targets."""
+    value = {"action": "light.turn_on", "target": target}
+    voluptuous_schema = vol.Schema(vol.Any(cv.TARGET_SERVICE_FIELDS))
+    try:
+        expected = voluptuous_schema(target)
+    except vol.Invalid:
+        with pytest.raises(vol.Invalid):
+            cv.SERVICE_SCHEMA(value)
+    else:
+        assert cv.SERVICE_SCHEMA(value)["target"] == expected
+
+
+async def test_service_schema_template_target(hass: HomeAssistant) -> None:
+    """Test service action targets with templates use the full schema."""
+    validated = cv.SERVICE_SCHEMA(
+        {"action": "light.turn_on", "target": {"area_id": "{{ area }}"}}
+    )
+    assert isinstance(validated["target"]["area_id"][0], template.Template)
+
+    validated = cv.SERVICE_SCHEMA(
+        {"action": "light.turn_on", "target": "{{ targets }}"}
+    )
+    assert isinstance(validated["target"], template.Template)
+
+
 def test_slug() -> None:
     """Test slug validation."""
     schema = vol.Schema(cv.slug)
@@ -21,6 +21,7 @@ from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
     ATTR_FRIENDLY_NAME,
+    ATTR_ICON,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     EntityCategory,
@@ -903,6 +904,60 @@ async def test_float_conversion(hass: HomeAssistant) -> None:
     assert state.state == "3.6"
 
 
+async def test_state_change_tracking(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test writing an unchanged state only reports it again."""
+
+    class TrackingEntity(entity.Entity):
+        """Entity tracking changes of its _attr_ attributes."""
+
+        _state_change_tracking = True
+        _attr_should_poll = False
+
+    ent = TrackingEntity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent._attr_state = "1"
+    ent._attr_icon = "mdi:one"
+    ent.async_write_ha_state()
+    first = hass.states.get("hello.world")
+    assert first.state == "1"
+    assert first.attributes[ATTR_ICON] == "mdi:one"
+
+    with patch.object(
+        ent, "_stringify_state", wraps=ent._stringify_state
+    ) as mock_stringify:
+        freezer.tick(1)
+        ent._attr_state = "1"
+        ent.async_write_ha_state()
+        assert not mock_stringify.called
+        # The state is reported again
+        assert hass.states.get("hello.world") is first
+        assert first.last_reported_timestamp == first.last_updated_timestamp + 1
+
+        ent._attr_icon = "mdi:two"
+        ent.async_write_ha_state()
+        assert mock_stringify.call_count == 1
+        assert hass.states.get("hello.world").attributes[ATTR_ICON] == "mdi:two"
+
+        ent._attr_state = "2"
+        ent.async_write_ha_state()
+        assert mock_stringify.call_count == 2
+        assert hass.states.get("hello.world").state == "2"
+
+        # A state set by someone else is overwritten again
+        hass.states.async_set("hello.world", "other")
+        ent.async_write_ha_state()
+        assert mock_stringify.call_count == 3
+        assert hass.states.get("hello.world").state == "2"
+
+        # A recently set context is passed on
+        ent.async_set_context(Context())
+        ent.async_write_ha_state()
+        assert mock_stringify.call_count == 4
+
+
 async def test_attribution_attribute(hass: HomeAssistant) -> None:
     """Test attribution attribute."""
     mock_entity = entity.Entity()
@@ -26,6 +26,7 @@ from homeassistant.exceptions import HomeAssistantError, PlatformNotReady
 from homeassistant.helpers import config_validation as cv, discovery
 from homeassistant.helpers.entity_component import EntityComponent, async_update_entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.polling import async_get_polling_scheduler
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
@@ -138,14 +139,17 @@ async def test_set_scan_interval_via_config(hass: HomeAssistant) -> None:
 
     component = EntityComponent(_LOGGER, DOMAIN, hass)
 
-    with patch.object(hass.loop, "call_later") as mock_track:
+    with patch.object(hass.loop, "call_at") as mock_track:
         component.setup(
             {DOMAIN: {"platform": "platform", "scan_interval": timedelta(seconds=30)}}
         )
 
         await hass.async_block_till_done()
     assert mock_track.called
-    assert mock_track.call_args[0][0] == 30.0
+    assert [
+        stats["interval"]
+        for stats in async_get_polling_scheduler(hass).async_get_stats()
+    ] == [30.0]
 
 
 async def test_set_entity_namespace_via_config(hass: HomeAssistant) -> None:
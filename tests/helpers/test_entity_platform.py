@@ -7,6 +7,7 @@ import logging
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 from syrupy.assertion import SnapshotAssertion
 import voluptuous as vol
@@ -14,7 +15,9 @@ import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, PERCENTAGE, EntityCategory
 from homeassistant.core import (
+    Context,
     CoreState,
+    EntityServiceResponse,
     HomeAssistant,
     ServiceCall,
     ServiceResponse,
@@ -37,6 +40,7 @@ from homeassistant.helpers.entity_component import (
     EntityComponent,
 )
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.polling import async_get_polling_scheduler
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 import homeassistant.util.dt as dt_util
 
@@ -79,6 +83,24 @@ async def test_polling_only_updates_entities_it_should_poll(
     assert poll_ent.async_update.called
 
 
+async def test_polling_records_latency(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the latency of a poll is measured from the time it was due."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    await component.async_setup({})
+    await component.async_add_entities([MockEntity(should_poll=True)])
+
+    freezer.tick(timedelta(seconds=30))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    (stats,) = async_get_polling_scheduler(hass).async_get_stats()
+    assert stats["refresh_latency"]["count"] == 1
+    # The poll was due at least 10 seconds before the time was moved forward
+    assert stats["refresh_latency"]["sum"] >= 10
+
+
 async def test_polling_check_works_if_entity_add_fails(
     hass: HomeAssistant,
 ) -> None:
@@ -236,12 +258,15 @@ async def test_set_scan_interval_via_platform(hass: HomeAssistant) -> None:
 
     component = EntityComponent(_LOGGER, DOMAIN, hass)
 
-    with patch.object(hass.loop, "call_later") as mock_track:
+    with patch.object(hass.loop, "call_at") as mock_track:
         await component.async_setup({DOMAIN: {"platform": "platform"}})
 
         await hass.async_block_till_done()
     assert mock_track.called
-    assert mock_track.call_args[0][0] == 30.0
+    assert [
+        stats["interval"]
+        for stats in async_get_polling_scheduler(hass).async_get_stats()
+    ] == [30.0]
 
 
 async def test_adding_entities_with_generator_and_thread_callback(
@@ -1580,6 +1605,112 @@ async def test_platforms_sharing_services(hass: HomeAssistant) -> None:
     assert entity2 in entities
 
 
+async def test_entity_service_batch_handler(hass: HomeAssistant) -> None:
+    """Test a platform can handle an entity service for all its entities at once."""
+    individual_calls = []
+
+    class HelloEntity(MockEntity):
+        """Mock entity with a service method."""
+
+        async def async_hello(self, some: str) -> ServiceResponse:
+            individual_calls.append((self.entity_id, some))
+            return {"individual": some}
+
+    context = Context()
+    batched_platform = MockEntityPlatform(
+        hass, domain="mock_integration", platform_name="mock_platform", platform=None
+    )
+    batched_entities = [
+        HelloEntity(entity_id=f"mock_integration.batched_{idx}") for idx in range(3)
+    ]
+    await batched_platform.async_add_entities(batched_entities)
+    other_platform = MockEntityPlatform(
+        hass, domain="mock_integration", platform_name="mock_platform", platform=None
+    )
+    other_entity = HelloEntity(entity_id="mock_integration.other")
+    await other_platform.async_add_entities([other_entity])
+
+    batch_calls = []
+    contexts = []
+
+    async def handle_batch(
+        entities: list[Entity], data: dict[str, Any]
+    ) -> EntityServiceResponse:
+        contexts.extend(entity._context for entity in entities)
+        batch_calls.append(([entity.entity_id for entity in entities], data))
+        return {entities[0].entity_id: {"batched": data["some"]}}
+
+    batched_platform.async_register_entity_service_batch_handler(
+        "async_hello", handle_batch
+    )
+    batched_platform.async_register_entity_service(
+        "hello",
+        {"some": str},
+        "async_hello",
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    response_data = await hass.services.async_call(
+        "mock_platform",
+        "hello",
+        {"entity_id": "all", "some": "data"},
+        blocking=True,
+        context=context,
+        return_response=True,
+    )
+
+    assert batch_calls == [
+        (
+            [
+                "mock_integration.batched_0",
+                "mock_integration.batched_1",
+                "mock_integration.batched_2",
+            ],
+            {"some": "data"},
+        )
+    ]
+    assert individual_calls == [("mock_integration.other", "data")]
+    assert contexts == [context] * 3
+    assert response_data == {
+        "mock_integration.batched_0": {"batched": "data"},
+        "mock_integration.batched_1": None,
+        "mock_integration.batched_2": None,
+        "mock_integration.other": {"individual": "data"},
+    }
+
+    # A single targeted entity of a batched platform also uses the batch handler
+    await hass.services.async_call(
+        "mock_platform",
+        "hello",
+        {"entity_id": "mock_integration.batched_1", "some": "single"},
+        blocking=True,
+    )
+    assert batch_calls[-1] == (["mock_integration.batched_1"], {"some": "single"})
+    assert len(individual_calls) == 1
+
+
+async def test_set_parallel_updates(hass: HomeAssistant) -> None:
+    """Test a platform can override PARALLEL_UPDATES before adding entities."""
+    platform = MockPlatform()
+    platform.PARALLEL_UPDATES = 2
+    entity_platform = MockEntityPlatform(
+        hass,
+        domain="mock_integration",
+        platform_name="mock_platform",
+        platform=platform,
+    )
+
+    entity_platform.async_set_parallel_updates(5)
+    entity = MockEntity(entity_id="mock_integration.entity")
+    await entity_platform.async_add_entities([entity])
+
+    assert entity.parallel_updates is not None
+    assert entity.parallel_updates._value == 5
+
+    with pytest.raises(HomeAssistantError, match="before entities are added"):
+        entity_platform.async_set_parallel_updates(1)
+
+
 async def test_register_entity_service_response_data(hass: HomeAssistant) -> None:
     """Test an entity service that does supports response data."""
 
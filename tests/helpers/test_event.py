@@ -4,6 +4,7 @@ import asyncio
 from collections.abc import Callable
 import contextlib
 from datetime import date, datetime, timedelta
+from functools import partial
 from unittest.mock import patch
 
 from astral import LocationInfo
@@ -23,6 +24,7 @@ from homeassistant.core import (
     callback,
 )
 from homeassistant.exceptions import TemplateError
+from homeassistant.helpers import event
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
@@ -3593,7 +3595,7 @@ async def test_track_time_interval_name(hass: HomeAssistant) -> None:
     """Test tracking time interval name.
 
     This test is to ensure that when a name is passed to async_track_time_interval,
-    that the name can be found in the TimerHandle when stringified.
+    that the name can be found in the scheduled tracker when stringified.
     """
     specific_runs = []
     unique_string = "xZ13"
@@ -3604,11 +3606,11 @@ async def test_track_time_interval_name(hass: HomeAssistant) -> None:
         timedelta(seconds=10),
         name=unique_string,
     )
-    scheduled = getattr(hass.loop, "_scheduled")
-    assert any(handle for handle in scheduled if unique_string in str(handle))
+    wheel = hass.data[event._TIMER_WHEELS][False]
+    assert any(unique_string in str(entry) for entry in wheel.async_entries())
     unsub()
 
-    assert all(handle for handle in scheduled if unique_string not in str(handle))
+    assert all(unique_string not in str(entry) for entry in wheel.async_entries())
     await hass.async_block_till_done()
 
 
@@ -4978,3 +4980,146 @@ async def test_async_track_template_result_no_hass_deprecated(
     )
     assert message not in caplog.text
     caplog.clear()
+
+
+async def test_time_trackers_share_timer_handle(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test time trackers due in the same tick share one loop wakeup."""
+    runs: list[str] = []
+    now = dt_util.utcnow()
+    freezer.move_to(datetime(now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC))
+    point_in_time = datetime(now.year + 1, 5, 24, 12, 0, 0, tzinfo=dt_util.UTC)
+
+    def _active_handles() -> int:
+        return sum(
+            not handle.cancelled() for handle in getattr(hass.loop, "_scheduled")
+        )
+
+    @callback
+    def _action(idx: int, _: datetime) -> None:
+        runs.append(f"point {idx}")
+        if idx == 1:
+            # Cancelling a tracker due in the same tick prevents it from running
+            unsubs[3]()
+
+    handles_before = _active_handles()
+    unsubs = [
+        async_track_point_in_utc_time(hass, partial(_action, idx), point_in_time)
+        for idx in range(4)
+    ]
+    assert _active_handles() == handles_before + 1
+    unsub_later = async_track_point_in_utc_time(
+        hass,
+        callback(lambda _: runs.append("later")),
+        point_in_time + timedelta(seconds=1),
+    )
+    assert _active_handles() == handles_before + 2
+
+    unsubs[0]()
+    assert _active_handles() == handles_before + 2
+    unsub_later()
+    assert _active_handles() == handles_before + 1
+
+    async_fire_time_changed(hass, point_in_time)
+    await hass.async_block_till_done()
+    assert runs == ["point 1", "point 2"]
+
+    # Cancelling a tracker that already fired is a no-op
+    unsubs[1]()
+
+
+async def test_async_get_scheduled_timer_counts(hass: HomeAssistant) -> None:
+    """Test reporting scheduled time trackers per integration."""
+
+    @callback
+    def _action(_: datetime) -> None:
+        """Do nothing."""
+
+    @callback
+    def _custom_action(_: datetime) -> None:
+        """Do nothing."""
+
+    _action.__module__ = "homeassistant.components.demo.sensor"
+    _custom_action.__module__ = "custom_components.my_custom.sensor"
+    unsubs = [
+        async_track_time_interval(hass, _action, timedelta(seconds=10)),
+        async_track_time_interval(
+            hass, _action, timedelta(seconds=30), cancel_on_shutdown=True
+        ),
+        async_track_utc_time_change(hass, _action, second=10),
+        async_track_point_in_utc_time(
+            hass, _custom_action, dt_util.utcnow() + timedelta(hours=1)
+        ),
+    ]
+    counts = event.async_get_scheduled_timer_counts(hass)
+    assert counts["demo"] == 3
+    assert counts["my_custom"] == 1
+
+    for unsub in unsubs:
+        unsub()
+    counts = event.async_get_scheduled_timer_counts(hass)
+    assert "demo" not in counts
+    assert "my_custom" not in counts
+
+
+async def test_time_change_next_fire_cache(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test trackers sharing a time expression reuse the next fire time."""
+    runs: list[datetime] = []
+    now = dt_util.utcnow()
+    freezer.move_to(datetime(now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC))
+
+    with patch(
+        "homeassistant.helpers.event.dt_util.find_next_time_expression_time",
+        wraps=dt_util.find_next_time_expression_time,
+    ) as mock_find_next:
+        unsubs = [
+            async_track_utc_time_change(
+                hass, callback(lambda x: runs.append(x)), minute="/5", second=0
+            )
+            for _ in range(3)
+        ]
+        assert mock_find_next.call_count == 1
+
+        async_fire_time_changed(
+            hass, datetime(now.year + 1, 5, 24, 12, 0, 0, tzinfo=dt_util.UTC)
+        )
+        await hass.async_block_till_done()
+        assert len(runs) == 3
+        assert mock_find_next.call_count == 2
+
+        async_fire_time_changed(
+            hass, datetime(now.year + 1, 5, 24, 12, 5, 0, tzinfo=dt_util.UTC)
+        )
+        await hass.async_block_till_done()
+        assert len(runs) == 6
+        assert mock_find_next.call_count == 3
+
+    for unsub in unsubs:
+        unsub()
+
+
+async def test_time_change_next_fire_cache_dst_fall_back(hass: HomeAssistant) -> None:
+    """Test the next fire time cache is not reused for the repeated DST hour."""
+    tz = dt_util.get_time_zone("America/New_York")
+    expression = (
+        dt_util.parse_time_expression(0, 0, 59),
+        dt_util.parse_time_expression("/15", 0, 59),
+        dt_util.parse_time_expression("*", 0, 23),
+    )
+    key = tuple(map(tuple, expression))
+
+    first = event._async_find_next_time_expression_time(
+        hass, key, expression, datetime(2024, 11, 3, 1, 20, tzinfo=tz)
+    )
+    assert first == datetime(2024, 11, 3, 1, 30, tzinfo=tz)
+    assert first.utcoffset() == timedelta(hours=-4)
+
+    # 01:25 EST comes after 01:30 EDT, the cached time has already passed
+    now = datetime(2024, 11, 3, 1, 25, fold=1, tzinfo=tz)
+    result = event._async_find_next_time_expression_time(hass, key, expression, now)
+    assert result.timestamp() > now.timestamp()
+    assert result == datetime(2024, 11, 3, 1, 30, fold=1, tzinfo=tz)
+    assert result.utcoffset() == timedelta(hours=-5)
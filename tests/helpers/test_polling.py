@@ -0,0 +1,135 @@
+"""Tests for the polling scheduler."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import polling
+
+
+async def test_phases_spread_evenly(hass: HomeAssistant) -> None:
+    """Test pollers sharing an interval get evenly spread phases."""
+    scheduler = polling.async_get_polling_scheduler(hass)
+    offset = polling._interval_offset(60) * 60
+    registrations = [scheduler.async_register(f"poller {idx}", 60) for idx in range(4)]
+    assert [registration.phase for registration in registrations] == pytest.approx(
+        [(offset + phase) % 60 for phase in (0.0, 30.0, 15.0, 45.0)]
+    )
+
+    # Other intervals get their own phases
+    assert scheduler.async_register("other", 30).phase == pytest.approx(
+        polling._interval_offset(30) * 30
+    )
+
+    # Released phases are handed out again
+    registrations[1].async_unregister()
+    registrations[1].async_unregister()
+    assert scheduler.async_register("replacement", 60).phase == pytest.approx(
+        (offset + 30.0) % 60
+    )
+    assert scheduler.async_register("new", 60).phase == pytest.approx(
+        (offset + 7.5) % 60
+    )
+
+
+async def test_interval_offsets_differ(hass: HomeAssistant) -> None:
+    """Test the first pollers of different intervals do not share a phase."""
+    scheduler = polling.async_get_polling_scheduler(hass)
+    fractions = {
+        scheduler.async_register(f"poller {interval}", interval).phase / interval
+        for interval in (10, 30, 60, 300)
+    }
+    assert len(fractions) == 4
+
+
+async def test_shared_phase_key(hass: HomeAssistant) -> None:
+    """Test pollers with the same phase key share a phase."""
+    scheduler = polling.async_get_polling_scheduler(hass)
+    with patch.object(polling, "_interval_offset", return_value=0.0):
+        first = scheduler.async_register("first", 60, "endpoint")
+        second = scheduler.async_register("second", 60, "endpoint")
+        other = scheduler.async_register("other", 60)
+        assert first.phase == second.phase == 0.0
+        assert other.phase == 30.0
+
+        # The shared phase is released with its last user
+        first.async_unregister()
+        assert scheduler.async_register("third", 60).phase == 15.0
+        second.async_unregister()
+        assert scheduler.async_register("fourth", 60).phase == 0.0
+
+
+async def test_next_poll(hass: HomeAssistant) -> None:
+    """Test polls converge on their phase while staying about an interval apart."""
+    scheduler = polling.async_get_polling_scheduler(hass)
+    with patch.object(polling, "_interval_offset", return_value=0.0):
+        scheduler.async_register("first", 60)
+        registration = scheduler.async_register("second", 60)
+    assert registration.phase == 30.0
+
+    # The first poll is moved earlier to the phase
+    assert registration.async_next_poll(1000.0) == 1050.0
+    # The poll that is due, even if it fires slightly early, schedules
+    # the next one a full interval later
+    assert registration.async_next_poll(1049.99) == 1110.0
+    assert registration.async_next_poll(1110.5) == 1170.0
+
+    # A manual refresh close to the phase keeps the phase
+    assert registration.async_next_poll(1120.0) == 1170.0
+    # A manual refresh far from the phase delays the next poll, which is never
+    # moved earlier than MAX_PHASE_SHIFT of an interval
+    assert registration.async_next_poll(1150.0) == 1195.0
+    # Later polls converge on the phase again
+    assert registration.async_next_poll(1195.0) == 1240.0
+    assert registration.async_next_poll(1240.0) == 1290.0
+    assert registration.async_next_poll(1290.0) == 1350.0
+
+    # Polling resumed long after the last due poll starts over from now
+    assert registration.async_next_poll(2000.0) == 2045.0
+
+    assert scheduler.async_register("no interval", 0).async_next_poll(1000.0) == (
+        1000.0 + polling.MIN_POLL_DELAY
+    )
+
+
+async def test_concurrency_limit_and_stats(hass: HomeAssistant) -> None:
+    """Test the number of polls in flight is limited and timings are recorded."""
+    scheduler = polling.PollingScheduler(hass, max_concurrent=2)
+    registrations = [scheduler.async_register(f"poller {idx}", 10) for idx in range(3)]
+    release = asyncio.Event()
+    running = 0
+    max_running = 0
+
+    async def _poll() -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await release.wait()
+        running -= 1
+
+    due = hass.loop.time() - 1
+    tasks = [
+        hass.async_create_task(registration.async_run(_poll, due))
+        for registration in registrations
+    ]
+    await asyncio.sleep(0)
+    assert running == 2
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert max_running == 2
+
+    stats = scheduler.async_get_stats()
+    assert [poller["name"] for poller in stats] == ["poller 0", "poller 1", "poller 2"]
+    for poller in stats:
+        assert poller["interval"] == 10
+        assert poller["refresh_duration"]["count"] == 1
+        assert poller["refresh_latency"]["count"] == 1
+        assert sum(poller["refresh_latency"]["buckets"].values()) == 1
+        # The poll was due about one interval before it started
+        assert poller["refresh_latency"]["sum"] > 0.9
+
+    registrations[0].async_unregister()
+    assert len(scheduler.async_get_stats()) == 2
@@ -46,6 +46,7 @@ from homeassistant.setup import async_setup_component
 from homeassistant.util.yaml.loader import parse_yaml
 
 from tests.common import (
+    MockConfigEntry,
     MockEntity,
     MockModule,
     MockUser,
@@ -779,6 +780,65 @@ async def test_extract_entity_ids_from_labels(hass: HomeAssistant) -> None:
     )
 
 
+async def test_extract_referenced_entity_ids_cache(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test targets resolved through the registries are cached."""
+    config_entry = MockConfigEntry(domain="test")
+    config_entry.add_to_hass(hass)
+    area = area_registry.async_create("Kitchen")
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        identifiers={("test", "device")},
+    )
+    device_registry.async_update_device(device.id, area_id=area.id)
+    entity_registry.async_get_or_create(
+        "light", "test", "1", device_id=device.id, suggested_object_id="ceiling"
+    )
+    cache = service.async_get_target_resolution_cache(hass)
+    call = ServiceCall("light", "turn_on", {"area_id": area.id})
+
+    for _ in range(3):
+        selected = service.async_extract_referenced_entity_ids(hass, call)
+        assert selected.indirectly_referenced == {"light.ceiling"}
+        assert selected.referenced_devices == {device.id}
+
+    assert cache.async_diagnostics() == {
+        "size": 1,
+        "hits": 2,
+        "misses": 1,
+        "hit_rate": 2 / 3,
+        "invalidations": 0,
+    }
+
+    # Mutating the result does not change the cache
+    selected.indirectly_referenced.add("light.other")
+    assert service.async_extract_referenced_entity_ids(
+        hass, call
+    ).indirectly_referenced == {"light.ceiling"}
+
+    entity_registry.async_get_or_create(
+        "light", "test", "2", device_id=device.id, suggested_object_id="lamp"
+    )
+    assert cache.invalidations == 1
+    selected = service.async_extract_referenced_entity_ids(hass, call)
+    assert selected.indirectly_referenced == {"light.ceiling", "light.lamp"}
+
+    device_registry.async_update_device(device.id, area_id=None)
+    assert cache.invalidations == 2
+    selected = service.async_extract_referenced_entity_ids(hass, call)
+    assert selected.indirectly_referenced == set()
+    assert selected.missing_areas == set()
+
+    area_registry.async_delete(area.id)
+    assert cache.invalidations == 3
+    selected = service.async_extract_referenced_entity_ids(hass, call)
+    assert selected.missing_areas == {area.id}
+
+
 async def test_async_get_all_descriptions(hass: HomeAssistant) -> None:
     """Test async_get_all_descriptions."""
     group_config = {DOMAIN_GROUP: {}}
@@ -1,5 +1,6 @@
 """Tests for the update coordinator."""
 
+import asyncio
 from datetime import datetime, timedelta
 import logging
 from unittest.mock import AsyncMock, Mock, patch
@@ -18,7 +19,7 @@ from homeassistant.exceptions import (
     ConfigEntryError,
     ConfigEntryNotReady,
 )
-from homeassistant.helpers import update_coordinator
+from homeassistant.helpers import polling, update_coordinator
 from homeassistant.util.dt import utcnow
 
 from tests.common import MockConfigEntry, async_fire_time_changed
@@ -897,3 +898,196 @@ async def test_config_entry(hass: HomeAssistant) -> None:
         hass, _LOGGER, name="test", config_entry=another_entry
     )
     assert crd.config_entry is another_entry
+
+
+async def test_refresh_phases_spread(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test coordinators sharing an update interval poll on different phases."""
+    crds = [get_crd(hass, DEFAULT_UPDATE_INTERVAL) for _ in range(2)]
+    unsubs = [crd.async_add_listener(Mock()) for crd in crds]
+    scheduler = polling.async_get_polling_scheduler(hass)
+    offset = polling._interval_offset(10) * 10
+    assert [stats["phase"] for stats in scheduler.async_get_stats()] == pytest.approx(
+        [offset, (offset + 5.0) % 10]
+    )
+
+    freezer.tick(DEFAULT_UPDATE_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert [crd.data for crd in crds] == [1, 1]
+
+    stats = scheduler.async_get_stats()
+    assert [poller["refresh_duration"]["count"] for poller in stats] == [1, 1]
+    assert [poller["refresh_latency"]["count"] for poller in stats] == [1, 1]
+
+    # Changing the update interval moves the coordinator to a new phase
+    crds[1].update_interval = timedelta(seconds=30)
+    freezer.tick(DEFAULT_UPDATE_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert [crd.data for crd in crds] == [2, 2]
+    assert [
+        (stats["interval"], stats["phase"]) for stats in scheduler.async_get_stats()
+    ] == pytest.approx([(10.0, offset), (30.0, polling._interval_offset(30) * 30)])
+
+    for unsub in unsubs:
+        unsub()
+    assert scheduler.async_get_stats() == []
+
+
+async def test_manual_refresh_delays_next_poll(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a manual refresh is not followed shortly by a scheduled one."""
+    crd = get_crd(hass, DEFAULT_UPDATE_INTERVAL)
+    unsub = crd.async_add_listener(Mock())
+    registration = crd._poll_registration
+    assert registration is not None
+    interval = DEFAULT_UPDATE_INTERVAL.total_seconds()
+    min_gap = interval * (1 - polling.MAX_PHASE_SHIFT)
+
+    for _ in range(10):
+        freezer.tick(timedelta(seconds=1.3))
+        await crd.async_refresh()
+        assert registration.next_poll - hass.loop.time() >= min_gap
+
+    unsub()
+
+
+async def test_group_coalesces_fetches(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test coordinators in a group share one upstream fetch."""
+    fetch = AsyncMock(side_effect=[1, 2])
+    group = update_coordinator.async_get_coordinator_group(
+        hass, _LOGGER, identity="endpoint", fetch_method=fetch
+    )
+    assert (
+        update_coordinator.async_get_coordinator_group(
+            hass, _LOGGER, identity="endpoint", fetch_method=AsyncMock()
+        )
+        is group
+    )
+    crds = [
+        update_coordinator.DataUpdateCoordinator[int](
+            hass,
+            _LOGGER,
+            name=f"Test {idx}",
+            update_interval=DEFAULT_UPDATE_INTERVAL,
+            group=group,
+        )
+        for idx in range(2)
+    ]
+    unsubs = [crd.async_add_listener(Mock()) for crd in crds]
+
+    # Members share a polling phase
+    scheduler = polling.async_get_polling_scheduler(hass)
+    phases = [stats["phase"] for stats in scheduler.async_get_stats()]
+    assert phases[0] == phases[1]
+
+    # The result of a fetch is fanned out to the other members
+    await crds[0].async_refresh()
+    await hass.async_block_till_done()
+    assert fetch.call_count == 1
+    assert [crd.data for crd in crds] == [1, 1]
+
+    # Refreshes within the coalesce window are served by the same fetch
+    await crds[1].async_refresh()
+    assert fetch.call_count == 1
+
+    freezer.tick(update_coordinator.REQUEST_COALESCE_DEFAULT_WINDOW)
+    await crds[1].async_refresh()
+    await hass.async_block_till_done()
+    assert fetch.call_count == 2
+    assert [crd.data for crd in crds] == [2, 2]
+
+    for unsub in unsubs:
+        unsub()
+    for crd in crds:
+        await crd.async_shutdown()
+    assert hass.data[update_coordinator.DATA_COORDINATOR_GROUPS] == {}
+
+
+async def test_group_fan_out_without_coalesce_window(hass: HomeAssistant) -> None:
+    """Test pushing a fetch to the other members does not fetch again."""
+    calls = 0
+
+    async def fetch() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    group = update_coordinator.DataUpdateCoordinatorGroup(
+        hass, _LOGGER, identity="endpoint", fetch_method=fetch, coalesce_window=0
+    )
+    crds = [
+        update_coordinator.DataUpdateCoordinator[int](
+            hass, _LOGGER, name=f"Test {idx}", group=group
+        )
+        for idx in range(2)
+    ]
+    unsubs = [crd.async_add_listener(Mock()) for crd in crds]
+
+    await crds[0].async_refresh()
+    await asyncio.sleep(0.1)
+    await hass.async_block_till_done()
+    assert calls == 1
+    assert [crd.data for crd in crds] == [1, 1]
+
+    for unsub in unsubs:
+        unsub()
+    for crd in crds:
+        await crd.async_shutdown()
+
+
+async def test_group_concurrent_fetch_and_shared_debouncer(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test concurrent refreshes and refresh requests of a group are batched."""
+    fetch_started = asyncio.Event()
+    release = asyncio.Event()
+    calls = 0
+
+    async def fetch() -> int:
+        nonlocal calls
+        calls += 1
+        fetch_started.set()
+        await release.wait()
+        return calls
+
+    group = update_coordinator.DataUpdateCoordinatorGroup(
+        hass, _LOGGER, identity="endpoint", fetch_method=fetch
+    )
+    crds = [
+        update_coordinator.DataUpdateCoordinator[int](
+            hass, _LOGGER, name=f"Test {idx}", group=group
+        )
+        for idx in range(3)
+    ]
+
+    tasks = [hass.async_create_task(crd.async_refresh()) for crd in crds[:2]]
+    await fetch_started.wait()
+    release.set()
+    await asyncio.gather(*tasks)
+    assert calls == 1
+    # The member that did not refresh gets the data pushed
+    assert [crd.data for crd in crds] == [1, 1, 1]
+
+    # Refresh requests of all members go through one debouncer
+    freezer.tick(update_coordinator.REQUEST_COALESCE_DEFAULT_WINDOW)
+    for crd in crds:
+        await crd.async_request_refresh()
+    await hass.async_block_till_done()
+    assert calls == 2
+    assert [crd.data for crd in crds] == [2, 2, 2]
+
+    freezer.tick(update_coordinator.REQUEST_REFRESH_DEFAULT_COOLDOWN)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert calls == 3
+    assert [crd.data for crd in crds] == [3, 3, 3]
+
+    for crd in crds:
+        await crd.async_shutdown()
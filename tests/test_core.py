@@ -60,10 +60,11 @@ from homeassistant.exceptions import (
     ServiceNotFound,
     ServiceValidationError,
 )
-from homeassistant.helpers.json import json_dumps
+from homeassistant.helpers.json import json_bytes, json_dumps
 from homeassistant.setup import async_setup_component
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -1011,6 +1012,59 @@ def test_state_as_dict_json() -> None:
     assert state.as_dict_json is as_dict_json_1
 
 
+async def test_state_attributes_json_fragment_shared(hass: HomeAssistant) -> None:
+    """Test unchanged attributes share their JSON fragment with the next state."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    state1 = hass.states.get("light.bowl")
+    fragment = state1.attributes_json_fragment
+    assert state1.as_dict_json == json_bytes(state1.as_dict())
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 100})
+    state2 = hass.states.get("light.bowl")
+    assert state2.attributes is state1.attributes
+    assert state2.attributes_json_fragment is fragment
+    assert json_loads(state2.as_dict_json) == json_loads(json_bytes(state2.as_dict()))
+    assert json_loads(b"{" + state2.as_compressed_state_json + b"}") == {
+        "light.bowl": json_loads(json_bytes(state2.as_compressed_state))
+    }
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 50})
+    state3 = hass.states.get("light.bowl")
+    assert state3.attributes_json_fragment is not fragment
+    assert json_loads(state3.as_dict_json)["attributes"] == {"brightness": 50}
+
+
+async def test_state_datetimes_created_lazily(hass: HomeAssistant) -> None:
+    """Test states created by the state machine only store timestamps."""
+    hass.states.async_set("light.bowl", "on", {}, timestamp=1000.0)
+    hass.states.async_set("light.bowl", "on", {"brightness": 100}, timestamp=2000.0)
+    state = hass.states.get("light.bowl")
+    assert state._last_changed is None
+    assert state._last_updated is None
+    assert state._last_reported is None
+    with pytest.raises(AttributeError):
+        object.__getattribute__(state.context, "_cache")
+    assert state.last_changed_timestamp == 1000.0
+    assert state.last_updated_timestamp == 2000.0
+
+    hass.states.async_set("light.bowl", "on", {"brightness": 100}, timestamp=3000.0)
+    assert hass.states.get("light.bowl") is state
+    assert state.last_reported_timestamp == 3000.0
+    assert state.last_changed == dt_util.utc_from_timestamp(1000.0)
+    assert state.last_updated == dt_util.utc_from_timestamp(2000.0)
+    assert state.last_reported == dt_util.utc_from_timestamp(3000.0)
+    assert state.last_changed is state.last_changed
+    assert state.as_dict()["last_reported"] == state.last_reported.isoformat()
+    assert state.context.as_dict() == {
+        "id": state.context.id,
+        "parent_id": None,
+        "user_id": None,
+    }
+
+    state.last_changed = dt_util.utc_from_timestamp(1500.0)
+    assert state.last_changed_timestamp == 1500.0
+
+
 def test_state_json_fragment() -> None:
     """Test state JSON fragments."""
     last_time = datetime(1984, 12, 8, 12, 0, 0)
@@ -1470,6 +1524,44 @@ async def test_statemachine_entity_ids(hass: HomeAssistant) -> None:
     assert states == ["light.bowl", "switch.ac"]
 
 
+async def test_statemachine_all_for_device_class(hass: HomeAssistant) -> None:
+    """Test async_all_for_device_class method."""
+    assert hass.states.async_all_for_device_class("door") == []
+
+    hass.states.async_set("binary_sensor.front", "on", {"device_class": "door"})
+    hass.states.async_set("binary_sensor.back", "off", {"device_class": "door"})
+    hass.states.async_set("cover.garage", "open", {"device_class": "garage"})
+    hass.states.async_set("sensor.power", "5", {"device_class": "power"})
+    hass.states.async_set("light.bowl", "on", {})
+
+    def _entity_ids(*args: Any) -> list[str]:
+        return sorted(
+            state.entity_id for state in hass.states.async_all_for_device_class(*args)
+        )
+
+    assert _entity_ids("door") == ["binary_sensor.back", "binary_sensor.front"]
+    assert _entity_ids(["door", "garage"]) == [
+        "binary_sensor.back",
+        "binary_sensor.front",
+        "cover.garage",
+    ]
+    assert _entity_ids(["door", "garage"], "COVER") == ["cover.garage"]
+    assert _entity_ids(["door", "power"], ["sensor", "light"]) == ["sensor.power"]
+
+    # The index follows device class changes and keeps the latest state
+    hass.states.async_set("binary_sensor.front", "off", {"device_class": "window"})
+    hass.states.async_set("binary_sensor.back", "on", {"device_class": "door"})
+    assert _entity_ids("window") == ["binary_sensor.front"]
+    assert hass.states.async_all_for_device_class("door") == [
+        hass.states.get("binary_sensor.back")
+    ]
+
+    hass.states.async_set("cover.garage", "open", {})
+    hass.states.async_remove("binary_sensor.back")
+    assert _entity_ids(["door", "garage"]) == []
+    assert _entity_ids("window") == ["binary_sensor.front"]
+
+
 async def test_statemachine_remove(hass: HomeAssistant) -> None:
     """Test remove method."""
     hass.states.async_set("light.bowl", "on", {})
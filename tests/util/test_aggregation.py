@@ -0,0 +1,97 @@
+"""Test Home Assistant incremental aggregation."""
+
+import math
+import statistics
+
+from homeassistant.util.aggregation import NumericAggregate
+
+MEMBERS = ["sensor.a", "sensor.b", "sensor.c", "sensor.d"]
+
+
+def _assert_matches_full_scan(aggregate: NumericAggregate, values: dict) -> None:
+    """Assert the aggregate matches aggregating all values from scratch."""
+    ordered = [(member, values[member]) for member in MEMBERS if member in values]
+    result = [value for _, value in ordered]
+    assert aggregate.values() == result
+    assert len(aggregate) == len(result)
+    if not result:
+        assert aggregate.sum == 0
+        assert aggregate.mean is None
+        assert aggregate.median is None
+        assert aggregate.min is None
+        assert aggregate.max is None
+        assert aggregate.range is None
+        return
+    assert aggregate.sum == math.fsum(result)
+    assert aggregate.mean == statistics.mean(result)
+    assert aggregate.median == statistics.median(result)
+    min_value = min(result)
+    max_value = max(result)
+    assert aggregate.min == next(item for item in ordered if item[1] == min_value)
+    assert aggregate.max == next(item for item in ordered if item[1] == max_value)
+    assert aggregate.range == max_value - min_value
+
+
+def test_numeric_aggregate() -> None:
+    """Test the aggregate follows updates of its members."""
+    aggregate = NumericAggregate(MEMBERS)
+    values: dict[str, float] = {}
+    _assert_matches_full_scan(aggregate, values)
+
+    for member, value in (
+        ("sensor.c", 15.3),
+        ("sensor.a", 17.0),
+        ("sensor.b", 20.0),
+        ("sensor.d", 20.0),
+        ("sensor.c", 0.0153),
+        ("sensor.a", 1e20),
+        ("sensor.a", 17.0),
+        ("sensor.c", 15.3),
+        ("sensor.b", -0.1),
+        ("sensor.d", -0.1),
+    ):
+        aggregate.set(member, value)
+        values[member] = value
+        _assert_matches_full_scan(aggregate, values)
+        assert member in aggregate
+        assert aggregate.get(member) == value
+
+    # The sum is exact, adding and removing a large value leaves no error
+    assert aggregate.sum == math.fsum([17.0, 15.3, -0.1, -0.1])
+
+    for member in ("sensor.b", "sensor.b", "sensor.a"):
+        aggregate.discard(member)
+        values.pop(member, None)
+        _assert_matches_full_scan(aggregate, values)
+        assert member not in aggregate
+        assert aggregate.get(member) is None
+
+    aggregate.clear()
+    _assert_matches_full_scan(aggregate, {})
+
+
+def test_numeric_aggregate_non_finite() -> None:
+    """Test the aggregate with non finite values."""
+    aggregate = NumericAggregate(MEMBERS)
+    aggregate.set("sensor.a", 1.0)
+    aggregate.set("sensor.b", math.inf)
+    assert aggregate.sum == math.inf
+    assert aggregate.mean == math.inf
+    assert aggregate.max == ("sensor.b", math.inf)
+
+    aggregate.set("sensor.c", -math.inf)
+    assert math.isnan(aggregate.sum)
+    assert aggregate.min == ("sensor.c", -math.inf)
+
+    aggregate.discard("sensor.b")
+    aggregate.discard("sensor.c")
+    aggregate.set("sensor.d", math.nan)
+    assert len(aggregate) == 2
+    assert math.isnan(aggregate.sum)
+    assert math.isnan(aggregate.mean)
+    assert math.isnan(aggregate.median)
+    assert aggregate.min == aggregate.max == ("sensor.a", 1.0)
+
+    aggregate.discard("sensor.d")
+    assert aggregate.sum == 1.0
+    assert aggregate.median == 1.0
@@ -8,6 +8,7 @@ import pathlib
 from typing import Any
 from unittest.mock import Mock, patch
 
+from lru import LRU
 import pytest
 import voluptuous as vol
 import yaml as pyyaml
@@ -627,3 +628,149 @@ def test_load_yaml_wrap_oserror(
         pytest.raises(load_yaml_exception),
     ):
         yaml_loader.load_yaml("bla")
+
+
+def _write_yaml(path: pathlib.Path, content: str) -> None:
+    """Write a YAML file with a modification time outside the racy window."""
+    path.write_text(content, encoding="utf-8")
+    mtime = path.stat().st_mtime - 10
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def clean_yaml_cache() -> Generator[None]:
+    """Start and end a test with an empty YAML cache."""
+    yaml_loader.clear_yaml_cache()
+    yield
+    yaml_loader.clear_yaml_cache()
+
+
+@pytest.mark.usefixtures("clean_yaml_cache")
+def test_load_yaml_cache(tmp_path: pathlib.Path) -> None:
+    """Test unchanged files are served from the cache."""
+    config = tmp_path / "configuration.yaml"
+    _write_yaml(config, "key:\n  - one\n  - two\n")
+
+    with patch.object(
+        yaml_loader, "_load_yaml", wraps=yaml_loader._load_yaml
+    ) as mock_load:
+        first = yaml_loader.load_yaml(config)
+        second = yaml_loader.load_yaml(config)
+
+    assert mock_load.call_count == 1
+    assert first == second == {"key": ["one", "two"]}
+    assert second["key"].__line__ == 2
+    assert second["key"].__config_file__ == str(config)
+
+    # Returned trees are copies, mutating one does not change the cache
+    second["key"].append("three")
+    assert yaml_loader.load_yaml(config) == {"key": ["one", "two"]}
+
+    _write_yaml(config, "key: changed\n")
+    assert yaml_loader.load_yaml(config) == {"key": "changed"}
+
+
+@pytest.mark.usefixtures("clean_yaml_cache")
+def test_load_yaml_cache_skips_recently_modified(tmp_path: pathlib.Path) -> None:
+    """Test files modified within the racy window are not cached."""
+    config = tmp_path / "configuration.yaml"
+    config.write_text("key: value\n", encoding="utf-8")
+
+    assert yaml_loader.load_yaml(config) == {"key": "value"}
+    assert str(config) not in yaml_loader._YAML_CACHE
+
+
+@pytest.mark.usefixtures("clean_yaml_cache")
+def test_load_yaml_cache_bounded(tmp_path: pathlib.Path) -> None:
+    """Test the least recently loaded files are evicted from the cache."""
+    files = [tmp_path / f"file_{idx}.yaml" for idx in range(3)]
+    for idx, path in enumerate(files):
+        _write_yaml(path, f"value: {idx}\n")
+
+    with patch.object(yaml_loader, "_YAML_CACHE", LRU(2)):
+        for path in files:
+            yaml_loader.load_yaml(path)
+        assert str(files[0]) not in yaml_loader._YAML_CACHE
+        assert str(files[2]) in yaml_loader._YAML_CACHE
+
+
+@pytest.mark.usefixtures("clean_yaml_cache")
+def test_load_yaml_cache_entry_invalidated_twice(tmp_path: pathlib.Path) -> None:
+    """Test an entry that was already invalidated by another load is reloaded."""
+    config = tmp_path / "configuration.yaml"
+    _write_yaml(config, "key: value\n")
+    assert yaml_loader.load_yaml(config) == {"key": "value"}
+
+    _write_yaml(config, "key: changed\n")
+    stale = yaml_loader._YAML_CACHE[str(config)]
+
+    class _InvalidatedCache(dict):
+        """Cache whose entry was removed by another thread after the lookup."""
+
+        def get(self, key: str, default: Any = None) -> Any:
+            return stale
+
+    with patch.object(yaml_loader, "_YAML_CACHE", _InvalidatedCache()):
+        assert yaml_loader.load_yaml(config) == {"key": "changed"}
+
+
+@pytest.mark.usefixtures("clean_yaml_cache")
+def test_load_yaml_cache_include_dir(tmp_path: pathlib.Path) -> None:
+    """Test only changed files in an included directory are parsed again."""
+    config = tmp_path / "configuration.yaml"
+    packages = tmp_path / "packages"
+    packages.mkdir()
+    _write_yaml(config, "packages: !include_dir_named packages\n")
+    _write_yaml(packages / "one.yaml", "value: 1\n")
+    _write_yaml(packages / "two.yaml", "value: 2\n")
+
+    assert yaml_loader.load_yaml(config) == {
+        "packages": {"one": {"value": 1}, "two": {"value": 2}}
+    }
+
+    _write_yaml(packages / "two.yaml", "value: 22\n")
+    with patch.object(
+        yaml_loader, "_load_yaml", wraps=yaml_loader._load_yaml
+    ) as mock_load:
+        assert yaml_loader.load_yaml(config) == {
+            "packages": {"one": {"value": 1}, "two": {"value": 22}}
+        }
+    assert [str(call.args[0]) for call in mock_load.call_args_list] == [
+        str(config),
+        str(packages / "two.yaml"),
+    ]
+
+    # Adding a file to the directory invalidates the including file
+    _write_yaml(packages / "three.yaml", "value: 3\n")
+    assert yaml_loader.load_yaml(config)["packages"]["three"] == {"value": 3}
+
+
+@pytest.mark.usefixtures("clean_yaml_cache")
+def test_load_yaml_cache_secrets_and_env(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test changed secrets and environment variables invalidate the cache."""
+    config = tmp_path / "configuration.yaml"
+    _write_yaml(config, "password: !secret password\nhost: !env_var TEST_YAML_HOST\n")
+    _write_yaml(tmp_path / yaml.SECRET_YAML, "password: one\n")
+    monkeypatch.setenv("TEST_YAML_HOST", "first")
+
+    assert yaml_loader.load_yaml(config, yaml.Secrets(tmp_path)) == {
+        "password": "one",
+        "host": "first",
+    }
+
+    monkeypatch.setenv("TEST_YAML_HOST", "second")
+    assert yaml_loader.load_yaml(config, yaml.Secrets(tmp_path)) == {
+        "password": "one",
+        "host": "second",
+    }
+
+    _write_yaml(tmp_path / yaml.SECRET_YAML, "password: two\n")
+    assert yaml_loader.load_yaml(config, yaml.Secrets(tmp_path)) == {
+        "password": "two",
+        "host": "second",
+    }
+
+    with pytest.raises(HomeAssistantError, match="Secrets not supported"):
+        yaml_loader.load_yaml(config)